@@ -0,0 +1,87 @@
+"""
+Benchmark memory retained per event in the EventStore.
+
+Compares, for PolicyDecision:
+- dict:      frozen dataclass with a per-instance __dict__ (old layout)
+- slotted:   current slotted layout, one object per event
+- traced:    slotted, with tracing on (each event carries a Trace)
+- interned:  intern_event(), as published by the handlers when untraced
+- daemon:    tracing on (as in the daemon), published through the bus
+             and recorded by EventStoreSubscriber (traces stripped)
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_event_memory.py [events]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import gc
+import sys
+import tracemalloc
+
+from camilladsp_autoswitch.domain import tracing
+from camilladsp_autoswitch.domain.events import PolicyDecision, intern_event
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.infrastructure.eventing.event_store import EventStore
+from camilladsp_autoswitch.infrastructure.eventing.event_store_subscriber import EventStoreSubscriber
+from camilladsp_autoswitch.infrastructure.eventing.trace_buffer import TraceBuffer
+
+PROFILES = ("music", "cinema")
+
+
+@dataclass(frozen=True)
+class DictPolicyDecision:
+    profile: str
+    variant: str | None
+    reason: str
+
+
+def retained_bytes(make, events: int, *, daemon: bool = False) -> float:
+    store = EventStore()
+    if daemon:
+        bus = EventBus()
+        TraceBuffer(bus)  # bounded: its spans do not grow with the store
+        EventStoreSubscriber(bus, store)
+        record = bus.publish
+    else:
+        record = store.append
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    for i in range(events):
+        record(make(PROFILES[i % 2]))
+
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(store) == events
+    return (after - before) / events
+
+
+def main() -> None:
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    variants = [
+        ("dict", lambda profile: DictPolicyDecision(profile, None, "media_active")),
+        ("slotted", lambda profile: PolicyDecision(profile, None, "media_active")),
+        ("traced", lambda profile: PolicyDecision(profile, None, "media_active", trace=tracing.new_trace())),
+        ("interned", lambda profile: intern_event(PolicyDecision, profile, None, "media_active")),
+        ("daemon", lambda profile: intern_event(
+            PolicyDecision, profile, None, "media_active", trace=tracing.new_trace(),
+        )),
+    ]
+
+    print(f"{events} retained PolicyDecision events")
+    print(f"{'layout':10} {'bytes/event':>12}")
+    for name, make in variants:
+        tracing.enable(name in ("traced", "daemon"))
+        size = retained_bytes(make, events, daemon=name == "daemon")
+        print(f"{name:10} {size:12.1f}")
+    tracing.enable(False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark YAML loading on large CamillaDSP configs.
+
+Compares:
+- yaml.safe_load (pure-Python SafeLoader)
+- yaml_loader.safe_load (CSafeLoader when libyaml is available)
+- yaml_loader.load_file with a warm parse-once cache
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_yaml_loading.py [filters ...]
+"""
+
+from pathlib import Path
+import sys
+import tempfile
+import timeit
+
+import yaml
+
+from camilladsp_autoswitch import yaml_loader
+from camilladsp_autoswitch.yaml_loader import YamlDocumentCache
+
+
+def build_config(filters: int) -> str:
+    lines = [
+        "devices:",
+        "  samplerate: 48000",
+        "  chunksize: 1024",
+        "  capture: {type: Alsa, channels: 2, device: 'hw:Loopback,1', format: S32LE}",
+        "  playback: {type: Alsa, channels: 2, device: 'hw:0', format: S32LE}",
+        "filters:",
+    ]
+    for i in range(filters):
+        lines += [
+            f"  peq_{i}:",
+            "    type: Biquad",
+            "    parameters:",
+            "      type: Peaking",
+            f"      freq: {20 + i * 7}",
+            "      q: 0.707",
+            f"      gain: {(i % 13) - 6}.5",
+        ]
+    lines += [
+        "pipeline:",
+        "  - type: Filter",
+        "    channel: 0",
+        "    names:",
+    ]
+    lines += [f"      - peq_{i}" for i in range(filters)]
+    return "\n".join(lines) + "\n"
+
+
+def bench(filters: int, number: int) -> None:
+    text = build_config(filters)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "big.yml"
+        path.write_text(text)
+        cache = YamlDocumentCache()
+        cache.load(path)
+
+        pure = timeit.timeit(lambda: yaml.safe_load(text), number=number)
+        fast = timeit.timeit(lambda: yaml_loader.safe_load(text), number=number)
+        cached = timeit.timeit(lambda: cache.load(path), number=number)
+
+    def ms(total: float) -> float:
+        return total / number * 1000
+
+    print(
+        f"{filters:7d}  {len(text) / 1024:8.1f}  {ms(pure):9.2f}  "
+        f"{ms(fast):9.2f}  {ms(cached):9.4f}  {pure / fast:6.1f}x"
+    )
+
+
+def main(argv) -> None:
+    sizes = [int(a) for a in argv] or [50, 500, 2000]
+    print(f"libyaml available: {yaml_loader.HAS_LIBYAML}")
+    print(" FILTERS   SIZE KiB  PURE (ms)  FAST (ms)  CACHED (ms)  SPEEDUP")
+    for filters in sizes:
+        bench(filters, number=max(1, 2000 // filters))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -10,6 +10,8 @@ from camilladsp_autoswitch.infrastructure.runtime_state import (
     CDSPState,
     load_state,
     save_state,
+    state_transaction,
+    state_version,
     update_state,
 )
 
@@ -18,5 +20,7 @@ __all__ = [
     "CDSPState",
     "load_state",
     "save_state",
+    "state_transaction",
+    "state_version",
     "update_state",
 ]
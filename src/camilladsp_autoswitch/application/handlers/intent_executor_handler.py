@@ -1,4 +1,11 @@
+from typing import Optional
+
 from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.domain.events import IntentExecuted
+from camilladsp_autoswitch.domain.tracing import follow
+from camilladsp_autoswitch.infrastructure.execution.dwell import DwellLimiter, thread_call_later
+from camilladsp_autoswitch.infrastructure.execution.intent_executor import IntentExecutor
+from camilladsp_autoswitch.infrastructure.execution.scheduler import IntentScheduler
 from camilladsp_autoswitch.intent import SwitchIntent
 
 
@@ -6,29 +13,86 @@ class IntentExecutorHandler:
     """
     Executes SwitchIntent events.
 
+    Bus adapter around IntentExecutor (the execution engine):
     - resolves YAML
+    - deduplicates against the applied YAML
     - validates
     - applies
-    - guarantees idempotency
+    - publishes the outcome as IntentExecuted
+
+    Pass the engine's dependencies, or a ready `executor`.
+
+    Intents go through an IntentScheduler (latest wins): an intent
+    superseded before it could run is dropped without an
+    IntentExecuted. `defer` is handed to the scheduler.
+
+    With `dwell_for(profile, variant) -> seconds`, a DwellLimiter sits
+    in front of the scheduler: after an apply, intents are held for the
+    applied profile's dwell time and the newest one is released by a
+    timer (`call_later`, a threading.Timer by default).
     """
 
-    def __init__(self, bus, resolve_yaml, validate, apply):
-        self._resolve = resolve_yaml
-        self._validate = validate
-        self._apply = apply
-        self._last_yaml = None
+    def __init__(
+        self,
+        bus,
+        resolve_yaml=None,
+        validate=None,
+        apply=None,
+        last_applied=None,
+        *,
+        executor: Optional[IntentExecutor] = None,
+        defer=None,
+        dwell_for=None,
+        call_later=None,
+    ):
+        self._bus = bus
+        self._executor = executor or IntentExecutor(
+            resolve_fn=resolve_yaml,
+            validate_fn=validate,
+            apply_fn=apply,
+            last_applied=last_applied,
+        )
+        self._scheduler = IntentScheduler(self._execute, defer=defer)
+
+        self._limiter = None
+        if dwell_for is not None:
+            self._limiter = DwellLimiter(
+                self._scheduler.submit,
+                dwell_for=dwell_for,
+                call_later=call_later or thread_call_later,
+            )
+
+        bus.subscribe(
+            SwitchIntent,
+            self._limiter.submit if self._limiter is not None else self._scheduler.submit,
+        )
 
-        bus.subscribe(SwitchIntent, self._on_intent)
+    @property
+    def executor(self) -> IntentExecutor:
+        return self._executor
 
-    def _on_intent(self, intent: SwitchIntent) -> None:
-        yaml = self._resolve(intent)
+    @property
+    def scheduler(self) -> IntentScheduler:
+        return self._scheduler
 
-        if yaml == self._last_yaml:
-            return
+    @property
+    def limiter(self) -> Optional[DwellLimiter]:
+        return self._limiter
 
-        result = self._validate(yaml)
-        if not result.valid:
-            return
+    def _execute(self, intent: SwitchIntent) -> None:
+        execution = self._executor.execute(intent)
+        if self._limiter is not None and execution.outcome == "applied":
+            self._limiter.applied(intent.profile, intent.variant)
 
-        self._apply(yaml)
-        self._last_yaml = yaml
+        self._bus.publish(
+            IntentExecuted(
+                profile=intent.profile,
+                variant=intent.variant,
+                yaml=str(execution.yaml),
+                outcome=execution.outcome,
+                reason=execution.reason,
+                latency=execution.latency,
+                stages=execution.stages,
+                trace=follow(intent.trace),
+            )
+        )
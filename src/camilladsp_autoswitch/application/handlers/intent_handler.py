@@ -1,6 +1,7 @@
-from camilladsp_autoswitch.intent import SwitchIntent
+from camilladsp_autoswitch.intent import build_intent_from_policy
 from camilladsp_autoswitch.domain.events import PolicyDecision
 
+
 class IntentHandler:
     """
     Translates PolicyDecision → SwitchIntent
@@ -11,9 +12,4 @@ class IntentHandler:
         bus.subscribe(PolicyDecision, self._on_policy_decision)
 
     def _on_policy_decision(self, event: PolicyDecision):
-        intent = SwitchIntent(
-            profile=event.profile,
-            variant=event.variant,
-            reason=event.reason,
-        )
-        self._bus.publish(intent)
+        self._bus.publish(build_intent_from_policy(event))
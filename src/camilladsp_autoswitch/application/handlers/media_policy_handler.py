@@ -5,6 +5,8 @@ Application-layer component responsible for:
 - Listening to media-related events
 - Delegating decision logic to the domain
 - Emitting PolicyDecision events
+- Staying silent in manual mode (the forced profile holds until
+  the mode goes back to auto)
 
 Rules:
 - No I/O
@@ -15,12 +17,15 @@ Rules:
 from camilladsp_autoswitch.event_bus import EventBus
 from camilladsp_autoswitch.domain.events import (
     MediaActivityChanged,
+    ModeChanged,
     PolicyDecision,
+    intern_event,
 )
 from camilladsp_autoswitch.domain.mapping import MediaMapping
 from camilladsp_autoswitch.domain.policy import (
     select_profile_for_media_state,
 )
+from camilladsp_autoswitch.domain.tracing import follow
 
 
 class MediaPolicyHandler:
@@ -33,28 +38,55 @@ class MediaPolicyHandler:
         bus: EventBus,
         *,
         mapping: MediaMapping,
+        mode: str = "auto",
     ) -> None:
         self._bus = bus
         self._mapping = mapping
+        self._mode = mode
 
+        # Subscribed before RuntimeStateHandler: on ModeChanged("auto")
+        # the gate opens before it re-publishes the last media activity
+        self._bus.subscribe(ModeChanged, self._on_mode_changed)
         self._bus.subscribe(
             MediaActivityChanged,
             self._on_media_activity_changed,
         )
 
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @property
+    def mapping(self) -> MediaMapping:
+        return self._mapping
+
+    @mapping.setter
+    def mapping(self, mapping: MediaMapping) -> None:
+        """Swap the mapping (e.g. after mapping.yml was reloaded)."""
+        self._mapping = mapping
+
+    def _on_mode_changed(self, event: ModeChanged) -> None:
+        self._mode = event.mode
+
     def _on_media_activity_changed(
         self,
         event: MediaActivityChanged,
     ) -> None:
+        if self._mode == "manual":
+            return
+
         selection = select_profile_for_media_state(
             mapping=self._mapping,
             media_active=event.active,
         )
 
-        decision = PolicyDecision(
-            profile=selection.profile,
-            variant=selection.variant,
-            reason="media_active" if event.active else "media_inactive",
+        # Flyweight: one shared decision per mapping side (when untraced)
+        decision = intern_event(
+            PolicyDecision,
+            selection.profile,
+            selection.variant,
+            "media_active" if event.active else "media_inactive",
+            trace=follow(event.trace),
         )
 
         self._bus.publish(decision)
@@ -0,0 +1,102 @@
+"""
+Runtime State Handler.
+
+Application-layer reaction to CLI-driven runtime state changes:
+- ModeChanged("manual")     → switch to the forced profile
+- ModeChanged("auto")       → re-evaluate the last media activity
+- ProfileForced             → switch, when in manual mode
+- ExperimentalYamlChanged   → re-apply the current selection
+
+Rules:
+- No I/O
+- Only publishes events
+"""
+
+from dataclasses import replace
+
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.domain.events import (
+    ExperimentalYamlChanged,
+    MediaActivityChanged,
+    ModeChanged,
+    ProfileForced,
+    intern_event,
+)
+from camilladsp_autoswitch.domain.tracing import Trace, follow
+from camilladsp_autoswitch.intent import SwitchIntent
+
+
+class RuntimeStateHandler:
+    """
+    Keeps track of mode / forced profile and emits SwitchIntents.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        *,
+        mode: str = "auto",
+        profile: str = "music",
+        variant: str | None = None,
+    ) -> None:
+        self._bus = bus
+        self._mode = mode
+        self._profile = profile
+        self._variant = variant
+        self._last_media: MediaActivityChanged | None = None
+
+        bus.subscribe(MediaActivityChanged, self._on_media_activity)
+        bus.subscribe(ModeChanged, self._on_mode_changed)
+        bus.subscribe(ProfileForced, self._on_profile_forced)
+        bus.subscribe(ExperimentalYamlChanged, self._on_experimental_changed)
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    # ------------------------------------------------------------------
+    # Reactions
+    # ------------------------------------------------------------------
+
+    def _on_media_activity(self, event: MediaActivityChanged) -> None:
+        self._last_media = event
+
+    def _on_mode_changed(self, event: ModeChanged) -> None:
+        self._mode = event.mode
+
+        if event.mode == "manual":
+            self._publish_forced("manual_mode", event.trace)
+        elif event.mode == "auto" and self._last_media is not None:
+            self._republish_media(event.trace)
+
+    def _on_profile_forced(self, event: ProfileForced) -> None:
+        self._profile = event.profile
+        self._variant = event.variant
+
+        if self._mode == "manual":
+            self._publish_forced("manual_profile", event.trace)
+
+    def _on_experimental_changed(self, event: ExperimentalYamlChanged) -> None:
+        if self._mode == "manual" or self._last_media is None:
+            self._publish_forced("experimental", event.trace)
+        else:
+            self._republish_media(event.trace)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _publish_forced(self, reason: str, trace: Trace) -> None:
+        self._bus.publish(
+            intern_event(
+                SwitchIntent,
+                self._profile,
+                self._variant,
+                reason,
+                trace=follow(trace),
+            )
+        )
+
+    def _republish_media(self, trace: Trace) -> None:
+        # Re-evaluated on behalf of the state change: part of its trace
+        self._bus.publish(replace(self._last_media, trace=follow(trace)))
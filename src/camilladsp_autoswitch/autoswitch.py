@@ -0,0 +1,208 @@
+"""
+camilladsp-autoswitch daemon.
+
+    python3 -m camilladsp_autoswitch.autoswitch
+
+Responsibilities:
+- Build the pipeline with bootstrap()
+- Run every event source (config / state watchers, control socket,
+  process watcher) and timer in ONE selector loop: the daemon sleeps
+  in the kernel until something happens
+- SIGTERM / SIGINT → clean shutdown
+- SIGHUP → reload mapping.yml, forget cached validation verdicts,
+  re-sync the runtime state
+- SIGUSR1 → start / stop a cProfile session (.prof in the state dir)
+- SIGUSR2 → tracemalloc snapshot, diffed against the previous one
+- SIGQUIT → stack dump of every thread to stderr (faulthandler)
+- Pre-stage the opposite mapping side after every switch
+- Health-check every apply, roll back to the last known good config
+- Optional OpenMetrics endpoint (--metrics-port)
+- systemd: READY=1 once wired, STATUS= on every switch, WATCHDOG=1
+  from a loop heartbeat (see systemd.watchdog)
+
+Rules:
+- No domain logic here
+- Signal handlers only schedule work on the loop
+"""
+
+import argparse
+import logging
+import signal
+import sys
+from typing import List, Optional
+
+from camilladsp_autoswitch.bootstrap import bootstrap
+from camilladsp_autoswitch.domain.events import IntentExecuted
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.infrastructure.detectors.media_activity import MEDIA_PROCESS_NAMES
+from camilladsp_autoswitch.infrastructure.diagnostics.profiling import (
+    CpuProfiler,
+    MemorySnapshots,
+    enable_stack_dumps,
+)
+from camilladsp_autoswitch.infrastructure.filesystem.media_mapping_loader import (
+    MediaMappingLoadError,
+    load_media_mapping,
+)
+from camilladsp_autoswitch.infrastructure.systemd.notify import SystemdNotifier
+from camilladsp_autoswitch.infrastructure.systemd.watchdog import LoopWatchdog
+from camilladsp_autoswitch.infrastructure.watchers.loop import EventLoop
+
+logger = logging.getLogger("camilladsp_autoswitch.daemon")
+
+
+def reload(bus: EventBus) -> None:
+    """
+    SIGHUP handler body (runs on the loop thread).
+
+    A broken mapping.yml keeps the current mapping: audio never stops
+    because of a bad edit.
+    """
+    try:
+        bus.media_policy.mapping = load_media_mapping()
+    except MediaMappingLoadError as exc:
+        logger.error("Reload: keeping current mapping (%s)", exc.__cause__ or exc)
+    else:
+        logger.info("Reload: mapping.yml reloaded")
+
+    bus.validation_cache.invalidate()
+
+    tracker = getattr(bus, "state_watcher", None)
+    if tracker is not None:
+        tracker.refresh()
+
+
+def describe(event: IntentExecuted) -> str:
+    """One-line systemd STATUS= for a switch outcome."""
+    label = event.profile if event.variant is None else f"{event.profile}.{event.variant}"
+    text = f"{label}: {event.outcome}"
+    if event.reason:
+        text += f" ({event.reason})"
+    return text
+
+
+def install_signal_handlers(loop: EventLoop, bus: EventBus) -> None:
+    profiler = CpuProfiler()
+    snapshots = MemorySnapshots()
+
+    def on_terminate(signum, _frame):
+        logger.info("Received %s, shutting down", signal.Signals(signum).name)
+        loop.stop()
+
+    def on_hangup(_signum, _frame):
+        loop.call_soon_threadsafe(lambda: reload(bus))
+
+    def on_usr1(_signum, _frame):
+        loop.call_soon_threadsafe(profiler.toggle)
+
+    def on_usr2(_signum, _frame):
+        loop.call_soon_threadsafe(snapshots.take)
+
+    signal.signal(signal.SIGTERM, on_terminate)
+    signal.signal(signal.SIGINT, on_terminate)
+    signal.signal(signal.SIGHUP, on_hangup)
+    signal.signal(signal.SIGUSR1, on_usr1)
+    signal.signal(signal.SIGUSR2, on_usr2)
+    enable_stack_dumps()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="camilladsp-autoswitch",
+        description="CamillaDSP Autoswitch daemon",
+    )
+    parser.add_argument(
+        "--media-process",
+        action="append",
+        dest="media_processes",
+        metavar="NAME",
+        help=f"Process name that means media is playing (repeatable, default: {', '.join(MEDIA_PROCESS_NAMES)})",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="Serve OpenMetrics on http://127.0.0.1:PORT/metrics (default: off)",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=("DEBUG", "INFO", "WARNING", "ERROR"),
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    logging.basicConfig(
+        level=args.log_level,
+        format="%(levelname)s %(name)s: %(message)s",
+        stream=sys.stderr,
+    )
+
+    loop = EventLoop()
+    bus = bootstrap(
+        media_processes=args.media_processes,
+        warm_cache=True,
+        watch_config=True,
+        watch_state=True,
+        control_socket=True,
+        status_segment=True,
+        watch_processes=True,
+        remember_applied=True,
+        health_check=True,
+        metrics_port=args.metrics_port,
+        tracing=True,
+        prestage=True,
+        loop=loop,
+    )
+
+    notifier = SystemdNotifier()
+    watchdog = LoopWatchdog(loop, notifier)
+    watchdog.start()
+
+    server = getattr(bus, "control_server", None)
+    if server is not None:
+        server.register_stats(watchdog.stats)
+
+    metrics = getattr(bus, "metrics", None)
+    if metrics is not None:
+        metrics.watch_stats(watchdog.stats, {
+            "loop_lag_seconds": "Lateness of the last loop heartbeat.",
+            "loop_lag_max_seconds": "Worst loop heartbeat lateness since start.",
+        })
+
+    bus.subscribe(IntentExecuted, lambda event: notifier.status(describe(event)))
+
+    install_signal_handlers(loop, bus)
+
+    logger.info(
+        "Daemon started (%d event sources, watchdog %s)",
+        len(loop.sources),
+        f"{notifier.watchdog_interval:g}s" if notifier.watchdog_interval else "off",
+    )
+    notifier.ready(status=f"Running ({len(loop.sources)} event sources)")
+    try:
+        loop.run()
+    finally:
+        notifier.stopping()
+        watchdog.stop()
+        loop.close()
+        health_monitor = getattr(bus, "health_monitor", None)
+        if health_monitor is not None:
+            health_monitor.cancel()
+        prestager = getattr(bus, "prestager", None)
+        if prestager is not None:
+            prestager.close()
+        notifier.close()
+        segment = getattr(bus, "status_segment", None)
+        if segment is not None:
+            segment.close()
+
+    logger.info("Daemon stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -12,20 +12,60 @@ Rules:
 - Be test-friendly via dependency injection
 """
 
+import logging
+from pathlib import Path
+
 from camilladsp_autoswitch.event_bus import EventBus
 from camilladsp_autoswitch.infrastructure.eventing.event_store import EventStore
 from camilladsp_autoswitch.infrastructure.eventing.event_store_subscriber import EventStoreSubscriber
+from camilladsp_autoswitch.infrastructure.eventing.trace_buffer import TraceBuffer
+from camilladsp_autoswitch.infrastructure.detectors.media_activity import MEDIA_PROCESS_NAMES
 from camilladsp_autoswitch.infrastructure.detectors.media_activity_detector import MediaActivityDetector
+from camilladsp_autoswitch.infrastructure.detectors.process_watcher import ProcessWatcher
 from camilladsp_autoswitch.application.handlers.media_policy_handler import MediaPolicyHandler
 from camilladsp_autoswitch.application.handlers.intent_handler import IntentHandler
 from camilladsp_autoswitch.application.handlers.intent_executor_handler import IntentExecutorHandler
-from camilladsp_autoswitch.infrastructure.camilladsp.apply import apply_yaml
+from camilladsp_autoswitch.application.handlers.runtime_state_handler import RuntimeStateHandler
+from camilladsp_autoswitch.infrastructure.camilladsp.apply import (
+    HEALTH_POLL,
+    HEALTH_TIMEOUT,
+    apply_yaml,
+    check_health,
+    current_config_name,
+    restore_config,
+)
+from camilladsp_autoswitch.infrastructure.execution.dwell import thread_call_later
+from camilladsp_autoswitch.infrastructure.execution.health import HealthMonitor
+from camilladsp_autoswitch.infrastructure.execution.intent_executor import IntentExecutor
+from camilladsp_autoswitch.infrastructure.execution.last_applied import LastApplied
+from camilladsp_autoswitch.infrastructure.execution.prestage import Prestager
 from camilladsp_autoswitch.application.services.yaml_resolver import resolve_yaml_path
 from camilladsp_autoswitch.validator import validate
+from camilladsp_autoswitch.validators.cache import ValidationCache
+from camilladsp_autoswitch.validators.bulk import (
+    discover_profiles,
+    format_timing_table,
+    validate_all,
+)
+from camilladsp_autoswitch.infrastructure.filesystem.paths import get_config_dir
+from camilladsp_autoswitch.infrastructure.watchers.config_watcher import ConfigWatcher
+from camilladsp_autoswitch.infrastructure.watchers.state_watcher import (
+    StateTracker,
+    StateWatcher,
+)
+from camilladsp_autoswitch.infrastructure.control.server import ControlServer
+from camilladsp_autoswitch.infrastructure.control.status_publisher import StatusPublisher
+from camilladsp_autoswitch.infrastructure.control.status_segment import StatusSegment
+from camilladsp_autoswitch.infrastructure.metrics.pipeline import PipelineMetrics
+from camilladsp_autoswitch.infrastructure.metrics.server import MetricsServer
+from camilladsp_autoswitch.infrastructure.runtime_state import load_state
+from camilladsp_autoswitch.yaml_loader import document_cache
 
 from camilladsp_autoswitch.domain.mapping import MediaMapping, ProfileSelection
 from camilladsp_autoswitch.infrastructure.filesystem.media_mapping_loader import load_media_mapping
 
+logger = logging.getLogger(__name__)
+
 
 def _fallback_mapping() -> MediaMapping:
     """
@@ -43,25 +83,120 @@ def _fallback_mapping() -> MediaMapping:
     )
 
 
+def _profile_resolver(profiles_dir: Path):
+    """
+    resolve_yaml for the executor: SwitchIntent → YAML path.
+
+    The experimental YAML (cdspctl experimental on) overrides the
+    profile; runtime state reads are fingerprint-cached.
+    """
+
+    def resolve(intent) -> Path:
+        return resolve_yaml_path(
+            decision=intent,
+            config_dir=profiles_dir,
+            experimental_yml=load_state().experimental_yml,
+        )
+
+    return resolve
+
+
+def _run_source(source, loop) -> None:
+    if loop is not None:
+        loop.add(source)
+    else:
+        source.start()
+
+
 def bootstrap(
     *,
-    resolve_yaml=resolve_yaml_path,
+    resolve_yaml=None,
     validate_fn=validate,
     apply_fn=apply_yaml,
     enable_event_store: bool = True,
     replay_on_start: bool = True,
     media_processes=None,
     mapping: MediaMapping | None = None,
+    warm_cache: bool = False,
+    watch_config: bool = False,
+    watch_state: bool = False,
+    control_socket: bool = False,
+    status_segment: bool = False,
+    watch_processes: bool = False,
+    remember_applied: bool = False,
+    current_config=current_config_name,
+    health_check: bool = False,
+    metrics_port: int | None = None,
+    tracing: bool = False,
+    prestage: bool = False,
+    config_dir: Path | None = None,
+    loop=None,
 ) -> EventBus:
     """
     Build and wire the full autoswitch event-driven pipeline.
+
+    With warm_cache=True every profile under <config_dir>/profiles
+    is validated up front, in parallel, so the first switch is served
+    from the validation cache.
+
+    With watch_config=True a background inotify watcher revalidates
+    YAMLs in config_dir and its profiles/ subdirectory on change.
+
+    With watch_state=True changes to the runtime state (cdspctl) are
+    pushed onto the bus as ModeChanged / ProfileForced /
+    ExperimentalYamlChanged events.
+
+    With control_socket=True cdspctl commands are served over a Unix
+    socket and acknowledged with the outcome of the switch they caused.
+
+    With status_segment=True the live status is mirrored into a
+    shared-memory segment (see control.status_segment) for cheap polling.
+
+    With watch_processes=True media processes are watched (pidfd + /proc
+    scan) and reported as ProcessStarted / ProcessStopped.
+
+    With remember_applied=True the last applied YAML is persisted, so a
+    restart does not reload CamillaDSP into the config it already runs
+    (the record is checked against current_config() first).
+
+    With health_check=True every apply is followed by CamillaDSP
+    probes (processing the expected config, processing load), polled
+    by a HealthMonitor on `loop`'s timers; a failed apply or probe
+    restores the last known good config from memory.
+
+    With metrics_port set, pipeline metrics (events, switches, latency
+    histograms, cache hit ratios, scan cost) are served in OpenMetrics
+    format on http://127.0.0.1:<metrics_port>/metrics.
+
+    With tracing=True the spans of recent switches (root event →
+    policy → intent → resolve / validate / apply) are kept in a bounded
+    buffer, dumped with `cdspctl trace`.
+
+    With prestage=True the opposite mapping side is resolved, validated
+    and pre-read in the background after every switch, so the next
+    toggle only has to apply.
+
+    Event sources (watchers, control socket, process watcher) run in
+    their own background threads, or are added to `loop` when given
+    (see watchers.loop; the daemon runs everything in one thread).
     """
+    config_dir = Path(config_dir) if config_dir else get_config_dir()
 
     # -----------------------------
     # Core
     # -----------------------------
     bus = EventBus()
 
+    # validate_all() pickles its validator into worker processes:
+    # it gets the raw module-level function, never a closure
+    bulk_validate_fn = validate_fn
+
+    metrics = None
+    if metrics_port is not None:
+        metrics = PipelineMetrics(bus)
+        validate_fn = metrics.timed(validate_fn)
+        bus.metrics = metrics  # test-friendly hook
+
     # -----------------------------
     # Event store (optional)
     # -----------------------------
@@ -69,6 +204,13 @@ def bootstrap(
         store = EventStore()
         EventStoreSubscriber(bus, store)
         bus.event_store = store  # test-friendly hook
+        if metrics is not None:
+            metrics.watch_event_store(store)
+
+    traces = None
+    if tracing:
+        traces = TraceBuffer(bus)
+        bus.trace_buffer = traces  # test-friendly hook
 
     # -----------------------------
     # Media mapping (REQUIRED)
@@ -80,30 +222,212 @@ def bootstrap(
             # Test / development fallback
             mapping = _fallback_mapping()
 
+    # -----------------------------
+    # Validation cache
+    # -----------------------------
+    validation_cache = ValidationCache()
+    bus.validation_cache = validation_cache  # test-friendly hook
+
+    if metrics is not None:
+        metrics.watch_caches({
+            "validation": validation_cache,
+            "yaml": document_cache(),
+        })
+
+    if warm_cache:
+        entries = validate_all(
+            discover_profiles(config_dir / "profiles"),
+            validate_fn=bulk_validate_fn,
+            cache=validation_cache,
+        )
+        bus.warmup_report = entries
+        if metrics is not None:
+            metrics.observe_validations(entries)
+        if entries:
+            logger.info(
+                "Validation cache warm-up:\n%s",
+                format_timing_table(entries),
+            )
+
+    if watch_config:
+        try:
+            watcher = ConfigWatcher(
+                config_dir,
+                validate_fn=validate_fn,
+                cache=validation_cache,
+            )
+        except OSError as exc:
+            logger.warning("Config watcher disabled: %s", exc)
+        else:
+            _run_source(watcher, loop)
+            bus.config_watcher = watcher
+
     # -----------------------------
     # Handlers (pure reactions)
     # -----------------------------
-    MediaPolicyHandler(bus, mapping=mapping)
+    state = load_state()
+
+    # Created before RuntimeStateHandler: its mode gate must open before
+    # a switch back to auto re-publishes the last media state.
+    bus.media_policy = MediaPolicyHandler(bus, mapping=mapping, mode=state.mode)
+    RuntimeStateHandler(
+        bus,
+        mode=state.mode,
+        profile=state.profile,
+        variant=state.variant,
+    )
     IntentHandler(bus)
-    IntentExecutorHandler(
+
+    if status_segment:
+        try:
+            segment = StatusSegment()
+        except OSError as exc:
+            logger.warning("Status segment disabled: %s", exc)
+        else:
+            StatusPublisher(
+                bus,
+                segment,
+                mode=state.mode,
+                profile=state.profile,
+                variant=state.variant,
+            )
+            bus.status_segment = segment
+
+    last_applied = None
+    if remember_applied:
+        last_applied = LastApplied()
+        last_applied.verify(current_config())
+        bus.last_applied = last_applied
+
+    resolve_yaml = resolve_yaml or _profile_resolver(config_dir / "profiles")
+    cached_validate = validation_cache.wrap(validate_fn)
+
+    bus.executor = IntentExecutor(
+        resolve_fn=resolve_yaml,
+        validate_fn=cached_validate,
+        apply_fn=apply_fn,
+        last_applied=last_applied,
+        restore_fn=restore_config if health_check else None,
+        # Probed by the HealthMonitor, off the executor's critical path
+        confirm_later=health_check,
+    )
+    executor_handler = IntentExecutorHandler(
         bus,
-        resolve_yaml=resolve_yaml,
-        validate=validate_fn,
-        apply=apply_fn,
+        executor=bus.executor,
+        defer=loop.call_soon_threadsafe if loop is not None else None,
+        # Read on every apply, so a reloaded mapping.yml takes effect
+        dwell_for=lambda profile, variant: bus.media_policy.mapping.dwell_for(profile, variant),
+        call_later=loop.call_later if loop is not None else None,
     )
+    bus.scheduler = executor_handler.scheduler
+    bus.dwell_limiter = executor_handler.limiter
+    if metrics is not None:
+        metrics.watch_scheduler(executor_handler.scheduler)
+        metrics.watch_dwell_limiter(executor_handler.limiter)
+
+    health_monitor = None
+    if health_check:
+        health_monitor = HealthMonitor(
+            bus,
+            bus.executor,
+            check_fn=check_health,
+            timeout=HEALTH_TIMEOUT,
+            poll=HEALTH_POLL,
+            call_later=loop.call_later if loop is not None else thread_call_later,
+        )
+        bus.health_monitor = health_monitor
+
+    prestager = None
+    if prestage:
+        prestager = Prestager(
+            bus,
+            mapping=lambda: bus.media_policy.mapping,
+            resolve_fn=resolve_yaml,
+            validate_fn=cached_validate,
+        )
+        bus.prestager = prestager
 
     # -----------------------------
     # Event source (event-driven)
     # -----------------------------
-    MediaActivityDetector(
+    media_processes = media_processes or MEDIA_PROCESS_NAMES
+
+    detector = MediaActivityDetector(
         bus,
         media_processes=media_processes,
     )
 
+    if watch_processes:
+        process_watcher = ProcessWatcher(bus, media_processes)
+        # First scan here, not on the source thread: processes already
+        # running are published as started before anything else runs
+        process_watcher.scan()
+        _run_source(process_watcher, loop)
+        bus.process_watcher = process_watcher
+        if metrics is not None:
+            metrics.watch_process_watcher(process_watcher)
+
+    # -----------------------------
+    # Runtime state changes (cdspctl)
+    # -----------------------------
+    tracker = None
+
+    if watch_state:
+        try:
+            state_watcher = StateWatcher(bus)
+        except OSError as exc:
+            logger.warning("State watcher disabled: %s", exc)
+        else:
+            _run_source(state_watcher, loop)
+            bus.state_watcher = state_watcher
+            tracker = state_watcher
+
+    if control_socket:
+        try:
+            server = ControlServer(
+                bus,
+                tracker=tracker or StateTracker(bus),
+                stats=lambda: {
+                    "validation_cache": {
+                        "entries": len(validation_cache),
+                        "hits": validation_cache.hits,
+                        "misses": validation_cache.misses,
+                    },
+                    **executor_handler.scheduler.stats(),
+                    **executor_handler.limiter.stats(),
+                    **(prestager.stats() if prestager is not None else {}),
+                    **(health_monitor.stats() if health_monitor is not None else {}),
+                },
+                traces=traces,
+                flush=executor_handler.scheduler.flush,
+            )
+        except OSError as exc:
+            logger.warning("Control socket disabled: %s", exc)
+        else:
+            _run_source(server, loop)
+            bus.control_server = server
+
+    if metrics is not None:
+        try:
+            metrics_server = MetricsServer(metrics.render, port=metrics_port)
+        except OSError as exc:
+            logger.warning("Metrics endpoint disabled: %s", exc)
+        else:
+            _run_source(metrics_server, loop)
+            bus.metrics_server = metrics_server
+
     # -----------------------------
     # Replay (after wiring!)
     # -----------------------------
     if replay_on_start and enable_event_store:
         bus.event_store.replay(bus)
 
+    # -----------------------------
+    # Initial media state (after replay, so it is the newest fact)
+    # -----------------------------
+    if watch_processes:
+        # An idle start publishes inactive: the idle profile applies
+        # without waiting for a media process to come and go
+        detector.announce()
+
     return bus
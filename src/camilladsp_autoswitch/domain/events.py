@@ -1,34 +1,148 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from typing import Optional
+
+from camilladsp_autoswitch.domain.slots import slotted
+from camilladsp_autoswitch.domain.tracing import Trace, trace_field
 
 
 class Event:
-    """Base marker class"""
-    pass
+    """
+    Base marker class.
+
+    Events are frozen, slotted dataclasses (no per-instance __dict__).
+
+    Events carry a `trace` (see domain.tracing): excluded from equality
+    and repr, a new root trace unless the publisher passes one on
+    (None while tracing is off).
+    """
+    __slots__ = ()
+
+
+def intern_event(cls, *values, trace: Optional[Trace] = None):
+    """
+    Build cls(*values), sharing one instance per distinct value set.
+
+    Only untraced events are shared: a trace makes every event unique.
+    The event store then retains references to a handful of objects
+    instead of one object per event (see untraced() for traced ones).
+    """
+    _internable.add(cls)
+    if trace is not None:
+        return cls(*values, trace=trace)
+    return _interned(cls, values)
+
+
+def untraced(event):
+    """
+    The event without its trace context, for retention.
+
+    Spans are kept by the bounded TraceBuffer; a retained event only
+    needs its payload. Types built through intern_event() are shared
+    again once the trace is gone, so tracing does not cost the event
+    store one object per event.
+    """
+    if getattr(event, "trace", None) is None:
+        return event
+
+    cls = type(event)
+    if cls not in _internable:
+        return replace(event, trace=None)
+    return _interned(cls, tuple(getattr(event, name) for name in _payload_fields(cls)))
+
+
+_internable: set = set()
+
+
+@lru_cache(maxsize=256)
+def _interned(cls, values: tuple):
+    return cls(*values, trace=None)
+
+
+@lru_cache(maxsize=None)
+def _payload_fields(cls) -> tuple:
+    return tuple(f.name for f in fields(cls) if f.name != "trace")
 
 
+@slotted
 @dataclass(frozen=True)
 class MediaActivityChanged(Event):
     active: bool
+    trace: Trace | None = trace_field()
 
 
+@slotted
 @dataclass(frozen=True)
 class PolicyDecision(Event):
     profile: str
     variant: str | None
     reason: str
+    trace: Trace | None = trace_field()
 
 
+@slotted
 @dataclass(frozen=True)
 class SwitchIntent(Event):
     profile: str
     variant: str | None
     reason: str
+    trace: Trace | None = trace_field()
+
+@slotted
+@dataclass(frozen=True)
+class IntentExecuted(Event):
+    """
+    Outcome of executing a SwitchIntent.
+
+    outcome: "applied" | "unchanged" | "invalid" | "rolled_back" | "failed"
+    latency: duration of the apply step in seconds (applied only)
+    stages: (name, start, end) monotonic timings of the executor
+            steps that ran (resolve, validate, apply, check, rollback)
+    """
+    profile: str
+    variant: str | None
+    yaml: str
+    outcome: str
+    reason: str | None = None
+    latency: float | None = None
+    stages: tuple = field(default=(), compare=False, repr=False)
+    trace: Trace | None = trace_field()
+
+
+@slotted
+@dataclass(frozen=True)
+class ModeChanged(Event):
+    mode: str
+    previous: str | None
+    trace: Trace | None = trace_field()
+
+
+@slotted
+@dataclass(frozen=True)
+class ProfileForced(Event):
+    profile: str
+    variant: str | None
+    trace: Trace | None = trace_field()
+
+
+@slotted
+@dataclass(frozen=True)
+class ExperimentalYamlChanged(Event):
+    path: str | None
+    trace: Trace | None = trace_field()
+
 
+@slotted
 @dataclass(frozen=True)
 class ProcessStarted:
     name: str
+    trace: Trace | None = trace_field()
 
 
+@slotted
 @dataclass(frozen=True)
 class ProcessStopped:
     name: str
+    trace: Trace | None = trace_field()
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-import yaml
+from camilladsp_autoswitch import yaml_loader
 
 
 # ------------------------------------------------------------------
@@ -40,9 +40,16 @@ class MediaMapping:
     - No environment access
     """
 
-    def __init__(self, *, on: ProfileSelection, off: ProfileSelection):
+    def __init__(
+        self,
+        *,
+        on: ProfileSelection,
+        off: ProfileSelection,
+        dwell: Optional[Dict[str, float]] = None,
+    ):
         self._on = on
         self._off = off
+        self._dwell = dict(dwell or {})
 
     # --------------------------------------------------------------
     # Public read-only accessors (API compatibility)
@@ -56,6 +63,10 @@ class MediaMapping:
     def off(self) -> ProfileSelection:
         return self._off
 
+    @property
+    def dwell(self) -> Dict[str, float]:
+        return dict(self._dwell)
+
     # --------------------------------------------------------------
     # Factory
     # --------------------------------------------------------------
@@ -74,6 +85,13 @@ class MediaMapping:
           off:
             profile: music
             variant: normal
+
+        # Optional: minimum seconds a profile stays applied before
+        # the next reload (most specific key wins)
+        dwell:
+          default: 0
+          cinema: 10
+          cinema.night: 30
         """
         path = Path(path)
 
@@ -81,7 +99,7 @@ class MediaMapping:
             raise MappingError(f"Mapping file not found: {path}")
 
         try:
-            data = yaml.safe_load(path.read_text())
+            data = yaml_loader.load_file(path)
         except Exception as exc:
             raise MappingError("Failed to parse mapping YAML") from exc
 
@@ -109,7 +127,7 @@ class MediaMapping:
         except KeyError as exc:
             raise MappingError(f"Missing required section: {exc}") from exc
 
-        return cls(on=on, off=off)
+        return cls(on=on, off=off, dwell=cls._parse_dwell(data.get("dwell")))
 
     # --------------------------------------------------------------
     # Public API
@@ -121,10 +139,38 @@ class MediaMapping:
         """
         return self._on if media_active else self._off
 
+    def dwell_for(self, profile: str, variant: Optional[str] = None) -> float:
+        """
+        Minimum dwell (seconds) after applying profile/variant.
+        """
+        dwell = self._dwell
+        if variant is not None and f"{profile}.{variant}" in dwell:
+            return dwell[f"{profile}.{variant}"]
+        if profile in dwell:
+            return dwell[profile]
+        return dwell.get("default", 0.0)
+
     # --------------------------------------------------------------
     # Internals
     # --------------------------------------------------------------
 
+    @staticmethod
+    def _parse_dwell(section) -> Dict[str, float]:
+        if section is None:
+            return {}
+
+        if not isinstance(section, dict):
+            raise MappingError("'dwell' section must be a mapping")
+
+        dwell: Dict[str, float] = {}
+        for key, value in section.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                raise MappingError(
+                    f"Invalid dwell for '{key}' (must be a number of seconds >= 0)"
+                )
+            dwell[str(key)] = float(value)
+        return dwell
+
     @staticmethod
     def _parse_side(media: dict, key: str) -> ProfileSelection:
         if key not in media:
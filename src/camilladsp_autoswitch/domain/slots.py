@@ -0,0 +1,73 @@
+"""
+__slots__ for frozen dataclasses, on every supported Python.
+
+`@dataclass(slots=True)` only exists from Python 3.10. slotted()
+rebuilds a dataclass with __slots__ the same way, so instances carry
+no per-instance __dict__.
+
+Usage (order matters, slotted goes on top):
+
+    @slotted
+    @dataclass(frozen=True)
+    class PolicyDecision(Event):
+        ...
+
+Rules:
+- Base classes must define __slots__ too (e.g. `__slots__ = ()`),
+  otherwise instances still get a __dict__
+- Frozen instances stay picklable / copyable (state as a tuple)
+"""
+
+from dataclasses import FrozenInstanceError, fields, is_dataclass
+
+
+def slotted(cls):
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} is not a dataclass")
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already defines __slots__")
+
+    names = tuple(f.name for f in fields(cls))
+    inherited = {
+        name
+        for base in cls.__mro__[1:]
+        for name in getattr(base, "__slots__", ())
+    }
+
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = tuple(name for name in names if name not in inherited)
+    # Class-level defaults would shadow the slot descriptors; __init__
+    # already holds them.
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+
+    if cls.__dataclass_params__.frozen:
+        # The generated ones refer to the original class
+        namespace["__setattr__"] = _frozen_setattr
+        namespace["__delattr__"] = _frozen_delattr
+        namespace["__getstate__"] = _getstate
+        namespace["__setstate__"] = _setstate
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+def _frozen_setattr(self, name, value):
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _frozen_delattr(self, name):
+    raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+def _getstate(self):
+    return tuple(getattr(self, f.name) for f in fields(self))
+
+
+def _setstate(self, state):
+    for f, value in zip(fields(self), state):
+        # Frozen: bypass the generated __setattr__
+        object.__setattr__(self, f.name, value)
@@ -0,0 +1,67 @@
+"""
+Causal trace context carried by events.
+
+A root event (media activity, a cdspctl command, a process start)
+starts a trace; every event derived from it carries the same trace id
+and its own monotonic creation time. Following the chain from
+detector to apply therefore needs no shared state.
+
+Tracing is off until enabled (the daemon's TraceBuffer does so):
+events then carry trace=None, and identical events can be shared
+(see events.intern_event).
+
+Rules:
+- Pure data, no I/O (time.monotonic only)
+- Trace context never takes part in event equality
+"""
+
+from dataclasses import dataclass, field
+import itertools
+import time
+from typing import Optional
+
+from camilladsp_autoswitch.domain.slots import slotted
+
+_trace_ids = itertools.count(1)
+_enabled = False
+
+
+def enable(on: bool = True) -> None:
+    """Turn tracing on (or off) for the whole process."""
+    global _enabled
+    _enabled = on
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+@slotted
+@dataclass(frozen=True)
+class Trace:
+    trace_id: int
+    started: float  # monotonic time of the root event
+    at: float       # monotonic time the carrying event was created
+
+
+def new_trace() -> Optional[Trace]:
+    """Start a trace at the current time (root events)."""
+    if not _enabled:
+        return None
+    now = time.monotonic()
+    return Trace(trace_id=next(_trace_ids), started=now, at=now)
+
+
+def follow(trace: Optional[Trace]) -> Optional[Trace]:
+    """Trace context for an event derived from one carrying `trace`."""
+    if not _enabled:
+        return None
+    if trace is None:
+        return new_trace()
+    return Trace(trace_id=trace.trace_id, started=trace.started, at=time.monotonic())
+
+
+def trace_field():
+    """Dataclass field for an event's trace: a new root unless given
+    (None while tracing is off)."""
+    return field(default_factory=new_trace, compare=False, repr=False)
@@ -1,6 +1,9 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 import logging
 import os
+from typing import Iterator, Optional
 
 try:
     from camilladsp import CamillaDSP
@@ -10,14 +13,130 @@ except ImportError:
 CAMILLA_HOST = os.environ.get("CDSP_CAMILLA_HOST", "127.0.0.1")
 CAMILLA_PORT = int(os.environ.get("CDSP_CAMILLA_PORT", "1234"))
 
+# Post-apply health probe (polled by HealthMonitor)
+HEALTH_TIMEOUT = float(os.environ.get("CDSP_HEALTH_TIMEOUT", "1.0"))
+HEALTH_POLL = 0.05
+MAX_PROCESSING_LOAD = float(os.environ.get("CDSP_MAX_PROCESSING_LOAD", "90"))
+
+# PAUSED: no input signal; STALLED: the capture device is gone for now.
+# Both keep the config loaded and resume on their own.
+HEALTHY_STATES = frozenset({"RUNNING", "PAUSED", "STALLED"})
+
 logger = logging.getLogger(__name__)
 
+
+class ApplyError(Exception):
+    """Raised when CamillaDSP rejects or cannot receive a config."""
+
+
+@dataclass(frozen=True)
+class HealthResult:
+    ok: bool
+    reason: Optional[str] = None
+
+
+@contextmanager
+def _client() -> Iterator["CamillaDSP"]:
+    """One connection per operation, always closed (even on error)."""
+    client = CamillaDSP(host=CAMILLA_HOST, port=CAMILLA_PORT)
+    client.connect()
+    try:
+        yield client
+    finally:
+        client.disconnect()
+
+
 def apply_yaml(yaml_path: Path) -> None:
+    """
+    Point CamillaDSP at yaml_path and reload it.
+
+    Raises:
+        ApplyError: CamillaDSP is unreachable or refused the reload
+    """
     if CamillaDSP is None:
         return
     try:
-        client = CamillaDSP(host=CAMILLA_HOST, port=CAMILLA_PORT)
-        client.set_config_name(str(yaml_path))
-        client.reload()
+        with _client() as client:
+            client.set_config_name(str(yaml_path))
+            client.reload()
     except Exception as exc:
         logger.error("Failed to apply config: %s", exc)
+        raise ApplyError(str(exc)) from exc
+
+
+def restore_config(yaml_path: Path, raw: str) -> None:
+    """
+    Push an in-memory config (last known good) in one call.
+
+    No file is read: the config text was serialized when it was
+    known to work.
+
+    Raises:
+        ApplyError: CamillaDSP is unreachable or refused the config
+    """
+    if CamillaDSP is None:
+        return
+    try:
+        with _client() as client:
+            client.set_config_name(str(yaml_path))
+            client.set_config_raw(raw)
+    except Exception as exc:
+        logger.error("Failed to restore config: %s", exc)
+        raise ApplyError(str(exc)) from exc
+
+
+def check_health(
+    yaml_path: Path,
+    *,
+    max_load: float = MAX_PROCESSING_LOAD,
+) -> HealthResult:
+    """
+    Probe CamillaDSP once after an apply.
+
+    Healthy when CamillaDSP processes yaml_path (RUNNING, PAUSED or
+    STALLED) with a processing load of at most `max_load` percent.
+    One round trip, never sleeps: HealthMonitor polls it until the
+    timeout. Never raises. Without the camilladsp package nothing can
+    be checked and the apply is assumed healthy.
+    """
+    if CamillaDSP is None:
+        return HealthResult(True)
+
+    try:
+        with _client() as client:
+            reason = _probe(client, yaml_path, max_load)
+    except Exception as exc:
+        reason = f"probe failed: {exc}"
+
+    return HealthResult(reason is None, reason)
+
+
+def _probe(client, yaml_path: Path, max_load: float) -> Optional[str]:
+    state = client.get_state()
+    name = getattr(state, "name", str(state))
+    if name not in HEALTHY_STATES:
+        return f"state {name}"
+
+    config_name = client.get_config_name()
+    if config_name != str(yaml_path):
+        return f"running {config_name}"
+
+    load = client.get_processing_load()
+    if load is not None and load > max_load:
+        return f"processing load {load:.0f}%"
+
+    return None
+
+
+def current_config_name() -> Optional[str]:
+    """
+    Path of the config CamillaDSP is running, or None if unknown.
+    """
+    if CamillaDSP is None:
+        return None
+    try:
+        with _client() as client:
+            return client.get_config_name()
+    except Exception as exc:
+        logger.warning("Cannot query CamillaDSP config: %s", exc)
+        return None
@@ -0,0 +1,83 @@
+"""
+Control socket client (used by cdspctl).
+"""
+
+from pathlib import Path
+import socket
+from typing import Any, Dict, Optional
+
+from camilladsp_autoswitch.infrastructure.control.protocol import (
+    MAX_MESSAGE,
+    ControlError,
+    ControlUnavailable,
+    decode,
+    default_socket_path,
+    encode,
+)
+
+DEFAULT_TIMEOUT = 5.0
+
+
+class ControlClient:
+    """
+    Sends one request per connection and waits for the acknowledgement.
+    """
+
+    def __init__(self, path: Optional[Path] = None, timeout: float = DEFAULT_TIMEOUT):
+        self._path = Path(path) if path else default_socket_path()
+        self._timeout = timeout
+
+    def request(self, cmd: str, **args) -> Dict[str, Any]:
+        """
+        Execute a command on the daemon and return its result.
+
+        Raises:
+            ControlUnavailable: no daemon is listening
+            ControlError: the daemon rejected the request
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self._timeout)
+
+        try:
+            try:
+                sock.connect(str(self._path))
+            except (FileNotFoundError, ConnectionRefusedError) as exc:
+                raise ControlUnavailable(f"Daemon not reachable at {self._path}") from exc
+
+            sock.sendall(encode({"cmd": cmd, "args": args}))
+            response = decode(self._read_line(sock))
+        except OSError as exc:
+            raise ControlError(f"Control request failed: {exc}") from exc
+        except ValueError as exc:
+            raise ControlError(f"Malformed response: {exc}") from exc
+        finally:
+            sock.close()
+
+        if not response.get("ok"):
+            raise ControlError(response.get("error") or "request failed")
+
+        return response.get("result") or {}
+
+    @staticmethod
+    def _read_line(sock: socket.socket) -> bytes:
+        buffer = b""
+        while b"\n" not in buffer:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            buffer += chunk
+            if len(buffer) > MAX_MESSAGE:
+                raise ValueError("response too large")
+        return buffer.split(b"\n", 1)[0]
+
+
+def try_request(cmd: str, **args) -> Optional[Dict[str, Any]]:
+    """
+    Send a request if a daemon is running.
+
+    Returns None when no daemon listens (caller falls back to state.json).
+    """
+    try:
+        return ControlClient().request(cmd, **args)
+    except ControlUnavailable:
+        return None
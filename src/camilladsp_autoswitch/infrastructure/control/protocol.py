@@ -0,0 +1,62 @@
+"""
+Control protocol between cdspctl and the daemon.
+
+Transport: Unix stream socket, one JSON object per line.
+
+Request:   {"cmd": "mode", "args": {"mode": "manual"}}
+Response:  {"ok": true, "result": {...}}
+           {"ok": false, "error": "..."}
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+from camilladsp_autoswitch.infrastructure import runtime_state
+
+
+SOCKET_NAME = "control.sock"
+
+MAX_MESSAGE = 64 * 1024
+
+COMMANDS = frozenset({
+    "status",
+    "mode",
+    "profile",
+    "variant",
+    "experimental",
+    "stats",
+    "trace",
+})
+
+
+class ControlError(Exception):
+    """Raised when a control request fails on the daemon side."""
+
+
+class ControlUnavailable(ControlError):
+    """Raised when no daemon is listening on the control socket."""
+
+
+def default_socket_path() -> Path:
+    """
+    Control socket location.
+
+    Default: <state dir>/control.sock, override with CDSP_CONTROL_SOCKET.
+    """
+    override = os.environ.get("CDSP_CONTROL_SOCKET")
+    if override:
+        return Path(override)
+    return runtime_state.STATE_DIR / SOCKET_NAME
+
+
+def encode(message: Dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def decode(line: bytes) -> Dict[str, Any]:
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("message must be a JSON object")
+    return message
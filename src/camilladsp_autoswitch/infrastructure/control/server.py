@@ -0,0 +1,272 @@
+"""
+Control socket server (daemon side).
+
+Executes cdspctl commands synchronously and acknowledges them with
+the resulting state and the outcome of any switch they triggered.
+
+state.json stays the single source of truth: every mutation is
+persisted with update_state() first, then pushed onto the bus through
+the StateTracker (which also de-duplicates the inotify notification
+that follows).
+"""
+
+from dataclasses import asdict
+import logging
+import os
+from pathlib import Path
+import socket
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from camilladsp_autoswitch.domain.events import IntentExecuted
+from camilladsp_autoswitch.infrastructure.control.protocol import (
+    COMMANDS,
+    MAX_MESSAGE,
+    decode,
+    default_socket_path,
+    encode,
+)
+from camilladsp_autoswitch.infrastructure.runtime_state import (
+    load_state,
+    update_state,
+)
+from camilladsp_autoswitch.infrastructure.watchers.base import EventSource
+
+logger = logging.getLogger(__name__)
+
+SOCKET_MODE = 0o660
+# Whole-request budget per client (read, then write). Clients are local
+# and send one short line at once; a slower one is dropped so it cannot
+# stall the event loop.
+CLIENT_TIMEOUT = 0.05
+
+MODES = ("auto", "manual")
+
+
+class ControlServer(EventSource):
+    """
+    Unix socket server implementing the control protocol.
+
+    Implements the event-source protocol (see watchers.base).
+    Clients are local and send a single short line, so each accepted
+    connection is served inline, within CLIENT_TIMEOUT for reading the
+    request and again for writing the reply.
+    """
+
+    thread_name = "cdsp-control"
+
+    def __init__(
+        self,
+        bus,
+        *,
+        tracker,
+        path: Optional[Path] = None,
+        stats: Optional[Callable[[], Dict[str, Any]]] = None,
+        traces=None,
+        flush: Optional[Callable[[], None]] = None,
+    ):
+        self._bus = bus
+        self._tracker = tracker
+        self._path = Path(path) if path else default_socket_path()
+        self._stats: List[Callable[[], Dict[str, Any]]] = [stats] if stats else []
+        self._traces = traces
+        self._flush = flush
+
+        self._started = time.monotonic()
+        self._requests = 0
+        self._last_executed: Optional[IntentExecuted] = None
+        self._capture: Optional[List[IntentExecuted]] = None
+
+        self._sock = self._bind()
+
+        bus.subscribe(IntentExecuted, self._on_executed)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def register_stats(self, provider: Callable[[], Dict[str, Any]]) -> None:
+        """Add a provider whose dict is merged into the `stats` reply."""
+        self._stats.append(provider)
+
+    # ------------------------------------------------------------------
+    # Event-source protocol
+    # ------------------------------------------------------------------
+
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+    def on_readable(self) -> None:
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            with conn:
+                self._serve(conn)
+
+    def close(self) -> None:
+        self._sock.close()
+        try:
+            self._path.unlink()
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute one request and build its response. Never raises.
+        """
+        self._requests += 1
+
+        cmd = request.get("cmd")
+        args = request.get("args") or {}
+
+        if cmd not in COMMANDS:
+            return {"ok": False, "error": f"Unknown command: {cmd}"}
+
+        try:
+            result = getattr(self, f"_cmd_{cmd}")(**args)
+        except (TypeError, ValueError) as exc:
+            return {"ok": False, "error": str(exc)}
+        except PermissionError as exc:
+            return {"ok": False, "error": f"Permission error: {exc}"}
+        except Exception as exc:
+            logger.exception("Control command %s failed", cmd)
+            return {"ok": False, "error": f"Internal error: {exc}"}
+
+        return {"ok": True, "result": result}
+
+    def _cmd_status(self) -> Dict[str, Any]:
+        return {
+            "state": asdict(load_state()),
+            "daemon": {
+                "pid": os.getpid(),
+                "uptime": round(time.monotonic() - self._started, 3),
+                "last_switch": _event_dict(self._last_executed),
+            },
+        }
+
+    def _cmd_mode(self, mode: str) -> Dict[str, Any]:
+        if mode not in MODES:
+            raise ValueError(f"Invalid mode '{mode}'. Use: {', '.join(MODES)}")
+        return self._mutate(mode=mode)
+
+    def _cmd_profile(self, name: str) -> Dict[str, Any]:
+        return self._mutate(profile=name)
+
+    def _cmd_variant(self, name: str) -> Dict[str, Any]:
+        return self._mutate(variant=name)
+
+    def _cmd_experimental(self, path: Optional[str] = None) -> Dict[str, Any]:
+        if path is not None and not Path(path).exists():
+            raise ValueError(f"YAML file not found: {path}")
+        return self._mutate(experimental_yml=path)
+
+    def _cmd_stats(self) -> Dict[str, Any]:
+        stats = {
+            "requests": self._requests,
+            "uptime": round(time.monotonic() - self._started, 3),
+        }
+        for provider in self._stats:
+            stats.update(provider())
+        return stats
+
+    def _cmd_trace(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        if self._traces is None:
+            raise ValueError("Tracing is disabled in this daemon")
+        if limit is not None and not isinstance(limit, int):
+            raise ValueError(f"Invalid limit: {limit!r}")
+        return {"traces": self._traces.traces(limit)}
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _mutate(self, **changes) -> Dict[str, Any]:
+        state = update_state(**changes)
+
+        executed: List[IntentExecuted] = []
+        self._capture = executed
+        try:
+            self._tracker.refresh()
+            if self._flush is not None:
+                # Switches may be deferred (latest-wins scheduler)
+                self._flush()
+        finally:
+            self._capture = None
+
+        return {
+            "state": asdict(state),
+            "executed": [_event_dict(event) for event in executed],
+        }
+
+    def _on_executed(self, event: IntentExecuted) -> None:
+        self._last_executed = event
+        if self._capture is not None:
+            self._capture.append(event)
+
+    def _serve(self, conn: socket.socket) -> None:
+        deadline = time.monotonic() + CLIENT_TIMEOUT
+        try:
+            buffer = b""
+            while b"\n" not in buffer and len(buffer) <= MAX_MESSAGE:
+                # One budget for the whole request, not per recv():
+                # a client trickling bytes is cut off all the same
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise socket.timeout("request not received in time")
+                conn.settimeout(remaining)
+                chunk = conn.recv(4096)
+                if not chunk:
+                    break
+                buffer += chunk
+
+            try:
+                request = decode(buffer.split(b"\n", 1)[0])
+            except ValueError as exc:
+                response = {"ok": False, "error": f"Malformed request: {exc}"}
+            else:
+                response = self.dispatch(request)
+
+            conn.settimeout(CLIENT_TIMEOUT)
+            conn.sendall(encode(response))
+        except OSError as exc:
+            logger.warning("Control client dropped: %s", exc)
+
+    def _bind(self) -> socket.socket:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_socket()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(str(self._path))
+            os.chmod(self._path, SOCKET_MODE)
+            sock.listen(8)
+            sock.setblocking(False)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def _remove_stale_socket(self) -> None:
+        if not self._path.exists():
+            return
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self._path))
+        except OSError:
+            # Nobody listening: left over from a previous run
+            self._path.unlink()
+        else:
+            raise OSError(f"Another daemon is listening on {self._path}")
+        finally:
+            probe.close()
+
+
+def _event_dict(event: Optional[IntentExecuted]) -> Optional[Dict[str, Any]]:
+    return asdict(event) if event is not None else None
@@ -0,0 +1,38 @@
+"""
+Bus → status segment adapter (daemon side).
+
+Kept apart from status_segment so readers (cdspctl status --fast)
+do not import the domain events.
+"""
+
+from typing import Optional
+
+from camilladsp_autoswitch.domain.events import IntentExecuted, ModeChanged
+from camilladsp_autoswitch.infrastructure.control.status_segment import StatusSegment
+
+
+class StatusPublisher:
+    """
+    Mirrors switch outcomes and mode changes from the bus into a segment.
+    """
+
+    def __init__(self, bus, segment: StatusSegment, *, mode: str, profile: str, variant: Optional[str]):
+        self._segment = segment
+        segment.update(mode=mode, profile=profile, variant=variant)
+
+        bus.subscribe(IntentExecuted, self._on_executed)
+        bus.subscribe(ModeChanged, self._on_mode)
+
+    def _on_executed(self, event: IntentExecuted) -> None:
+        applied = event.outcome == "applied"
+        self._segment.update(
+            profile=event.profile if applied else None,
+            variant=event.variant,
+            outcome=event.outcome,
+            yaml=event.yaml,
+            latency=event.latency,
+            switched=applied,
+        )
+
+    def _on_mode(self, event: ModeChanged) -> None:
+        self._segment.update(mode=event.mode)
@@ -0,0 +1,313 @@
+"""
+Shared-memory status segment.
+
+The daemon publishes its live status in a small fixed-layout file
+under /dev/shm, mapped by readers. Polling it costs no process spawn,
+no socket round-trip and no JSON: once mapped, a read is a few
+memory loads.
+
+Layout (little endian, SEGMENT_SIZE bytes):
+
+    0   8s   magic "CDSPSTAT"
+    8   I    layout version
+    12  I    sequence (odd while the writer is updating)
+    16  I    crc32 of the body
+    20  4x
+    24  body (see _BODY)
+
+Consistency is a seqlock: the writer bumps the sequence to odd,
+writes the body and checksum, then bumps it to even. Readers retry
+while the sequence is odd or changed under them. Python offers no
+memory fences, so the body checksum guards against torn reads on
+weakly ordered CPUs.
+
+There is a single writer process (the daemon, whose threads are
+serialized by a lock); readers never write.
+"""
+
+from dataclasses import dataclass
+import mmap
+import os
+from pathlib import Path
+import struct
+import threading
+import time
+import zlib
+from typing import Optional
+
+from camilladsp_autoswitch.infrastructure import runtime_state
+
+MAGIC = b"CDSPSTAT"
+LAYOUT_VERSION = 1
+
+SHM_DIR = Path("/dev/shm")
+SEGMENT_NAME = "cdsp-autoswitch.status"
+
+_HEADER = struct.Struct("<8sIII4x")
+_SEQ = struct.Struct("<I")
+_SEQ_OFFSET = 12
+_CRC_OFFSET = 16
+
+# pid, switch count, last switch (unix time), last apply latency (s),
+# mode, profile, variant, last outcome, last yaml
+_BODY = struct.Struct("<IQdd16s64s64s16s256s")
+_BODY_OFFSET = _HEADER.size
+
+SEGMENT_SIZE = _BODY_OFFSET + _BODY.size
+
+MAX_READ_ATTEMPTS = 1000
+
+
+class StatusSegmentError(Exception):
+    """Raised when the status segment is missing, foreign or unreadable."""
+
+
+@dataclass(frozen=True)
+class StatusSnapshot:
+    """
+    One consistent read of the status segment.
+    """
+    pid: int
+    mode: str
+    profile: str
+    variant: Optional[str]
+    switch_count: int
+    last_switch: Optional[float]
+    last_apply_latency: Optional[float]
+    last_outcome: Optional[str]
+    last_yaml: Optional[str]
+    sequence: int
+
+
+def default_segment_path() -> Path:
+    """
+    Segment location.
+
+    Default: /dev/shm/cdsp-autoswitch.status (the state directory when
+    /dev/shm does not exist), override with CDSP_STATUS_SEGMENT.
+    """
+    override = os.environ.get("CDSP_STATUS_SEGMENT")
+    if override:
+        return Path(override)
+    if SHM_DIR.is_dir():
+        return SHM_DIR / SEGMENT_NAME
+    return runtime_state.STATE_DIR / SEGMENT_NAME
+
+
+# ----------------------------------------------------------------------
+# Writer (daemon)
+# ----------------------------------------------------------------------
+
+class StatusSegment:
+    """
+    Writer side of the segment.
+
+    The file is initialized under a temporary name and renamed into
+    place, so readers never map a half-initialized segment.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = Path(path) if path else default_segment_path()
+        self._seq = 0
+        self._lock = threading.Lock()
+
+        self._pid = os.getpid()
+        self._mode = ""
+        self._profile = ""
+        self._variant: Optional[str] = None
+        self._switch_count = 0
+        self._last_switch = 0.0
+        self._last_latency = 0.0
+        self._last_outcome = ""
+        self._last_yaml = ""
+
+        self._create()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def update(
+        self,
+        *,
+        mode: Optional[str] = None,
+        profile: Optional[str] = None,
+        variant: Optional[str] = None,
+        outcome: Optional[str] = None,
+        yaml: Optional[str] = None,
+        latency: Optional[float] = None,
+        switched: bool = False,
+    ) -> None:
+        """
+        Publish new values; omitted fields keep their current value
+        (variant is always set together with profile).
+
+        switched=True counts a switch and stamps it with the current time.
+        """
+        with self._lock:
+            if mode is not None:
+                self._mode = mode
+            if profile is not None:
+                self._profile = profile
+                self._variant = variant
+            if outcome is not None:
+                self._last_outcome = outcome
+            if yaml is not None:
+                self._last_yaml = yaml
+
+            if switched:
+                self._switch_count += 1
+                self._last_switch = time.time()
+                self._last_latency = latency or 0.0
+
+            self._publish()
+
+    def close(self) -> None:
+        """Unmap and remove the segment (readers then see no daemon)."""
+        self._map.close()
+        try:
+            self._path.unlink()
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _create(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_name(f".{self._path.name}.{os.urandom(4).hex()}.tmp")
+
+        fd = os.open(tmp, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            os.ftruncate(fd, SEGMENT_SIZE)
+            segment = mmap.mmap(fd, SEGMENT_SIZE, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        except BaseException:
+            os.close(fd)
+            tmp.unlink(missing_ok=True)
+            raise
+        os.close(fd)
+
+        try:
+            _HEADER.pack_into(segment, 0, MAGIC, LAYOUT_VERSION, 0, 0)
+            self._map = segment
+            self._publish()
+            os.replace(tmp, self._path)
+        except BaseException:
+            segment.close()
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def _publish(self) -> None:
+        body = _BODY.pack(
+            self._pid,
+            self._switch_count,
+            self._last_switch,
+            self._last_latency,
+            _encode(self._mode, 16),
+            _encode(self._profile, 64),
+            _encode(self._variant or "", 64),
+            _encode(self._last_outcome, 16),
+            _encode(self._last_yaml, 256),
+        )
+
+        self._seq += 1
+        _SEQ.pack_into(self._map, _SEQ_OFFSET, self._seq)
+
+        self._map[_BODY_OFFSET:_BODY_OFFSET + _BODY.size] = body
+        _SEQ.pack_into(self._map, _CRC_OFFSET, zlib.crc32(body))
+
+        self._seq += 1
+        _SEQ.pack_into(self._map, _SEQ_OFFSET, self._seq)
+
+
+# ----------------------------------------------------------------------
+# Reader
+# ----------------------------------------------------------------------
+
+class StatusReader:
+    """
+    Maps the segment once; every read() is served from memory.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        path = Path(path) if path else default_segment_path()
+
+        try:
+            with open(path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), SEGMENT_SIZE, mmap.MAP_SHARED, mmap.PROT_READ)
+        except (OSError, ValueError) as exc:
+            raise StatusSegmentError(f"Status segment not available at {path}: {exc}") from exc
+
+        magic, version, _, _ = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION:
+            self._map.close()
+            raise StatusSegmentError(f"Unsupported status segment at {path}")
+
+    def read(self) -> StatusSnapshot:
+        segment = self._map
+        end = _BODY_OFFSET + _BODY.size
+
+        for _ in range(MAX_READ_ATTEMPTS):
+            seq = _SEQ.unpack_from(segment, _SEQ_OFFSET)[0]
+            if seq & 1:
+                os.sched_yield()
+                continue
+
+            body = segment[_BODY_OFFSET:end]
+            crc = _SEQ.unpack_from(segment, _CRC_OFFSET)[0]
+
+            if _SEQ.unpack_from(segment, _SEQ_OFFSET)[0] == seq and zlib.crc32(body) == crc:
+                return _snapshot(body, seq)
+
+        raise StatusSegmentError("Status segment busy (writer stalled?)")
+
+    def close(self) -> None:
+        self._map.close()
+
+
+def read_status(path: Optional[Path] = None) -> Optional[StatusSnapshot]:
+    """
+    One-shot read. Returns None when no daemon publishes a segment.
+    """
+    try:
+        reader = StatusReader(path)
+    except StatusSegmentError:
+        return None
+    try:
+        return reader.read()
+    finally:
+        reader.close()
+
+
+# ----------------------------------------------------------------------
+# Encoding
+# ----------------------------------------------------------------------
+
+def _encode(value: str, size: int) -> bytes:
+    data = value.encode("utf-8")
+    if len(data) <= size:
+        return data
+    # Truncate on a character boundary
+    return data[:size].decode("utf-8", "ignore").encode("utf-8")
+
+
+def _decode(raw: bytes) -> str:
+    return raw.rstrip(b"\0").decode("utf-8", "replace")
+
+
+def _snapshot(body: bytes, seq: int) -> StatusSnapshot:
+    pid, count, last_switch, latency, mode, profile, variant, outcome, yaml = _BODY.unpack(body)
+
+    return StatusSnapshot(
+        pid=pid,
+        mode=_decode(mode),
+        profile=_decode(profile),
+        variant=_decode(variant) or None,
+        switch_count=count,
+        last_switch=last_switch if count else None,
+        last_apply_latency=latency if count else None,
+        last_outcome=_decode(outcome) or None,
+        last_yaml=_decode(yaml) or None,
+        sequence=seq,
+    )
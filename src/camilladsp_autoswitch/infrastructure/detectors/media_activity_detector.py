@@ -4,7 +4,9 @@ from camilladsp_autoswitch.domain.events import (
     ProcessStarted,
     ProcessStopped,
     MediaActivityChanged,
+    intern_event,
 )
+from camilladsp_autoswitch.domain.tracing import follow
 
 
 class MediaActivityDetector:
@@ -12,6 +14,7 @@ class MediaActivityDetector:
         self.bus = bus
         self.media_processes = set(media_processes or ["kodi"])
         self.active_processes = set()
+        self.announced = False
 
         bus.subscribe(ProcessStarted, self.on_start)
         bus.subscribe(ProcessStopped, self.on_stop)
@@ -22,11 +25,25 @@ class MediaActivityDetector:
             self.active_processes.add(event.name)
 
             if was_idle:
-                self.bus.publish(MediaActivityChanged(active=True))
+                self.announced = True
+                self.bus.publish(intern_event(MediaActivityChanged, True, trace=follow(event.trace)))
 
     def on_stop(self, event):
         if event.name in self.media_processes:
             self.active_processes.discard(event.name)
 
             if not self.active_processes:
-                self.bus.publish(MediaActivityChanged(active=False))
+                self.announced = True
+                self.bus.publish(intern_event(MediaActivityChanged, False, trace=follow(event.trace)))
+
+    def announce(self):
+        """
+        Publish the current activity once, after the initial process scan.
+
+        A start is already published by on_start; without any media
+        process nothing changes, so the idle state is published here
+        (otherwise no profile is applied until something starts).
+        """
+        if not self.announced:
+            self.announced = True
+            self.bus.publish(intern_event(MediaActivityChanged, bool(self.active_processes)))
@@ -0,0 +1,211 @@
+"""
+Process start/stop watcher.
+
+Publishes ProcessStarted / ProcessStopped for a set of process names
+(matched like `pgrep -x`, on the kernel process name).
+
+- Exits are event-driven: each running process is held through a
+  pidfd (Linux >= 5.3), which becomes readable when it exits
+- Starts are found by a low-frequency /proc scan, only while some
+  watched name is not running
+- Without pidfd support the scan also detects exits
+"""
+
+import logging
+import os
+from pathlib import Path
+import select
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from camilladsp_autoswitch.domain.events import ProcessStarted, ProcessStopped
+from camilladsp_autoswitch.infrastructure.watchers.base import EventSource
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCAN_INTERVAL = 2.0
+
+# Kernel process names (comm) are truncated to 15 bytes
+COMM_LENGTH = 15
+
+PROC_DIR = Path("/proc")
+
+
+class ProcessWatcher(EventSource):
+    """
+    Implements the event-source protocol (see watchers.base).
+
+    fileno() is an epoll fd grouping the pidfds of running processes.
+    """
+
+    thread_name = "cdsp-process-watcher"
+
+    def __init__(
+        self,
+        bus,
+        names: Iterable[str],
+        *,
+        scan_interval: float = DEFAULT_SCAN_INTERVAL,
+        proc_dir: Path = PROC_DIR,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._bus = bus
+        self._names = {name[:COMM_LENGTH]: name for name in names}
+        self._scan_interval = scan_interval
+        self._proc_dir = Path(proc_dir)
+        self._clock = clock
+
+        self._epoll = select.epoll()
+        # name → pidfd of one running instance (None: running, no pidfd)
+        self._running: Dict[str, Optional[int]] = {}
+        self._names_by_fd: Dict[int, str] = {}
+
+        # First scan as soon as the loop starts
+        self._next_scan: Optional[float] = self._clock()
+
+        # Cost of the polling fallback (exported as metrics)
+        self.scans = 0
+        self.scan_seconds = 0.0
+
+    @property
+    def running(self) -> frozenset:
+        return frozenset(self._running)
+
+    # ------------------------------------------------------------------
+    # Event-source protocol
+    # ------------------------------------------------------------------
+
+    def fileno(self) -> int:
+        return self._epoll.fileno()
+
+    def on_readable(self) -> None:
+        for fd, _ in self._epoll.poll(0):
+            name = self._names_by_fd.get(fd)
+            if name is not None:
+                self._release(name)
+                self._running[name] = None
+
+        # Another instance may still be running
+        self.scan()
+
+    def next_timeout(self) -> Optional[float]:
+        if self._next_scan is None:
+            return None
+        return max(0.0, self._next_scan - self._clock())
+
+    def on_timeout(self) -> None:
+        if self._next_scan is not None and self._next_scan <= self._clock():
+            self.scan()
+
+    def close(self) -> None:
+        for name in list(self._running):
+            self._release(name)
+        self._epoll.close()
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def scan(self) -> None:
+        """Reconcile with /proc and publish what started or stopped."""
+        started_at = time.perf_counter()
+        found = self._find_processes()
+        self.scans += 1
+        self.scan_seconds += time.perf_counter() - started_at
+
+        for comm, name in self._names.items():
+            pid = found.get(comm)
+
+            if pid is None:
+                if name in self._running:
+                    self._release(name)
+                    del self._running[name]
+                    logger.info("Process stopped: %s", name)
+                    self._bus.publish(ProcessStopped(name=name))
+                continue
+
+            started = name not in self._running
+            if self._running.get(name) is None:
+                self._running[name] = self._hold(name, pid, comm)
+
+            if started:
+                logger.info("Process started: %s (pid %d)", name, pid)
+                self._bus.publish(ProcessStarted(name=name))
+
+        # Keep scanning only while something cannot be waited on
+        needs_scan = len(self._running) < len(self._names) or None in self._running.values()
+        self._next_scan = self._clock() + self._scan_interval if needs_scan else None
+
+    def _find_processes(self) -> Dict[str, int]:
+        found: Dict[str, int] = {}
+        try:
+            entries = os.listdir(self._proc_dir)
+        except OSError:
+            return found
+
+        for entry in entries:
+            if not entry.isdigit():
+                continue
+            comm = self._read_comm(entry)
+            if comm in self._names and comm not in found and not self._is_zombie(entry):
+                found[comm] = int(entry)
+                if len(found) == len(self._names):
+                    break
+        return found
+
+    def _read_comm(self, pid) -> Optional[str]:
+        data = self._read_proc(pid, "comm")
+        return data.rstrip("\n") if data is not None else None
+
+    def _is_zombie(self, pid) -> bool:
+        # An exited but unreaped process keeps its /proc entry;
+        # its pidfd would be readable forever.
+        stat = self._read_proc(pid, "stat")
+        return stat is not None and stat[stat.rfind(")") + 2:].startswith("Z")
+
+    def _read_proc(self, pid, name: str) -> Optional[str]:
+        try:
+            fd = os.open(self._proc_dir / str(pid) / name, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            return os.read(fd, 1024).decode("utf-8", "replace")
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+
+    # ------------------------------------------------------------------
+    # pidfds
+    # ------------------------------------------------------------------
+
+    def _hold(self, name: str, pid: int, comm: str) -> Optional[int]:
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is None:
+            return None
+
+        try:
+            pidfd = pidfd_open(pid)
+        except OSError:
+            # Already gone, or kernel without pidfd: the scan will tell
+            return None
+
+        # The pid may have been reused between the scan and pidfd_open
+        if self._read_comm(pid) != comm:
+            os.close(pidfd)
+            return None
+
+        self._epoll.register(pidfd, select.EPOLLIN)
+        self._names_by_fd[pidfd] = name
+        return pidfd
+
+    def _release(self, name: str) -> None:
+        pidfd = self._running.get(name)
+        if pidfd is None:
+            return
+        self._names_by_fd.pop(pidfd, None)
+        try:
+            self._epoll.unregister(pidfd)
+        except OSError:
+            pass
+        os.close(pidfd)
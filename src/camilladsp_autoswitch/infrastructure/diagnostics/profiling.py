@@ -0,0 +1,159 @@
+"""
+On-demand diagnostics for a running daemon.
+
+- CpuProfiler: toggled cProfile session, written as a .prof file
+- MemorySnapshots: tracemalloc snapshot diffs, written as text reports
+- enable_stack_dumps: faulthandler stack dumps on a signal (and on
+  fatal errors / SIGABRT from the systemd watchdog)
+
+Rules:
+- Nothing is traced until asked: an idle daemon pays no overhead
+- Reports go to the state directory and their path is logged
+- Write failures are logged, not raised: diagnostics must not take
+  the daemon down
+"""
+
+import cProfile
+import faulthandler
+import linecache
+import logging
+import os
+from pathlib import Path
+import signal
+import sys
+import time
+import tracemalloc
+from typing import Optional
+
+from camilladsp_autoswitch.infrastructure import runtime_state
+
+logger = logging.getLogger(__name__)
+
+STACK_DUMP_SIGNAL = signal.SIGQUIT
+
+# Frames kept per allocation: enough to tell callers apart
+TRACEMALLOC_FRAMES = 8
+REPORT_TOP = 25
+
+
+def _report_path(directory: Optional[Path], kind: str, suffix: str) -> Path:
+    directory = Path(directory) if directory else runtime_state.STATE_DIR
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return directory / f"{kind}-{os.getpid()}-{stamp}{suffix}"
+
+
+class CpuProfiler:
+    """
+    cProfile session toggled on and off (SIGUSR1 in the daemon).
+
+    Profiles the thread that calls toggle(), i.e. the event loop.
+    Inspect results with `python -m pstats <file>` or snakeviz.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self._directory = directory
+        self._profile: Optional[cProfile.Profile] = None
+
+    @property
+    def active(self) -> bool:
+        return self._profile is not None
+
+    def toggle(self) -> Optional[Path]:
+        """Start a session, or stop it and return the written .prof file."""
+        if self._profile is None:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+            logger.info("CPU profiling started")
+            return None
+
+        profile, self._profile = self._profile, None
+        profile.disable()
+
+        path = _report_path(self._directory, "cpu", ".prof")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(path)
+        except OSError as exc:
+            logger.error("Cannot write CPU profile: %s", exc)
+            return None
+
+        logger.info("CPU profile written to %s", path)
+        return path
+
+
+class MemorySnapshots:
+    """
+    tracemalloc snapshots diffed against the previous one (SIGUSR2).
+
+    The first call starts tracing and takes the baseline; each later
+    call writes the top allocation growth since the previous call.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        *,
+        frames: int = TRACEMALLOC_FRAMES,
+        top: int = REPORT_TOP,
+    ):
+        self._directory = directory
+        self._frames = frames
+        self._top = top
+        self._previous: Optional[tracemalloc.Snapshot] = None
+
+    def take(self) -> Optional[Path]:
+        """Snapshot now; returns the diff report path (None for the baseline)."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._frames)
+            self._previous = None
+
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, linecache.__file__),
+        ))
+        previous, self._previous = self._previous, snapshot
+
+        if previous is None:
+            logger.info("Memory tracing started, baseline taken")
+            return None
+
+        path = _report_path(self._directory, "memory", ".txt")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(self._report(snapshot.compare_to(previous, "traceback")))
+        except OSError as exc:
+            logger.error("Cannot write memory report: %s", exc)
+            return None
+
+        logger.info("Memory diff written to %s", path)
+        return path
+
+    def stop(self) -> None:
+        self._previous = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _report(self, stats) -> str:
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [
+            f"traced: {current / 1024:.1f} KiB (peak {peak / 1024:.1f} KiB)",
+            f"top {self._top} differences since previous snapshot:",
+            "",
+        ]
+        for stat in stats[:self._top]:
+            lines.append(
+                f"{stat.size_diff / 1024:+.1f} KiB ({stat.count_diff:+d} blocks), "
+                f"now {stat.size / 1024:.1f} KiB"
+            )
+            lines.extend(f"    {line}" for line in stat.traceback.format(most_recent_first=True))
+        return "\n".join(lines) + "\n"
+
+
+def enable_stack_dumps(signum: int = STACK_DUMP_SIGNAL, file=None) -> None:
+    """
+    Dump all thread stacks to stderr (the journal) on `signum`, and
+    on fatal errors. Runs in C: works even when the loop is wedged.
+    """
+    file = file or sys.stderr
+    faulthandler.enable(file=file, all_threads=True)
+    faulthandler.register(signum, file=file, all_threads=True, chain=False)
@@ -11,11 +11,15 @@ class EventStore:
     def append(self, event):
         self._events.append(event)
 
+    def __len__(self):
+        return len(self._events)
+
     def all(self):
         return list(self._events)
 
     def replay(self, bus):
-        for event in self._events:
+        # Snapshot: replayed events are recorded again while publishing
+        for event in self.all():
             bus.publish(event)
 
 
@@ -1,9 +1,13 @@
+from camilladsp_autoswitch.domain.events import untraced
 from camilladsp_autoswitch.event_bus import EventBus
 from camilladsp_autoswitch.infrastructure.eventing.event_store import EventStore
 
 class EventStoreSubscriber:
     """
     Records all published events into an EventStore.
+
+    Events are stored without their trace context (kept by the
+    TraceBuffer instead), so that identical events stay shared.
     """
 
     def __init__(self, bus, store):
@@ -11,4 +15,4 @@ class EventStoreSubscriber:
         bus.subscribe(object, self._record)
 
     def _record(self, event):
-        self._store.append(event)
+        self._store.append(untraced(event))
@@ -0,0 +1,103 @@
+"""
+Bounded in-memory buffer of trace spans.
+
+Every traced event on the bus becomes an instant span (its creation
+time); IntentExecuted adds one span per executor stage (resolve,
+validate, apply). Grouped by trace id, this shows where a slow switch
+spent its time, from the detector to CamillaDSP.
+
+Rules:
+- Fixed memory: the oldest spans are dropped first (the oldest trace
+  in a dump may therefore be partial)
+- Recording is one tuple append on the bus path
+"""
+
+from collections import deque
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from camilladsp_autoswitch.domain import tracing
+from camilladsp_autoswitch.domain.events import IntentExecuted
+
+DEFAULT_MAX_SPANS = 1024
+
+
+class Span(NamedTuple):
+    trace_id: int
+    name: str
+    start: float
+    end: float
+    trace_started: float
+
+
+class TraceBuffer:
+    """
+    Records spans of every traced event published on the bus.
+
+    Creating a buffer turns tracing on (see domain.tracing).
+    """
+
+    def __init__(self, bus, *, max_spans: int = DEFAULT_MAX_SPANS):
+        self._spans: deque = deque(maxlen=max_spans)
+        tracing.enable()
+        bus.subscribe(object, self._on_event)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+    def traces(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Dump recorded traces, oldest first (the `limit` most recent).
+
+        Offsets and durations are in milliseconds from the root event.
+        """
+        grouped: Dict[int, List[Span]] = {}
+        for span in list(self._spans):
+            grouped.setdefault(span.trace_id, []).append(span)
+
+        trace_ids = list(grouped)
+        if limit is not None:
+            trace_ids = trace_ids[-limit:] if limit > 0 else []
+
+        return [_describe(trace_id, grouped[trace_id]) for trace_id in trace_ids]
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _on_event(self, event) -> None:
+        trace = getattr(event, "trace", None)
+        if trace is None:
+            return
+
+        append = self._spans.append
+        append(Span(trace.trace_id, type(event).__name__, trace.at, trace.at, trace.started))
+
+        if isinstance(event, IntentExecuted):
+            for name, start, end in event.stages:
+                append(Span(trace.trace_id, name, start, end, trace.started))
+
+
+def _describe(trace_id: int, spans: List[Span]) -> Dict[str, Any]:
+    spans = sorted(spans, key=lambda span: (span.start, span.end))
+    started = spans[0].trace_started
+
+    return {
+        "trace_id": trace_id,
+        "root": spans[0].name,
+        "duration_ms": _ms(max(span.end for span in spans) - started),
+        "spans": [
+            {
+                "name": span.name,
+                "offset_ms": _ms(span.start - started),
+                "duration_ms": _ms(span.end - span.start),
+            }
+            for span in spans
+        ],
+    }
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
@@ -0,0 +1,168 @@
+"""
+Minimum dwell limiter.
+
+Reloading CamillaDSP is expensive for some configs (long FIR filters
+are loaded and the pipeline is reset). After a profile is applied it
+is held for its dwell time; intents arriving inside that window are
+deferred, not dropped:
+
+- the newest deferred intent replaces older ones (latest wins)
+- one timer, armed at the end of the window, submits it
+
+A reload storm therefore costs at most one reload per dwell window.
+A deferred intent that turns out to target the applied profile costs
+nothing (the executor deduplicates it).
+
+Intents the user asked for (manual mode, a forced profile, an
+experimental YAML) are never held: they go through at once and
+replace any deferred automatic intent.
+
+Timers:
+- call_later=loop.call_later in the daemon (the release runs on the
+  event loop thread)
+- a threading.Timer otherwise
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# SwitchIntent reasons published on behalf of a control command
+FORCED_REASONS = frozenset({"manual_mode", "manual_profile", "experimental"})
+
+
+def thread_call_later(delay: float, callback: Callable[[], None]) -> threading.Timer:
+    """call_later fallback when no event loop runs."""
+    timer = threading.Timer(delay, callback)
+    timer.daemon = True
+    timer.start()
+    return timer
+
+
+class DwellLimiter:
+    """
+    Holds intents while the applied profile's dwell time runs.
+
+    Rules:
+    - dwell_for(profile, variant) -> seconds (0 disables the hold)
+    - applied() starts the window, submit() honours it
+    - Intents are never reordered: the released one is always the newest
+    - Intents whose reason is in `bypass` are forwarded at once
+    """
+
+    def __init__(
+        self,
+        submit: Callable[[Any], None],
+        *,
+        dwell_for: Callable[[str, Optional[str]], float],
+        call_later: Callable[[float, Callable[[], None]], Any] = thread_call_later,
+        clock: Callable[[], float] = time.monotonic,
+        bypass: Iterable[str] = FORCED_REASONS,
+    ):
+        self._submit = submit
+        self._dwell_for = dwell_for
+        self._call_later = call_later
+        self._clock = clock
+        self._bypass = frozenset(bypass)
+        self._lock = threading.Lock()
+
+        self._hold_until = 0.0
+        self._held = None
+        self._armed = False
+        self._timer = None
+
+        self.deferred = 0
+        self.coalesced = 0
+
+    @property
+    def held(self):
+        return self._held
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "intents_deferred": self.deferred,
+            "intents_coalesced": self.coalesced,
+        }
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+
+    def submit(self, intent) -> None:
+        with self._lock:
+            remaining = self._hold_until - self._clock()
+            if getattr(intent, "reason", None) in self._bypass:
+                # Newer than anything held: the held intent is superseded
+                # (the armed timer then finds nothing to release)
+                forward = True
+                self._held = None
+            elif remaining <= 0 and self._held is None:
+                forward = True
+            else:
+                forward = False
+                self.deferred += 1
+                if self._held is not None:
+                    self.coalesced += 1
+                self._held = intent
+                arm = not self._armed
+                self._armed = True
+
+        if forward:
+            self._submit(intent)
+            return
+
+        logger.debug("Intent deferred %.2fs (dwell): %s", max(remaining, 0.0), intent)
+        if arm:
+            self._arm(max(remaining, 0.0))
+
+    def applied(self, profile: str, variant: Optional[str] = None) -> None:
+        """Start the dwell window of a profile that was just applied."""
+        try:
+            dwell = self._dwell_for(profile, variant)
+        except Exception:
+            logger.exception("Dwell lookup failed for %s", profile)
+            return
+
+        if dwell > 0:
+            with self._lock:
+                self._hold_until = self._clock() + dwell
+
+    def cancel(self) -> None:
+        """Drop the held intent and its timer (shutdown)."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+            self._held = None
+            self._armed = False
+        if timer is not None:
+            timer.cancel()
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _arm(self, delay: float) -> None:
+        timer = self._call_later(delay, self._release)
+        with self._lock:
+            # The timer may already have fired (delay 0, another thread)
+            if self._armed:
+                self._timer = timer
+
+    def _release(self) -> None:
+        with self._lock:
+            self._timer = None
+            remaining = self._hold_until - self._clock()
+            if remaining > 0 and self._held is not None:
+                # The window was extended meanwhile
+                rearm = True
+            else:
+                rearm = False
+                self._armed = False
+                intent, self._held = self._held, None
+
+        if rearm:
+            self._arm(remaining)
+        elif intent is not None:
+            self._submit(intent)
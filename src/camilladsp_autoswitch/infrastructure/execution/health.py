@@ -0,0 +1,184 @@
+"""
+Post-apply health monitor.
+
+CamillaDSP needs a moment after a reload before it reports the new
+config as running. Waiting for it inside the executor would block the
+event loop (and every watcher on it) for up to the health timeout, so
+the check is a small timer-driven state machine instead:
+
+    IntentExecuted("applied") → probe → healthy?   → confirm()
+                                  ↑        │ no
+                                  └─ call_later(poll) until timeout
+                                           │
+                                           └────────→ reject()
+
+Each tick is one short probe (check_fn); nothing sleeps. The verdict
+is handed back to the executor on the same thread: confirm() makes
+the config the last known good, reject() restores the previous one
+and the rollback is published as a second IntentExecuted.
+
+Rules:
+- Only the newest apply is checked: a new apply cancels the running check
+- A verdict for a YAML that is no longer applied is dropped
+- Never raises from a timer callback
+
+Timers:
+- call_later=loop.call_later in the daemon (probes run on the loop thread)
+- a threading.Timer otherwise: ticks then race new applies, so the
+  running check is swapped under a lock (the executor has its own)
+"""
+
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from camilladsp_autoswitch.domain.events import IntentExecuted
+from camilladsp_autoswitch.domain.tracing import follow
+from camilladsp_autoswitch.infrastructure.execution.dwell import thread_call_later
+from camilladsp_autoswitch.infrastructure.execution.intent_executor import IntentExecutor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Check:
+    event: IntentExecuted
+    yaml: Path
+    started: float
+    deadline: float
+    timer: Any = None
+
+
+class HealthMonitor:
+    """
+    Polls check_fn after every apply and settles the verdict.
+
+    check_fn(yaml) -> result with .ok / .reason (one probe, no waiting).
+    """
+
+    def __init__(
+        self,
+        bus,
+        executor: IntentExecutor,
+        *,
+        check_fn: Callable[[Path], Any],
+        timeout: float,
+        poll: float,
+        call_later: Callable[[float, Callable[[], None]], Any] = thread_call_later,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._bus = bus
+        self._executor = executor
+        self._check_fn = check_fn
+        self._timeout = timeout
+        self._poll = poll
+        self._call_later = call_later
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._current: Optional[_Check] = None
+
+        self.passed = 0
+        self.failed = 0
+
+        bus.subscribe(IntentExecuted, self._on_executed)
+
+    @property
+    def checking(self) -> Optional[Path]:
+        """YAML whose health check is running (None if idle)."""
+        return self._current.yaml if self._current is not None else None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "health_checks_passed": self.passed,
+            "health_checks_failed": self.failed,
+        }
+
+    def cancel(self) -> None:
+        """Stop the running check without a verdict (shutdown)."""
+        with self._lock:
+            self._cancel()
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _cancel(self) -> None:
+        check, self._current = self._current, None
+        if check is not None and check.timer is not None:
+            check.timer.cancel()
+
+    def _on_executed(self, event: IntentExecuted) -> None:
+        if event.outcome != "applied":
+            return
+
+        now = self._clock()
+        check = _Check(
+            event=event,
+            yaml=Path(event.yaml),
+            started=now,
+            deadline=now + self._timeout,
+        )
+        with self._lock:
+            self._cancel()
+            self._current = check
+            # Not inline: the publisher of IntentExecuted must not wait
+            self._schedule(check, 0.0)
+
+    def _schedule(self, check: _Check, delay: float) -> None:
+        # Lock held: a timer firing right away waits for check.timer
+        check.timer = self._call_later(delay, lambda: self._tick(check))
+
+    def _tick(self, check: _Check) -> None:
+        with self._lock:
+            if self._current is not check:
+                return  # superseded or cancelled
+
+        # Probe unlocked: a new apply may supersede this check meanwhile
+        try:
+            result = self._check_fn(check.yaml)
+            reason = None if result.ok else result.reason
+        except Exception as exc:
+            reason = f"probe failed: {exc}"
+
+        with self._lock:
+            if self._current is not check:
+                return
+            if reason is not None and self._clock() < check.deadline:
+                self._schedule(check, self._poll)
+                return
+            self._current = None
+
+        try:
+            self._settle(check, reason)
+        except Exception:
+            logger.exception("Settling the health check of %s failed", check.yaml)
+
+    def _settle(self, check: _Check, reason: Optional[str]) -> None:
+        if reason is None:
+            self.passed += 1
+            self._executor.confirm(check.yaml)
+            return
+
+        self.failed += 1
+        stage = ("check", check.started, self._clock())
+        execution = self._executor.reject(check.yaml, reason, stages=(stage,))
+        if execution is None:
+            return
+
+        event = check.event
+        self._bus.publish(
+            IntentExecuted(
+                profile=event.profile,
+                variant=event.variant,
+                yaml=str(execution.yaml),
+                outcome=execution.outcome,
+                reason=execution.reason,
+                latency=None,
+                stages=execution.stages,
+                trace=follow(event.trace),
+            )
+        )
@@ -6,21 +6,109 @@ Responsibilities:
 - Enforce idempotency
 - Never apply invalid YAML
 - Own execution state
+- Time every stage it runs
+- Roll back to the last known good config when an apply fails its
+  health check
 
-This is the execution boundary of the system.
+This is the execution boundary of the system: IntentExecutorHandler
+(the bus adapter) delegates to it.
+
+Fast path, cheapest rejection first:
+
+    resolve → dedup (same YAML as applied?) → validate (cached) → apply
+            → check (health probe, optional)
+
+A repeated intent therefore costs one resolve and one stat(): the
+applied YAML is remembered with its fingerprint (inode, size,
+mtime_ns) and content hash, so a profile edited in place (e.g. before
+a SIGHUP) is applied again. Only a changed fingerprint is rehashed.
+
+Rollback: the text of every config that passed its health check is
+kept in memory (last known good). When an apply raises or the probe
+fails, that text is pushed back with restore_fn in one call; no file
+is read or validated on the recovery path.
+
+With confirm_later=True the probe runs outside execute() (see
+HealthMonitor, which polls without blocking the event loop): an
+applied config only becomes the last known good, and the LastApplied
+record, once confirm() is called; reject() rolls it back.
+
+execute(), confirm() and reject() hold one lock: without an event loop
+the verdict arrives on a timer thread while an intent may be executing.
 """
 
+from dataclasses import dataclass
+import logging
 from pathlib import Path
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from camilladsp_autoswitch.infrastructure.filesystem.fingerprint import (
+    Fingerprint,
+    file_fingerprint,
+    hash_file,
+)
+
+logger = logging.getLogger(__name__)
+
+# (name, start, end), monotonic seconds
+Stage = Tuple[str, float, float]
+
+# (fingerprint, sha256) of an applied YAML
+Content = Tuple[Optional[Fingerprint], str]
+
+
+@dataclass(frozen=True)
+class Execution:
+    """
+    Outcome of one execute() call.
+
+    outcome: "applied" | "unchanged" | "invalid" | "rolled_back" | "failed"
+    latency: duration of the apply step in seconds (applied only)
+
+    rolled_back: the apply failed, the last known good config runs
+    failed: the apply failed and nothing could be restored
+    """
+    yaml: Path
+    outcome: str
+    reason: Optional[str] = None
+    latency: Optional[float] = None
+    stages: Tuple[Stage, ...] = ()
 
 
 class IntentExecutor:
     """
     Executes intents in an idempotent and fail-safe way.
+
+    validate_fn is expected to be cached (ValidationCache.wrap): the
+    engine calls it on every intent that passes the dedup check.
+
+    check_fn(yaml) -> result with .ok / .reason probes CamillaDSP after
+    an apply; restore_fn(yaml, text) pushes the last known good config.
     """
 
-    def __init__(self, *, validate_fn, apply_fn):
+    def __init__(
+        self,
+        *,
+        validate_fn,
+        apply_fn,
+        resolve_fn: Optional[Callable] = None,
+        last_applied=None,
+        check_fn: Optional[Callable] = None,
+        restore_fn: Optional[Callable[[Path, str], None]] = None,
+        confirm_later: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self._validate_fn = validate_fn
         self._apply_fn = apply_fn
+        self._resolve_fn = resolve_fn
+        self._last_applied = last_applied
+        self._check_fn = check_fn
+        self._restore_fn = restore_fn
+        self._confirm_later = confirm_later
+        self._clock = clock
+        self._lock = threading.Lock()
         self.reset()
 
     # ------------------------------------------------------------------
@@ -30,9 +118,11 @@ class IntentExecutor:
     def reset(self) -> None:
         """Reset execution state (used by tests and daemon startup)."""
         self._last_yaml: Path | None = None
-        self._last_validation_ok: bool | None = None
+        self._last_content: Optional[Content] = None
+        self._last_good: Optional[Tuple[Path, str]] = None
+        self._last_good_content: Optional[Content] = None
 
-    def configure(self, *, validate_fn=None, apply_fn=None) -> None:
+    def configure(self, *, validate_fn=None, apply_fn=None, resolve_fn=None) -> None:
         """
         Rebind dependencies.
 
@@ -42,34 +132,217 @@ class IntentExecutor:
             self._validate_fn = validate_fn
         if apply_fn is not None:
             self._apply_fn = apply_fn
+        if resolve_fn is not None:
+            self._resolve_fn = resolve_fn
+
+    @property
+    def last_yaml(self) -> Optional[Path]:
+        """YAML applied last (None until the first apply)."""
+        return self._last_yaml
+
+    @property
+    def last_good(self) -> Optional[Path]:
+        """YAML restored on a failed apply (None until one is known)."""
+        return self._last_good[0] if self._last_good is not None else None
 
     # ------------------------------------------------------------------
     # Execution
     # ------------------------------------------------------------------
 
-    def execute(self, intent, yaml_path: Path) -> None:
+    def execute(self, intent, yaml_path: Optional[Path] = None) -> Execution:
         """
         Execute an intent.
 
         Args:
             intent: SwitchIntent
-            yaml_path: concrete YAML path
+            yaml_path: concrete YAML path (resolved with resolve_fn
+                       when omitted)
 
         Guarantees:
         - Invalid YAML is never applied
-        - Same YAML is applied only once
+        - Same YAML, with the same content, is applied only once (also
+          across restarts when a LastApplied record is given)
+        - An invalid YAML never replaces the applied one, so a later
+          intent for the applied YAML is still deduplicated
         """
+        with self._lock:
+            return self._execute(intent, yaml_path)
+
+    def _execute(self, intent, yaml_path: Optional[Path]) -> Execution:
+        clock = self._clock
+        stages = []
+
+        if yaml_path is None:
+            started = clock()
+            yaml_path = self._resolve_fn(intent)
+            stages.append(("resolve", started, clock()))
+
+        if self._unchanged(yaml_path):
+            return Execution(yaml_path, "unchanged", stages=tuple(stages))
+
+        if (
+            self._last_yaml is None
+            and self._last_applied is not None
+            and self._last_applied.matches(yaml_path)
+        ):
+            # First intent after a restart: CamillaDSP already runs it
+            self._last_yaml = yaml_path
+            self._last_content = self._content(yaml_path)
+            self._keep_good(yaml_path)
+            return Execution(yaml_path, "unchanged", "already_applied", stages=tuple(stages))
+
+        started = clock()
         result = self._validate_fn(yaml_path)
+        stages.append(("validate", started, clock()))
 
         if not result.valid:
-            self._last_yaml = yaml_path
-            self._last_validation_ok = False
-            return
+            return Execution(yaml_path, "invalid", result.reason, stages=tuple(stages))
 
-        yaml_changed = yaml_path != self._last_yaml
+        # Taken before the apply: an edit racing it is applied next time
+        content = self._content(yaml_path)
 
-        if self._last_yaml is None or yaml_changed:
+        failure = None
+        started = clock()
+        try:
             self._apply_fn(yaml_path)
+        except Exception as exc:
+            failure = f"apply failed: {exc}"
+        finished = clock()
+        stages.append(("apply", started, finished))
+
+        if failure is None and self._check_fn is not None:
+            check_started = clock()
+            health = self._check_fn(yaml_path)
+            stages.append(("check", check_started, clock()))
+            if not health.ok:
+                failure = f"health check failed: {health.reason}"
+
+        if failure is not None:
+            return self._rollback(yaml_path, failure, stages)
 
         self._last_yaml = yaml_path
-        self._last_validation_ok = True
+        self._last_content = content
+        if not self._confirm_later:
+            self._confirmed(yaml_path)
+
+        return Execution(
+            yaml_path,
+            "applied",
+            latency=finished - started,
+            stages=tuple(stages),
+        )
+
+    def confirm(self, yaml_path: Path) -> bool:
+        """
+        Deferred health check passed (confirm_later=True).
+
+        Ignored (False) when another YAML was applied meanwhile.
+        """
+        with self._lock:
+            if yaml_path != self._last_yaml:
+                return False
+            self._confirmed(yaml_path)
+            return True
+
+    def reject(self, yaml_path: Path, reason: str, stages=()) -> Optional[Execution]:
+        """
+        Deferred health check failed: restore the last known good config.
+
+        Returns the rollback's Execution, or None when another YAML was
+        applied meanwhile (the verdict is stale).
+        """
+        with self._lock:
+            if yaml_path != self._last_yaml:
+                return None
+            return self._rollback(yaml_path, f"health check failed: {reason}", list(stages))
+
+    def _confirmed(self, yaml_path: Path) -> None:
+        if self._last_applied is not None:
+            self._last_applied.remember(yaml_path)
+        self._keep_good(yaml_path)
+
+    # ------------------------------------------------------------------
+    # Dedup
+    # ------------------------------------------------------------------
+
+    def _unchanged(self, yaml_path: Path) -> bool:
+        if self._last_yaml is None or yaml_path != self._last_yaml:
+            return False
+
+        recorded = self._last_content
+        if recorded is None:
+            return True  # content unknown: the path decides
+
+        fingerprint, digest = recorded
+        current = file_fingerprint(yaml_path)
+        if current is not None and current == fingerprint:
+            return True
+
+        try:
+            current_digest = hash_file(yaml_path)
+        except OSError:
+            return True  # gone: CamillaDSP still runs what was applied
+
+        if current_digest != digest:
+            return False
+
+        # Touched or rewritten with the same content
+        self._last_content = (current, digest)
+        return True
+
+    @staticmethod
+    def _content(yaml_path: Path) -> Optional[Content]:
+        fingerprint = file_fingerprint(yaml_path)
+        try:
+            return (fingerprint, hash_file(yaml_path))
+        except OSError:
+            return None
+
+    # ------------------------------------------------------------------
+    # Rollback
+    # ------------------------------------------------------------------
+
+    def _keep_good(self, yaml_path: Path) -> None:
+        if self._restore_fn is None:
+            return
+        try:
+            self._last_good = (yaml_path, Path(yaml_path).read_text())
+            self._last_good_content = self._last_content
+        except OSError as exc:
+            logger.warning("Cannot keep %s as last known good: %s", yaml_path, exc)
+
+    def _rollback(self, yaml_path: Path, failure: str, stages: list) -> Execution:
+        logger.error("Switch to %s failed: %s", yaml_path, failure)
+
+        good = self._last_good
+        if self._restore_fn is None or good is None or good[0] == yaml_path:
+            # CamillaDSP state unknown: the next intent must apply again
+            self._last_yaml = None
+            if self._last_applied is not None:
+                self._last_applied.forget()
+            return Execution(yaml_path, "failed", failure, stages=tuple(stages))
+
+        started = self._clock()
+        try:
+            self._restore_fn(*good)
+        except Exception as exc:
+            stages.append(("rollback", started, self._clock()))
+            self._last_yaml = None
+            if self._last_applied is not None:
+                self._last_applied.forget()
+            return Execution(
+                yaml_path, "failed", f"{failure}; rollback failed: {exc}", stages=tuple(stages)
+            )
+        stages.append(("rollback", started, self._clock()))
+
+        # The LastApplied record still names good[0]: it was only
+        # updated by successful applies
+        logger.warning("Rolled back to last known good %s", good[0])
+        self._last_yaml = good[0]
+        self._last_content = self._last_good_content
+        return Execution(
+            yaml_path,
+            "rolled_back",
+            f"{failure}; restored {good[0]}",
+            stages=tuple(stages),
+        )
@@ -0,0 +1,154 @@
+"""
+Last applied configuration, persisted across daemon restarts.
+
+After a restart the executor would otherwise re-apply the first
+intent's YAML (and CamillaDSP would reload, i.e. an audible dropout)
+even when CamillaDSP is already running exactly that config.
+
+Record: <state dir>/applied.json = {path, sha256, applied_at}
+
+A record is only trusted while:
+- CamillaDSP still reports the same config file (checked on startup)
+- the file on disk still has the recorded content hash
+"""
+
+from dataclasses import asdict, dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import Optional
+
+from camilladsp_autoswitch.infrastructure import runtime_state
+from camilladsp_autoswitch.infrastructure.filesystem.fingerprint import hash_file
+
+logger = logging.getLogger(__name__)
+
+APPLIED_NAME = "applied.json"
+
+
+@dataclass(frozen=True)
+class AppliedConfig:
+    path: str
+    sha256: str
+    applied_at: float
+
+
+class LastApplied:
+    """
+    Persistent memory of the config CamillaDSP was last switched to.
+
+    Rules:
+    - Never raises: losing the record only costs one extra reload
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = Path(path) if path else runtime_state.STATE_DIR / APPLIED_NAME
+        self._record = self._load()
+
+    @property
+    def record(self) -> Optional[AppliedConfig]:
+        return self._record
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def matches(self, yaml_path) -> bool:
+        """True if yaml_path, with its current content, is what was last applied."""
+        record = self._record
+        if record is None or record.path != str(yaml_path):
+            return False
+
+        try:
+            return hash_file(Path(yaml_path)) == record.sha256
+        except OSError:
+            return False
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+
+    def remember(self, yaml_path) -> None:
+        """Record yaml_path as applied (call after a successful apply)."""
+        try:
+            record = AppliedConfig(
+                path=str(yaml_path),
+                sha256=hash_file(Path(yaml_path)),
+                applied_at=time.time(),
+            )
+        except OSError as exc:
+            logger.warning("Cannot hash applied config %s: %s", yaml_path, exc)
+            self.forget()
+            return
+
+        self._record = record
+        try:
+            self._write(record)
+        except OSError as exc:
+            logger.warning("Cannot persist applied config: %s", exc)
+
+    def forget(self) -> None:
+        self._record = None
+        try:
+            self._path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Cannot remove %s: %s", self._path, exc)
+
+    def verify(self, current_config: Optional[str]) -> bool:
+        """
+        Startup check against the config CamillaDSP reports as active.
+
+        The record is dropped when CamillaDSP runs another file, or when
+        it cannot be asked (None): then the first switch applies normally.
+        Returns whether the record was kept.
+        """
+        record = self._record
+        if record is None:
+            return False
+
+        if current_config is None or current_config != record.path:
+            logger.info(
+                "Last applied config not confirmed by CamillaDSP (%s ≠ %s)",
+                current_config,
+                record.path,
+            )
+            self.forget()
+            return False
+
+        return True
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _load(self) -> Optional[AppliedConfig]:
+        try:
+            return AppliedConfig(**json.loads(self._path.read_text()))
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning("Ignoring unreadable %s: %s", self._path, exc)
+            return None
+
+    def _write(self, record: AppliedConfig) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self._path.parent,
+            prefix=".applied.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(asdict(record), f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, self._path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
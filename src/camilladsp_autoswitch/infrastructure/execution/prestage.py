@@ -0,0 +1,188 @@
+"""
+Speculative pre-staging of the next switch target.
+
+The media mapping has two sides, so once one side is applied the next
+automatic switch can only go to the other one. After every switch the
+opposite side is prepared in the background:
+
+- resolve its YAML
+- validate it (through the cached validator: the verdict lands in the
+  ValidationCache, the parsed document in the YAML document cache)
+- pre-read the YAML and the filter files it references (convolution
+  coefficients), so CamillaDSP's reload reads them from the page cache
+
+When the toggle happens, resolve and validate are cache hits and
+apply is the only real step left on the critical path.
+
+Rules:
+- Never raises: pre-staging is an optimization, the executor still
+  resolves and validates every intent itself
+- Only the newest target is staged (a superseded job is skipped)
+- Targets that are not a mapping side (manual / forced profiles) are
+  not guessed
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from camilladsp_autoswitch import yaml_loader
+from camilladsp_autoswitch.domain.events import IntentExecuted
+from camilladsp_autoswitch.domain.mapping import MediaMapping, ProfileSelection
+from camilladsp_autoswitch.intent import SwitchIntent
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK = 1 << 20
+
+
+def filter_files(config: Any, base: Path) -> List[Path]:
+    """
+    Coefficient files referenced by a parsed CamillaDSP config.
+
+    Relative names are resolved against the config's directory.
+    """
+    if not isinstance(config, dict) or not isinstance(config.get("filters"), dict):
+        return []
+
+    files = []
+    for spec in config["filters"].values():
+        parameters = spec.get("parameters") if isinstance(spec, dict) else None
+        if isinstance(parameters, dict) and isinstance(parameters.get("filename"), str):
+            path = Path(parameters["filename"])
+            files.append(path if path.is_absolute() else base / path)
+    return files
+
+
+def preread(path: Path) -> int:
+    """
+    Pull a file into the page cache; returns the bytes scheduled/read.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            return size
+        while f.read(READ_CHUNK):
+            pass
+        return size
+
+
+class Prestager:
+    """
+    Prepares the opposite mapping side after every switch.
+
+    Subscribes to IntentExecuted. `run` executes a job in the
+    background (a single worker thread by default).
+    """
+
+    def __init__(
+        self,
+        bus,
+        *,
+        mapping: Callable[[], MediaMapping],
+        resolve_fn: Callable[[Any], Path],
+        validate_fn: Callable[[Path], Any],
+        run: Optional[Callable[[Callable[[], None]], Any]] = None,
+    ):
+        self._mapping = mapping
+        self._resolve_fn = resolve_fn
+        self._validate_fn = validate_fn
+
+        self._pool = None
+        if run is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prestage")
+            run = self._pool.submit
+        self._run = run
+
+        self._lock = threading.Lock()
+        self._wanted: Optional[ProfileSelection] = None
+        self._staged: Optional[Path] = None
+
+        self.prestaged = 0
+        self.prestage_failures = 0
+
+        bus.subscribe(IntentExecuted, self._on_executed)
+
+    @property
+    def staged(self) -> Optional[Path]:
+        """YAML prepared for the next switch (None if none)."""
+        return self._staged
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "prestaged": self.prestaged,
+            "prestage_failures": self.prestage_failures,
+        }
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _on_executed(self, event: IntentExecuted) -> None:
+        if event.outcome not in ("applied", "unchanged"):
+            return
+
+        target = self._opposite(event.profile, event.variant)
+        if target is None:
+            return
+
+        with self._lock:
+            if target == self._wanted:
+                return
+            self._wanted = target
+
+        self._run(lambda: self._stage(target, applied=event.yaml))
+
+    def _opposite(self, profile: str, variant: Optional[str]) -> Optional[ProfileSelection]:
+        try:
+            mapping = self._mapping()
+        except Exception:
+            return None
+
+        applied = ProfileSelection(profile=profile, variant=variant)
+        if applied == mapping.on:
+            return mapping.off
+        if applied == mapping.off:
+            return mapping.on
+        return None
+
+    def _stage(self, target: ProfileSelection, applied: str) -> None:
+        if target != self._wanted:
+            return  # superseded by a newer switch
+
+        try:
+            path = self._resolve_fn(
+                SwitchIntent(profile=target.profile, variant=target.variant, reason="prestage")
+            )
+            if str(path) == applied:
+                return  # e.g. experimental YAML: both sides resolve to it
+
+            result = self._validate_fn(path)
+            if not result.valid:
+                logger.warning("Pre-staged %s is invalid: %s", path, result.reason)
+                self.prestage_failures += 1
+                return
+
+            size = preread(path)
+            config = yaml_loader.load_file(path)
+            for coefficients in filter_files(config, Path(path).parent):
+                try:
+                    size += preread(coefficients)
+                except OSError as exc:
+                    logger.debug("Cannot pre-read %s: %s", coefficients, exc)
+        except Exception:
+            logger.exception("Pre-staging %s failed", target.profile)
+            self.prestage_failures += 1
+            return
+
+        self._staged = Path(path)
+        self.prestaged += 1
+        logger.debug("Pre-staged %s (%d bytes)", path, size)
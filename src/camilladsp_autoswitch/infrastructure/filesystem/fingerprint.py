@@ -0,0 +1,30 @@
+import hashlib
+import os
+from typing import Optional, Tuple
+
+
+Fingerprint = Tuple[int, int, int]
+
+_HASH_CHUNK = 1024 * 1024
+
+
+def file_fingerprint(path) -> Optional[Fingerprint]:
+    """
+    Return (inode, size, mtime_ns) for a file, or None if it cannot be stat'ed.
+
+    Cheap change detection: a single stat() call, no reads.
+    """
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def hash_file(path) -> str:
+    """SHA-256 of a file, streamed in constant memory."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
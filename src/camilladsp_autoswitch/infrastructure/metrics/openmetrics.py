@@ -0,0 +1,195 @@
+"""
+Minimal OpenMetrics text exposition.
+
+Only what the daemon needs: counters, histograms with fixed buckets
+and callback metrics read at scrape time. No client library.
+
+Rules:
+- Recording (inc / observe) never allocates: counters and buckets are
+  plain numbers updated in place
+- Label strings are formatted once, when a label set is first seen
+- Scraping renders one bytes object; nothing is kept between scrapes
+"""
+
+from bisect import bisect_left
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, Union
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Seconds: 1 ms … 10 s, covers a cache hit up to a slow `camilladsp --check`
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Number = Union[int, float]
+Sample = Tuple[str, str, Number]  # (name suffix, formatted labels, value)
+
+
+def format_labels(names: Sequence[str], values: Sequence) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape("" if value is None else str(value))}"'
+        for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: Number) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+# ============================================================================
+# Metric families
+# ============================================================================
+
+class Metric:
+    """Base class: a named family producing samples at scrape time."""
+
+    kind = "unknown"
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+
+    def samples(self) -> Iterable[Sample]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """
+    Monotonic counter, optionally labelled.
+
+    inc() takes the label values positionally, in `labels` order.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help)
+        self._label_names = tuple(labels)
+        # label values → [formatted labels, value]
+        self._values: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: Number = 1) -> None:
+        with self._lock:
+            slot = self._values.get(label_values)
+            if slot is None:
+                slot = [format_labels(self._label_names, label_values), 0]
+                self._values[label_values] = slot
+            slot[1] += amount
+
+    def value(self, *label_values) -> Number:
+        slot = self._values.get(label_values)
+        return 0 if slot is None else slot[1]
+
+    def samples(self) -> Iterable[Sample]:
+        with self._lock:
+            slots = list(self._values.values())
+        for labels, value in slots:
+            yield "_total", labels, value
+
+
+class Histogram(Metric):
+    """Unlabelled histogram with fixed upper bounds."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help)
+        self._bounds = tuple(sorted(buckets))
+        self._bucket_labels = tuple(
+            format_labels(("le",), (_number(float(bound)),)) for bound in self._bounds
+        ) + ('{le="+Inf"}',)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def samples(self) -> Iterable[Sample]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        cumulative = 0
+        for labels, count in zip(self._bucket_labels, counts):
+            cumulative += count
+            yield "_bucket", labels, cumulative
+        yield "_count", "", cumulative
+        yield "_sum", "", total
+
+
+class CallbackMetric(Metric):
+    """
+    Counter or gauge read from live objects at scrape time.
+
+    fn returns a number, or a {label values tuple: number} dict.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        fn: Callable[[], Union[Number, Dict[tuple, Number]]],
+        *,
+        kind: str = "gauge",
+        labels: Sequence[str] = (),
+    ):
+        if kind not in ("counter", "gauge"):
+            raise ValueError(f"Unsupported callback metric kind: {kind}")
+        super().__init__(name, help)
+        self.kind = kind
+        self._fn = fn
+        self._label_names = tuple(labels)
+        self._label_cache: Dict[tuple, str] = {}
+
+    def samples(self) -> Iterable[Sample]:
+        suffix = "_total" if self.kind == "counter" else ""
+        value = self._fn()
+
+        if not isinstance(value, dict):
+            yield suffix, "", value
+            return
+
+        for label_values, number in value.items():
+            labels = self._label_cache.get(label_values)
+            if labels is None:
+                labels = format_labels(self._label_names, label_values)
+                self._label_cache[label_values] = labels
+            yield suffix, labels, number
+
+
+# ============================================================================
+# Exposition
+# ============================================================================
+
+def render(metrics: Iterable[Metric]) -> bytes:
+    """Render metric families in the OpenMetrics text format."""
+    lines: List[str] = []
+
+    for metric in metrics:
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        for suffix, labels, value in metric.samples():
+            lines.append(f"{metric.name}{suffix}{labels} {_number(value)}")
+
+    lines.append("# EOF\n")
+    return "\n".join(lines).encode()
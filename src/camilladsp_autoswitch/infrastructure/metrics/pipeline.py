@@ -0,0 +1,202 @@
+"""
+Switch pipeline metrics.
+
+Responsibilities:
+- Count every event published on the bus, per event type
+- Count switches per profile / variant / outcome (IntentExecuted)
+- Time validation and apply steps (histograms)
+- Read cache, event store and process scan counters at scrape time
+
+Rules:
+- Recording happens on the bus path: it must stay O(1) and
+  allocation-free
+- Everything else is pulled when scraped
+"""
+
+import time
+from typing import Callable, Dict, Iterable, List
+
+from camilladsp_autoswitch.domain.events import IntentExecuted
+from camilladsp_autoswitch.infrastructure.metrics.openmetrics import (
+    CallbackMetric,
+    Counter,
+    Histogram,
+    Metric,
+    render,
+)
+
+PREFIX = "cdsp_autoswitch_"
+
+
+class PipelineMetrics:
+    """
+    Metric registry for one bootstrapped pipeline.
+
+    Sources are attached after construction (watch_* methods) as
+    bootstrap creates them; unattached sources are simply not exported.
+    """
+
+    def __init__(self, bus):
+        self._event_counts: Dict[type, int] = {}
+
+        self.switches = Counter(
+            PREFIX + "switches",
+            "Executed switch intents by outcome.",
+            labels=("profile", "variant", "outcome"),
+        )
+        self.validation_seconds = Histogram(
+            PREFIX + "validation_seconds",
+            "Time spent validating a YAML (cache misses only).",
+        )
+        self.apply_seconds = Histogram(
+            PREFIX + "apply_seconds",
+            "Time spent applying a YAML to CamillaDSP.",
+        )
+
+        self._metrics: List[Metric] = [
+            CallbackMetric(
+                PREFIX + "events",
+                "Events published on the bus, by type.",
+                self._events_by_type,
+                kind="counter",
+                labels=("type",),
+            ),
+            self.switches,
+            self.validation_seconds,
+            self.apply_seconds,
+        ]
+
+        bus.subscribe(object, self._on_event)
+        bus.subscribe(IntentExecuted, self._on_executed)
+
+    # ------------------------------------------------------------------
+    # Sources
+    # ------------------------------------------------------------------
+
+    def timed(self, validate_fn: Callable) -> Callable:
+        """Wrap a validate function to record its duration."""
+
+        def timed_validate(path):
+            started = time.perf_counter()
+            try:
+                return validate_fn(path)
+            finally:
+                self.validation_seconds.observe(time.perf_counter() - started)
+
+        return timed_validate
+
+    def observe_validations(self, entries: Iterable) -> None:
+        """
+        Record the durations of a bulk validation run.
+
+        validate_all() times each file itself (BulkValidationEntry.elapsed):
+        its workers are separate processes and need the raw, picklable
+        validator rather than a timed() closure.
+        """
+        for entry in entries:
+            self.validation_seconds.observe(entry.elapsed)
+
+    def watch_caches(self, caches: Dict[str, object]) -> None:
+        """Export hits / misses of caches exposing `hits` and `misses`."""
+        caches = dict(caches)
+
+        def requests():
+            values = {}
+            for name, cache in caches.items():
+                values[(name, "hit")] = cache.hits
+                values[(name, "miss")] = cache.misses
+            return values
+
+        def ratios():
+            values = {}
+            for name, cache in caches.items():
+                total = cache.hits + cache.misses
+                values[(name,)] = cache.hits / total if total else 0.0
+            return values
+
+        self._metrics.append(CallbackMetric(
+            PREFIX + "cache_requests",
+            "Cache lookups by result.",
+            requests,
+            kind="counter",
+            labels=("cache", "result"),
+        ))
+        self._metrics.append(CallbackMetric(
+            PREFIX + "cache_hit_ratio",
+            "Share of cache lookups served from the cache.",
+            ratios,
+            labels=("cache",),
+        ))
+
+    def watch_event_store(self, store) -> None:
+        self._metrics.append(CallbackMetric(
+            PREFIX + "event_store_events",
+            "Events held in the in-memory event store.",
+            lambda: len(store),
+        ))
+
+    def watch_process_watcher(self, watcher) -> None:
+        self._metrics.append(CallbackMetric(
+            PREFIX + "process_scans",
+            "/proc scans run by the process watcher.",
+            lambda: watcher.scans,
+            kind="counter",
+        ))
+        self._metrics.append(CallbackMetric(
+            PREFIX + "process_scan_seconds",
+            "Time spent scanning /proc.",
+            lambda: watcher.scan_seconds,
+            kind="counter",
+        ))
+
+    def watch_scheduler(self, scheduler) -> None:
+        self._metrics.append(CallbackMetric(
+            PREFIX + "intents_superseded",
+            "Switch intents dropped because a newer one arrived first.",
+            lambda: scheduler.superseded,
+            kind="counter",
+        ))
+
+    def watch_dwell_limiter(self, limiter) -> None:
+        self._metrics.append(CallbackMetric(
+            PREFIX + "intents_deferred",
+            "Switch intents held back by a profile's minimum dwell time.",
+            lambda: limiter.deferred,
+            kind="counter",
+        ))
+
+    def watch_stats(self, provider: Callable[[], Dict[str, float]], gauges: Dict[str, str]) -> None:
+        """Export keys of a stats() dict (e.g. LoopWatchdog.stats) as gauges."""
+        for key, help in gauges.items():
+            self._metrics.append(CallbackMetric(
+                PREFIX + key,
+                help,
+                lambda key=key: provider()[key],
+            ))
+
+    # ------------------------------------------------------------------
+    # Exposition
+    # ------------------------------------------------------------------
+
+    def render(self) -> bytes:
+        return render(self._metrics)
+
+    def events_published(self, event_type: type) -> int:
+        return self._event_counts.get(event_type, 0)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _on_event(self, event) -> None:
+        cls = type(event)
+        self._event_counts[cls] = self._event_counts.get(cls, 0) + 1
+
+    def _on_executed(self, event: IntentExecuted) -> None:
+        self.switches.inc(event.profile, event.variant, event.outcome)
+        if event.latency is not None:
+            self.apply_seconds.observe(event.latency)
+
+    def _events_by_type(self) -> Dict[tuple, int]:
+        return {(cls.__name__,): count for cls, count in list(self._event_counts.items())}
+
@@ -0,0 +1,122 @@
+"""
+Local HTTP endpoint serving GET /metrics (OpenMetrics).
+
+Bound to the loopback interface by default: the metrics describe the
+listening room, not something to publish on the network.
+"""
+
+import logging
+import socket
+from typing import Callable, Tuple
+
+from camilladsp_autoswitch.infrastructure.metrics.openmetrics import CONTENT_TYPE
+from camilladsp_autoswitch.infrastructure.watchers.base import EventSource
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+CLIENT_TIMEOUT = 0.5
+MAX_REQUEST = 8192
+
+
+class MetricsServer(EventSource):
+    """
+    Minimal HTTP/1.0 server for scrapers.
+
+    Implements the event-source protocol (see watchers.base).
+    Scrapers send one small request per connection, so each accepted
+    connection is served inline with a tight timeout (as the control
+    socket does).
+    """
+
+    thread_name = "cdsp-metrics"
+
+    def __init__(
+        self,
+        render: Callable[[], bytes],
+        *,
+        port: int,
+        host: str = DEFAULT_HOST,
+    ):
+        self._render = render
+        self.scrapes = 0
+        self._sock = self._bind(host, port)
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._sock.getsockname()[:2]
+
+    # ------------------------------------------------------------------
+    # Event-source protocol
+    # ------------------------------------------------------------------
+
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+    def on_readable(self) -> None:
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            with conn:
+                self._serve(conn)
+
+    def close(self) -> None:
+        self._sock.close()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _serve(self, conn: socket.socket) -> None:
+        conn.settimeout(CLIENT_TIMEOUT)
+        try:
+            buffer = b""
+            while b"\r\n\r\n" not in buffer and b"\n\n" not in buffer:
+                if len(buffer) > MAX_REQUEST:
+                    break
+                chunk = conn.recv(4096)
+                if not chunk:
+                    break
+                buffer += chunk
+
+            conn.sendall(self._respond(buffer.split(b"\n", 1)[0]))
+        except OSError as exc:
+            logger.warning("Metrics client dropped: %s", exc)
+
+    def _respond(self, request_line: bytes) -> bytes:
+        parts = request_line.split()
+        if len(parts) < 2 or parts[0] not in (b"GET", b"HEAD"):
+            return _response(405, "Method Not Allowed", b"")
+
+        if parts[1].split(b"?", 1)[0] not in (b"/metrics", b"/"):
+            return _response(404, "Not Found", b"")
+
+        self.scrapes += 1
+        body = self._render()
+        return _response(200, "OK", body, head_only=parts[0] == b"HEAD")
+
+    def _bind(self, host: str, port: int) -> socket.socket:
+        sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((host, port))
+            sock.listen(8)
+            sock.setblocking(False)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+
+def _response(status: int, reason: str, body: bytes, head_only: bool = False) -> bytes:
+    content_type = CONTENT_TYPE if status == 200 else "text/plain; charset=utf-8"
+    header = (
+        f"HTTP/1.0 {status} {reason}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    ).encode()
+    return header if head_only else header + body
@@ -5,16 +5,23 @@ This module is the SINGLE SOURCE OF TRUTH for the autoswitch runtime state.
 
 Design goals:
 - Extremely robust (never break audio)
-- Safe for concurrent access (atomic writes)
+- Safe for concurrent access (atomic writes, locked updates)
 - Clear separation between DEV and PROD
 - Minimal dependencies
 """
 
-from dataclasses import dataclass, asdict
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, fields, replace
+import fcntl
 from pathlib import Path
 import json
 import os
-from typing import Optional
+from typing import Iterator, Optional, Tuple
+
+from camilladsp_autoswitch.infrastructure.filesystem.fingerprint import (
+    Fingerprint,
+    file_fingerprint,
+)
 
 
 # ============================================================================
@@ -40,6 +47,8 @@ STATE_DIR = Path(
 
 STATE_FILE = STATE_DIR / "state.json"
 
+LOCK_FILE = STATE_DIR / "state.lock"
+
 
 # ============================================================================
 # Runtime State Model
@@ -80,6 +89,32 @@ class CDSPState:
     status: str = "OK"
 
 
+# ============================================================================
+# Process-local cache
+# ============================================================================
+#
+# (fingerprint, state) of the last parse. The fingerprint is
+# (inode, size, mtime_ns): save_state() always publishes a new inode
+# via os.replace(), so a single stat() is enough to detect changes.
+#
+
+_cache: Optional[Tuple[Fingerprint, CDSPState]] = None
+
+
+def state_version() -> Optional[Fingerprint]:
+    """
+    Cheap, opaque version token of the state file (one stat() call).
+
+    Equal tokens mean the state did not change; None means no state file.
+    """
+    return file_fingerprint(STATE_FILE)
+
+
+def _remember(fingerprint: Optional[Fingerprint], state: CDSPState) -> None:
+    global _cache
+    _cache = (fingerprint, replace(state)) if fingerprint is not None else None
+
+
 # ============================================================================
 # Load state (FAIL-SAFE)
 # ============================================================================
@@ -92,27 +127,46 @@ def load_state() -> CDSPState:
     - If the state file does not exist → return defaults
     - If the file is corrupted / unreadable → return defaults
     - This function must NEVER raise an exception
+    - The file is only re-parsed when its fingerprint changed;
+      callers always get their own copy
 
     Rationale:
     Audio must NEVER stop because of a broken state file.
     """
 
-    if not STATE_FILE.exists():
+    fingerprint = state_version()
+    if fingerprint is None:
         return CDSPState()
 
+    if _cache is not None and _cache[0] == fingerprint:
+        return replace(_cache[1])
+
     try:
         data = json.loads(STATE_FILE.read_text())
-        return CDSPState(**data)
+        state = CDSPState(**data)
     except Exception:
         # Absolute fail-safe:
         # Never propagate errors caused by corrupted state.
         return CDSPState()
 
+    _remember(fingerprint, state)
+    return state
+
 
 # ============================================================================
 # Save state (ATOMIC + EXPLICIT ERRORS)
 # ============================================================================
 
+def _ensure_state_dir() -> None:
+    try:
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+    except PermissionError as e:
+        raise PermissionError(
+            f"Cannot write state to {STATE_DIR}. "
+            f"Set CDSP_STATE_DIR for development or run as root."
+        ) from e
+
+
 def save_state(state: CDSPState):
     """
     Atomically persist runtime state to disk.
@@ -120,35 +174,108 @@ def save_state(state: CDSPState):
     Guarantees:
     - Directory is created if missing
     - Writes are atomic (no partial files)
+    - Every writer uses its own temporary file
     - Permission errors are explicit and user-friendly
 
+    This is a blind overwrite: use update_state() or
+    state_transaction() for read-modify-write.
+
     This function IS ALLOWED to raise PermissionError,
     because inability to save state is a real operational problem.
     """
 
-    # Ensure state directory exists
-    try:
-        STATE_DIR.mkdir(parents=True, exist_ok=True)
-    except PermissionError as e:
-        raise PermissionError(
-            f"Cannot write state to {STATE_DIR}. "
-            f"Set CDSP_STATE_DIR for development or run as root."
-        ) from e
+    # Deferred: readers (cdspctl status) never pay for tempfile
+    import tempfile
 
-    # Write to temporary file first
-    tmp_file = STATE_FILE.with_suffix(".tmp")
-    tmp_file.write_text(
-        json.dumps(asdict(state), indent=2)
+    _ensure_state_dir()
+
+    # Write to a unique temporary file first
+    fd, tmp_name = tempfile.mkstemp(
+        dir=STATE_DIR,
+        prefix=".state.",
+        suffix=".tmp",
     )
+    tmp_file = Path(tmp_name)
 
-    # Atomic replace (POSIX-safe on same filesystem)
-    os.replace(tmp_file, STATE_FILE)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(asdict(state), indent=2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_file, 0o644)
+
+        # rename() keeps inode, size and mtime: fingerprint before publishing
+        # so a concurrent writer can never be attributed our state.
+        fingerprint = file_fingerprint(tmp_file)
+
+        # Atomic replace (POSIX-safe on same filesystem)
+        os.replace(tmp_file, STATE_FILE)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+    _remember(fingerprint, state)
+
+
+# ============================================================================
+# Transactions (LOCKED read-modify-write)
+# ============================================================================
+
+@contextmanager
+def state_transaction() -> Iterator[CDSPState]:
+    """
+    Locked read-modify-write of the runtime state.
+
+    Usage:
+        with state_transaction() as state:
+            state.mode = "manual"
+            state.profile = "cinema"
+
+    - An exclusive flock() on state.lock serializes writers
+      (across processes and threads)
+    - The state is re-read from disk under the lock
+    - All changes are written at once on exit, only if something changed
+    - Nothing is written if the block raises
+    """
+
+    _ensure_state_dir()
+
+    with open(LOCK_FILE, "a") as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        try:
+            state = _read_state()
+            original = replace(state)
+
+            yield state
+
+            if state != original:
+                save_state(state)
+        finally:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+def _read_state() -> CDSPState:
+    """Uncached read, used under the transaction lock."""
+    fingerprint = state_version()
+    if fingerprint is None:
+        return CDSPState()
+
+    try:
+        state = CDSPState(**json.loads(STATE_FILE.read_text()))
+    except Exception:
+        return CDSPState()
+
+    _remember(fingerprint, state)
+    return state
 
 
 # ============================================================================
 # Update state (STRICT + SAFE)
 # ============================================================================
 
+_FIELDS = frozenset(f.name for f in fields(CDSPState))
+
+
 def update_state(**kwargs) -> CDSPState:
     """
     Update selected fields of the runtime state.
@@ -156,18 +283,19 @@ def update_state(**kwargs) -> CDSPState:
     Rules:
     - Only existing fields can be updated
     - Unknown fields are rejected (ValueError)
-    - Changes are persisted atomically
+    - Changes are persisted atomically, under the state lock
     - Returns the updated state
 
-    This function is the ONLY supported way to mutate runtime state.
+    This function is the ONLY supported way to mutate runtime state
+    (together with state_transaction() for multi-step updates).
     """
 
-    state = load_state()
-
-    for key, value in kwargs.items():
-        if not hasattr(state, key):
+    for key in kwargs:
+        if key not in _FIELDS:
             raise ValueError(f"Unknown state field: {key}")
-        setattr(state, key, value)
 
-    save_state(state)
-    return state
+    with state_transaction() as state:
+        for key, value in kwargs.items():
+            setattr(state, key, value)
+
+    return replace(state)
@@ -0,0 +1,109 @@
+"""
+Native sd_notify(3) client.
+
+Sends service state to systemd over the datagram socket named in
+NOTIFY_SOCKET (paths starting with "@" are abstract sockets). No
+libsystemd dependency.
+
+Outside systemd (no NOTIFY_SOCKET) every call is a cheap no-op.
+"""
+
+import logging
+import os
+import socket
+from typing import Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SystemdNotifier:
+    """
+    Rules:
+    - Never raises: a missing or broken notify socket must not stop audio
+    - The watchdog is only considered enabled for this process
+      (WATCHDOG_PID, when set, must match our pid)
+    """
+
+    def __init__(self, environ: Optional[Mapping[str, str]] = None):
+        environ = os.environ if environ is None else environ
+
+        self._address = _socket_address(environ.get("NOTIFY_SOCKET"))
+        self._sock: Optional[socket.socket] = None
+        self._watchdog_interval = _watchdog_interval(environ)
+
+    @property
+    def enabled(self) -> bool:
+        return self._address is not None
+
+    @property
+    def watchdog_interval(self) -> Optional[float]:
+        """WatchdogSec in seconds, or None when the watchdog is off."""
+        return self._watchdog_interval if self.enabled else None
+
+    # ------------------------------------------------------------------
+    # Messages
+    # ------------------------------------------------------------------
+
+    def notify(self, *assignments: str) -> bool:
+        """
+        Send raw assignments (e.g. "READY=1"). Returns True when sent.
+        """
+        if self._address is None or not assignments:
+            return False
+
+        message = "\n".join(assignments).encode()
+        try:
+            if self._sock is None:
+                self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self._sock.setblocking(False)
+            self._sock.sendto(message, self._address)
+        except OSError as exc:
+            logger.debug("sd_notify failed: %s", exc)
+            return False
+        return True
+
+    def ready(self, status: Optional[str] = None) -> bool:
+        return self.notify("READY=1", *_status(status))
+
+    def watchdog(self) -> bool:
+        return self.notify("WATCHDOG=1")
+
+    def status(self, text: str) -> bool:
+        return self.notify(*_status(text))
+
+    def stopping(self, status: Optional[str] = None) -> bool:
+        return self.notify("STOPPING=1", *_status(status))
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+def _status(text: Optional[str]):
+    # One line per assignment: newlines would start a new one
+    return () if text is None else (f"STATUS={' '.join(text.splitlines())}",)
+
+
+def _socket_address(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return None
+    if value.startswith("@"):
+        return "\0" + value[1:]
+    if value.startswith("/"):
+        return value
+    # vsock: and other transports are not used for system services
+    logger.debug("Unsupported NOTIFY_SOCKET: %s", value)
+    return None
+
+
+def _watchdog_interval(environ: Mapping[str, str]) -> Optional[float]:
+    pid = environ.get("WATCHDOG_PID")
+    if pid and pid != str(os.getpid()):
+        return None
+
+    try:
+        usec = int(environ.get("WATCHDOG_USEC", ""))
+    except ValueError:
+        return None
+    return usec / 1_000_000 if usec > 0 else None
@@ -0,0 +1,106 @@
+"""
+Event-loop watchdog.
+
+A heartbeat timer on the daemon's EventLoop. Its lateness is the loop
+lag: how long events wait behind a slow handler.
+
+WATCHDOG=1 is only ever sent from the heartbeat, and only when the lag
+is within bounds. A wedged loop therefore stops pinging and systemd
+restarts the daemon (WatchdogSec), while a healthy one is never
+killed.
+
+Without WatchdogSec (WATCHDOG_USEC unset) no timer is armed at all:
+an idle daemon has nothing to wake up for, and the lag stays 0.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+from camilladsp_autoswitch.infrastructure.systemd.notify import SystemdNotifier
+
+logger = logging.getLogger(__name__)
+
+
+class LoopWatchdog:
+    """
+    - period: heartbeat period (default: WatchdogSec / 4, None without one)
+    - max_lag: lag above which the ping is withheld (default: period)
+    """
+
+    def __init__(
+        self,
+        loop,
+        notifier: SystemdNotifier,
+        *,
+        period: Optional[float] = None,
+        max_lag: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        interval = notifier.watchdog_interval
+
+        if period is None and interval:
+            period = interval / 4
+
+        self._loop = loop
+        self._notifier = notifier
+        self._period = period
+        self._max_lag = period if max_lag is None else max_lag
+        self._clock = clock
+
+        self._deadline = 0.0
+        self._timer = None
+
+        self.lag = 0.0
+        self.lag_max = 0.0
+        self.pings = 0
+        self.skipped = 0
+
+    @property
+    def period(self) -> Optional[float]:
+        return self._period
+
+    def start(self) -> None:
+        if self._period is None:
+            return  # no watchdog configured: nothing to probe for
+        self._schedule()
+
+    def stop(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loop_lag_seconds": self.lag,
+            "loop_lag_max_seconds": self.lag_max,
+            "watchdog_pings": self.pings,
+            "watchdog_skipped": self.skipped,
+        }
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _schedule(self) -> None:
+        self._deadline = self._clock() + self._period
+        self._timer = self._loop.call_later(self._period, self._beat)
+
+    def _beat(self) -> None:
+        lag = max(0.0, self._clock() - self._deadline)
+        self.lag = lag
+        self.lag_max = max(self.lag_max, lag)
+
+        if lag > self._max_lag:
+            self.skipped += 1
+            logger.warning(
+                "Event loop lagged %.3fs (limit %.3fs)%s",
+                lag,
+                self._max_lag,
+                ", watchdog ping withheld" if self._notifier.watchdog_interval else "",
+            )
+        elif self._notifier.watchdog_interval is not None:
+            if self._notifier.watchdog():
+                self.pings += 1
+
+        self._schedule()
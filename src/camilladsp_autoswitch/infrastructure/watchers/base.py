@@ -0,0 +1,86 @@
+"""
+Shared plumbing for fd-based event sources (watchers).
+
+Event-source protocol:
+- fileno()        → fd to wait on
+- on_readable()   → call when fileno() is readable
+- next_timeout()  → seconds until due work, or None
+- on_timeout()    → run due work
+
+Sources can be multiplexed by an external loop, or run standalone
+in a background thread via start()/stop().
+"""
+
+import os
+import select
+import threading
+from typing import Optional
+
+
+class EventSource:
+    """
+    Base class providing a background-thread runner for the protocol.
+    """
+
+    thread_name = "cdsp-watcher"
+
+    _thread: Optional[threading.Thread] = None
+    _wakeup_r: Optional[int] = None
+    _wakeup_w: Optional[int] = None
+
+    # ------------------------------------------------------------------
+    # Protocol (override)
+    # ------------------------------------------------------------------
+
+    def fileno(self) -> int:
+        raise NotImplementedError
+
+    def on_readable(self) -> None:
+        raise NotImplementedError
+
+    def next_timeout(self) -> Optional[float]:
+        return None
+
+    def on_timeout(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    # ------------------------------------------------------------------
+    # Background thread
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Run the source in a daemon thread."""
+        if self._thread is not None:
+            return
+
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=self.thread_name,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            os.write(self._wakeup_w, b"\0")
+            self._thread.join()
+            os.close(self._wakeup_r)
+            os.close(self._wakeup_w)
+            self._thread = None
+
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            readable, _, _ = select.select(
+                [self, self._wakeup_r], [], [], self.next_timeout()
+            )
+            if self._wakeup_r in readable:
+                return
+            if readable:
+                self.on_readable()
+            self.on_timeout()
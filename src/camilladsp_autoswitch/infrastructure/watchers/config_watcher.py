@@ -0,0 +1,192 @@
+"""
+Configuration directory watcher.
+
+Revalidates YAML files as soon as they are written or moved into
+place, so switches find a ready verdict in the ValidationCache
+instead of validating on the hot path.
+
+Editors write in bursts (temp file, rename, chmod, ...): each path
+is debounced and only validated once it has been quiet for
+`debounce` seconds.
+"""
+
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from camilladsp_autoswitch.infrastructure.filesystem.fingerprint import (
+    file_fingerprint,
+)
+from camilladsp_autoswitch.infrastructure.watchers.base import EventSource
+from camilladsp_autoswitch.infrastructure.watchers.inotify import (
+    IN_CLOSE_WRITE,
+    IN_CREATE,
+    IN_DELETE,
+    IN_DELETE_SELF,
+    IN_ISDIR,
+    IN_MOVED_FROM,
+    IN_MOVED_TO,
+    IN_Q_OVERFLOW,
+    Inotify,
+)
+from camilladsp_autoswitch.validators.cache import ValidationCache
+
+logger = logging.getLogger(__name__)
+
+# Any YAML in the config directory (mapping.yml, hand-edited configs),
+# not only registered profiles
+YAML_SUFFIXES = (".yml", ".yaml")
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE
+    | IN_MOVED_TO
+    | IN_MOVED_FROM
+    | IN_DELETE
+    | IN_CREATE
+    | IN_DELETE_SELF
+)
+
+DEFAULT_DEBOUNCE = 0.2
+
+
+class ConfigWatcher(EventSource):
+    """
+    Watches the config directory and its `profiles/` subdirectory.
+
+    Implements the event-source protocol (see watchers.base).
+    """
+
+    thread_name = "cdsp-config-watcher"
+
+    def __init__(
+        self,
+        config_dir: Path,
+        *,
+        validate_fn: Callable,
+        cache: ValidationCache,
+        debounce: float = DEFAULT_DEBOUNCE,
+        on_verdict: Optional[Callable] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._config_dir = Path(config_dir)
+        self._validate_fn = validate_fn
+        self._cache = cache
+        self._debounce = debounce
+        self._on_verdict = on_verdict
+        self._clock = clock
+
+        self._inotify = Inotify()
+        self._watches: Dict[int, Path] = {}
+        self._pending: Dict[Path, float] = {}
+
+        self._watch(self._config_dir)
+        self._watch(self._config_dir / "profiles")
+
+    # ------------------------------------------------------------------
+    # Event-source protocol
+    # ------------------------------------------------------------------
+
+    def fileno(self) -> int:
+        return self._inotify.fileno()
+
+    def on_readable(self) -> None:
+        now = self._clock()
+
+        for event in self._inotify.read_events():
+            if event.mask & IN_Q_OVERFLOW:
+                self._rescan(now)
+                continue
+
+            directory = self._watches.get(event.wd)
+            if directory is None:
+                continue
+
+            if event.mask & IN_DELETE_SELF:
+                del self._watches[event.wd]
+                continue
+
+            if event.mask & IN_ISDIR:
+                if event.mask & (IN_CREATE | IN_MOVED_TO) and event.name == "profiles":
+                    self._watch(directory / event.name)
+                    self._rescan(now)
+                continue
+
+            if not _is_yaml(event.name):
+                continue
+
+            path = directory / event.name
+
+            if event.mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                self._pending[path] = now + self._debounce
+            elif event.mask & (IN_DELETE | IN_MOVED_FROM):
+                self._pending.pop(path, None)
+                self._cache.invalidate(path)
+
+    def next_timeout(self) -> Optional[float]:
+        if not self._pending:
+            return None
+        return max(0.0, min(self._pending.values()) - self._clock())
+
+    def on_timeout(self) -> None:
+        now = self._clock()
+        due = [path for path, deadline in self._pending.items() if deadline <= now]
+
+        for path in due:
+            del self._pending[path]
+            self._revalidate(path)
+
+    def close(self) -> None:
+        self._inotify.close()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _watch(self, directory: Path) -> None:
+        try:
+            wd = self._inotify.add_watch(directory, WATCH_MASK)
+        except OSError as exc:
+            logger.debug("Not watching %s: %s", directory, exc)
+            return
+        self._watches[wd] = directory
+
+    def _rescan(self, now: float) -> None:
+        for directory in list(self._watches.values()):
+            for path in _yaml_files(directory):
+                self._pending[path] = now + self._debounce
+
+    def _revalidate(self, path: Path) -> None:
+        fingerprint = file_fingerprint(path)
+        if fingerprint is None:
+            self._cache.invalidate(path)
+            return
+
+        try:
+            result = self._validate_fn(path)
+        except Exception as exc:
+            logger.error("Validation of %s crashed: %s", path, exc)
+            return
+
+        self._cache.put(path, result, fingerprint)
+        logger.info(
+            "Revalidated %s: %s",
+            path,
+            "OK" if result.valid else result.reason,
+        )
+
+        if self._on_verdict is not None:
+            self._on_verdict(path, result)
+
+
+def _is_yaml(name: str) -> bool:
+    return name.endswith(YAML_SUFFIXES) and not name.startswith(".")
+
+
+def _yaml_files(directory: Path) -> List[Path]:
+    try:
+        names: Iterable[str] = os.listdir(directory)
+    except OSError:
+        return []
+    return [directory / name for name in names if _is_yaml(name)]
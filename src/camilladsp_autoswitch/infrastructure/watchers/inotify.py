@@ -0,0 +1,137 @@
+"""
+Minimal inotify binding (Linux only, ctypes, no dependencies).
+
+Exposes a non-blocking file descriptor so it can be multiplexed
+with select/selectors alongside other event sources.
+"""
+
+from dataclasses import dataclass
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+from typing import List
+
+
+# ----------------------------------------------------------------------
+# Constants (from <sys/inotify.h>)
+# ----------------------------------------------------------------------
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+IN_CLOEXEC = os.O_CLOEXEC
+IN_NONBLOCK = os.O_NONBLOCK
+
+_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class InotifyEvent:
+    wd: int
+    mask: int
+    cookie: int
+    name: str
+
+
+def _load_libc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+_libc = _load_libc()
+
+
+def inotify_available() -> bool:
+    return _libc is not None
+
+
+class Inotify:
+    """
+    Non-blocking inotify instance.
+
+    Raises OSError when inotify is not supported on this platform.
+    """
+
+    def __init__(self):
+        if _libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+
+        fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def add_watch(self, path, mask: int) -> int:
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(path))
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        _libc.inotify_rm_watch(self._fd, wd)
+
+    def read_events(self) -> List[InotifyEvent]:
+        """
+        Drain pending events. Returns an empty list when none are queued.
+        """
+        events: List[InotifyEvent] = []
+
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return events
+
+            if not data:
+                return events
+
+            offset = 0
+            while offset + _HEADER.size <= len(data):
+                wd, mask, cookie, length = _HEADER.unpack_from(data, offset)
+                offset += _HEADER.size
+                raw = data[offset:offset + length]
+                offset += length
+                events.append(
+                    InotifyEvent(
+                        wd=wd,
+                        mask=mask,
+                        cookie=cookie,
+                        name=os.fsdecode(raw.rstrip(b"\0")),
+                    )
+                )
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> "Inotify":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,178 @@
+"""
+Single-threaded event loop for the daemon.
+
+Multiplexes every event source (see watchers.base) and timer in one
+selector, so the daemon sleeps in the kernel until an fd is readable
+or a deadline is due: no polling, no idle wakeups.
+
+Thread / signal safety:
+- stop() and call_soon_threadsafe() may be called from other threads
+  and from signal handlers; everything else runs on the loop thread
+- A crashing handler is logged and never stops the loop
+"""
+
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import logging
+import os
+import selectors
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(order=True)
+class Timer:
+    """
+    Handle of a scheduled callback (see EventLoop.call_later).
+    """
+    deadline: float
+    _seq: int
+    callback: Callable[[], None] = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class EventLoop:
+    """
+    Selector loop over event sources, timers and thread-safe callbacks.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._selector = selectors.DefaultSelector()
+        self._sources: List = []
+        self._timers: List[Timer] = []
+        self._counter = itertools.count()
+        self._pending: Deque[Callable[[], None]] = deque()
+        self._stopping = False
+
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        os.set_blocking(self._wakeup_w, False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ, None)
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def add(self, source) -> None:
+        """Multiplex an event source; the loop owns it from now on."""
+        self._selector.register(source.fileno(), selectors.EVENT_READ, source)
+        self._sources.append(source)
+
+    def remove(self, source) -> None:
+        self._selector.unregister(source.fileno())
+        self._sources.remove(source)
+
+    @property
+    def sources(self) -> List:
+        return list(self._sources)
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> Timer:
+        """Run callback once, delay seconds from now (loop thread only)."""
+        timer = Timer(self._clock() + max(0.0, delay), next(self._counter), callback)
+        heapq.heappush(self._timers, timer)
+        return timer
+
+    def call_soon_threadsafe(self, callback: Callable[[], None]) -> None:
+        """Run callback on the loop thread at the next iteration."""
+        self._pending.append(callback)
+        self._wake()
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    def run(self) -> None:
+        """Run until stop() is called."""
+        self._stopping = False
+
+        while not self._stopping:
+            for key, _ in self._selector.select(self._timeout()):
+                if key.data is None:
+                    self._drain_wakeup()
+                else:
+                    self._safely(key.data.on_readable)
+
+            self._run_pending()
+            self._run_timers()
+            self._run_source_timeouts()
+
+    def stop(self) -> None:
+        """Ask run() to return (safe from threads and signal handlers)."""
+        self._stopping = True
+        self._wake()
+
+    def close(self) -> None:
+        """Close every source, then the loop itself."""
+        for source in self._sources:
+            self._safely(source.close)
+        self._sources.clear()
+
+        self._selector.close()
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _timeout(self) -> Optional[float]:
+        if self._pending or self._stopping:
+            return 0
+
+        deadlines = []
+        while self._timers and self._timers[0].cancelled:
+            heapq.heappop(self._timers)
+        if self._timers:
+            deadlines.append(self._timers[0].deadline - self._clock())
+
+        for source in self._sources:
+            timeout = source.next_timeout()
+            if timeout is not None:
+                deadlines.append(timeout)
+
+        return max(0.0, min(deadlines)) if deadlines else None
+
+    def _run_pending(self) -> None:
+        while self._pending:
+            self._safely(self._pending.popleft())
+
+    def _run_timers(self) -> None:
+        now = self._clock()
+        while self._timers and self._timers[0].deadline <= now:
+            timer = heapq.heappop(self._timers)
+            if not timer.cancelled:
+                self._safely(timer.callback)
+
+    def _run_source_timeouts(self) -> None:
+        for source in self._sources:
+            timeout = source.next_timeout()
+            if timeout is not None and timeout <= 0:
+                self._safely(source.on_timeout)
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wakeup_w, b"\0")
+        except BlockingIOError:
+            pass  # already awake
+
+    def _drain_wakeup(self) -> None:
+        try:
+            while os.read(self._wakeup_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    @staticmethod
+    def _safely(callback: Callable[[], None]) -> None:
+        try:
+            callback()
+        except Exception:
+            logger.exception("Event loop callback %r failed", callback)
@@ -0,0 +1,114 @@
+"""
+Runtime state watcher.
+
+Turns changes of state.json (made by cdspctl through an atomic
+os.replace) into typed events on the EventBus, so CLI changes take
+effect immediately without polling.
+"""
+
+import logging
+from pathlib import Path
+import threading
+from typing import List, Optional
+
+from camilladsp_autoswitch.domain.events import (
+    Event,
+    ExperimentalYamlChanged,
+    ModeChanged,
+    ProfileForced,
+)
+from camilladsp_autoswitch.infrastructure import runtime_state
+from camilladsp_autoswitch.infrastructure.runtime_state import CDSPState
+from camilladsp_autoswitch.infrastructure.watchers.base import EventSource
+from camilladsp_autoswitch.infrastructure.watchers.inotify import (
+    IN_CLOSE_WRITE,
+    IN_MOVED_TO,
+    IN_Q_OVERFLOW,
+    Inotify,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def diff_states(old: CDSPState, new: CDSPState) -> List[Event]:
+    """
+    Translate a state change into events (pure).
+    """
+    events: List[Event] = []
+
+    if new.mode != old.mode:
+        events.append(ModeChanged(mode=new.mode, previous=old.mode))
+
+    if (new.profile, new.variant) != (old.profile, old.variant):
+        events.append(ProfileForced(profile=new.profile, variant=new.variant))
+
+    if new.experimental_yml != old.experimental_yml:
+        events.append(ExperimentalYamlChanged(path=new.experimental_yml))
+
+    return events
+
+
+class StateTracker:
+    """
+    Remembers the last seen runtime state and publishes differences.
+
+    refresh() is idempotent: calling it for a change that was already
+    published publishes nothing. It is serialized, so the state watcher
+    and the control server can share one tracker.
+    """
+
+    def __init__(self, bus):
+        self._bus = bus
+        self._lock = threading.RLock()
+        self._state = runtime_state.load_state()
+
+    @property
+    def state(self) -> CDSPState:
+        return self._state
+
+    def refresh(self) -> None:
+        """Reload state.json and publish what changed."""
+        with self._lock:
+            new = runtime_state.load_state()
+            events = diff_states(self._state, new)
+            self._state = new
+
+            for event in events:
+                logger.info("Runtime state change: %s", event)
+                self._bus.publish(event)
+
+
+class StateWatcher(StateTracker, EventSource):
+    """
+    Watches the runtime state directory for a new state.json.
+
+    Implements the event-source protocol (see watchers.base).
+    """
+
+    thread_name = "cdsp-state-watcher"
+
+    def __init__(self, bus, state_dir: Optional[Path] = None):
+        state_dir = Path(state_dir or runtime_state.STATE_DIR)
+        state_dir.mkdir(parents=True, exist_ok=True)
+
+        self._inotify = Inotify()
+        # state.json is only ever published by rename (IN_MOVED_TO);
+        # IN_CLOSE_WRITE covers tools that write it in place.
+        self._inotify.add_watch(state_dir, IN_MOVED_TO | IN_CLOSE_WRITE)
+
+        super().__init__(bus)
+
+    def fileno(self) -> int:
+        return self._inotify.fileno()
+
+    def on_readable(self) -> None:
+        changed = False
+        for event in self._inotify.read_events():
+            if event.mask & IN_Q_OVERFLOW or event.name == runtime_state.STATE_FILE.name:
+                changed = True
+
+        if changed:
+            self.refresh()
+
+    def close(self) -> None:
+        self._inotify.close()
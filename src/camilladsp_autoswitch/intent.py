@@ -7,9 +7,14 @@ not *how* it is executed.
 This is the Use Case boundary.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
-from camilladsp_autoswitch.domain.events import PolicyDecision
+from camilladsp_autoswitch.domain.events import PolicyDecision, intern_event
+from camilladsp_autoswitch.domain.slots import slotted
+from camilladsp_autoswitch.domain.tracing import Trace, follow, trace_field
 
+@slotted
 @dataclass(frozen=True)
 class SwitchIntent:
     """
@@ -18,6 +23,7 @@ class SwitchIntent:
     profile: str
     variant: str | None
     reason: str
+    trace: Trace | None = trace_field()
 
 
 def build_intent_from_policy(decision: PolicyDecision) -> SwitchIntent:
@@ -29,8 +35,10 @@ def build_intent_from_policy(decision: PolicyDecision) -> SwitchIntent:
     - have no side effects
     - contain no I/O
     """
-    return SwitchIntent(
-        profile=decision.profile,
-        variant=decision.variant,
-        reason=decision.reason,
+    return intern_event(
+        SwitchIntent,
+        decision.profile,
+        decision.variant,
+        decision.reason,
+        trace=follow(decision.trace),
     )
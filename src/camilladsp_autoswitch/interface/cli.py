@@ -5,6 +5,10 @@ Design principles:
 - Thin CLI (no business logic)
 - Explicit errors, no stacktraces for users
 - All filesystem paths resolved via config layer
+- Fast startup: cdspctl is called from keymaps, so module level only
+  imports what the runtime commands (status, auto, profile, ...) need.
+  Registry, validators and mapping (PyYAML) are imported by the
+  commands that use them. tests/test_cli_startup.py enforces this.
 """
 
 import argparse
@@ -12,51 +16,139 @@ import sys
 from pathlib import Path
 
 from camilladsp_autoswitch.infrastructure.runtime_state import load_state, update_state
-from camilladsp_autoswitch.infrastructure.filesystem.paths import get_config_dir
+from camilladsp_autoswitch.infrastructure.control.client import try_request
+from camilladsp_autoswitch.infrastructure.control.protocol import ControlError
 
-from camilladsp_autoswitch.registry.profiles import ProfileRegistry
-from camilladsp_autoswitch.registry.errors import ProfileRegistryError
-from camilladsp_autoswitch.validators.camilladsp_validator import (
-    CamillaDSPBinaryValidator,
-)
 
-from camilladsp_autoswitch.application.services.mapping_service import MediaMappingService
-from camilladsp_autoswitch.domain.mapping import MappingError
+# =============================================================================
+# Daemon control
+# =============================================================================
+#
+# Runtime commands go through the daemon control socket when a daemon
+# is running (synchronous, acknowledged with the switch outcome) and
+# fall back to writing state.json directly otherwise.
+#
+
+def _control(cmd: str, **args):
+    """
+    Execute cmd on the running daemon.
+
+    Returns the daemon's result, or None when no daemon is running.
+    """
+    try:
+        return try_request(cmd, **args)
+    except ControlError as exc:
+        sys.exit(f"Daemon rejected '{cmd}': {exc}")
+
+
+def _print_executed(result) -> None:
+    if not result:
+        return
+    for executed in result.get("executed", []):
+        line = f"Switch {executed['outcome']}: {executed['yaml']}"
+        if executed.get("reason"):
+            line += f" ({executed['reason']})"
+        print(line)
 
 
 # =============================================================================
 # Status / Mode
 # =============================================================================
 
-def cmd_status(_args):
-    state = load_state()
+def cmd_status(args):
+    if args.fast:
+        _print_fast_status()
+        return
+
+    result = _control("status")
+    state = result["state"] if result else load_state().__dict__
+
     print("CamillaDSP Autoswitch status:\n")
-    for field, value in state.__dict__.items():
+    for field, value in state.items():
         print(f"{field:16}: {value}")
 
+    if result:
+        daemon = result["daemon"]
+        print(f"{'daemon':16}: pid {daemon['pid']}, up {daemon['uptime']:.0f}s")
+        last = daemon.get("last_switch")
+        if last:
+            print(f"{'last switch':16}: {last['outcome']} {last['yaml']}")
+
+
+def _print_fast_status():
+    import time
+
+    from camilladsp_autoswitch.infrastructure.control.status_segment import (
+        StatusSegmentError,
+        read_status,
+    )
+
+    try:
+        status = read_status()
+    except StatusSegmentError as exc:
+        sys.exit(str(exc))
+    if status is None:
+        sys.exit("No status segment (is the daemon running?)")
+
+    print(f"{'mode':16}: {status.mode}")
+    print(f"{'profile':16}: {status.profile}")
+    print(f"{'variant':16}: {status.variant}")
+    print(f"{'switches':16}: {status.switch_count}")
+    if status.last_switch is not None:
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(status.last_switch))
+        print(f"{'last switch':16}: {stamp} ({status.last_outcome})")
+        print(f"{'apply latency':16}: {status.last_apply_latency * 1000:.1f} ms")
+
+
+def cmd_stats(_args):
+    result = _control("stats")
+    if result is None:
+        sys.exit("No daemon running")
+
+    width = max(16, *(len(key) for key in result))
+    for key, value in result.items():
+        print(f"{key:{width}}: {value}")
+
 
 def cmd_auto(_args):
-    update_state(mode="auto")
+    result = _control("mode", mode="auto")
+    if result is None:
+        update_state(mode="auto")
     print("Mode set to AUTO")
+    _print_executed(result)
 
 
 def cmd_manual(_args):
-    update_state(mode="manual")
+    result = _control("mode", mode="manual")
+    if result is None:
+        update_state(mode="manual")
     print("Mode set to MANUAL")
+    _print_executed(result)
 
 
 def cmd_profile(args):
-    allowed = ("music", "cinema")
+    from camilladsp_autoswitch.infrastructure.filesystem.paths import get_config_dir
+    from camilladsp_autoswitch.registry.profiles import ProfileRegistry
+
+    allowed = ProfileRegistry(get_config_dir()).names()
+    if not allowed:
+        sys.exit("No profiles registered. Use: cdspctl profile-add")
     if args.name not in allowed:
         sys.exit(f"Invalid profile '{args.name}'. Use: {', '.join(allowed)}")
 
-    update_state(profile=args.name)
+    result = _control("profile", name=args.name)
+    if result is None:
+        update_state(profile=args.name)
     print(f"Profile set to {args.name}")
+    _print_executed(result)
 
 
 def cmd_variant(args):
-    update_state(variant=args.name)
+    result = _control("variant", name=args.name)
+    if result is None:
+        update_state(variant=args.name)
     print(f"Variant set to {args.name}")
+    _print_executed(result)
 
 
 # =============================================================================
@@ -68,13 +160,42 @@ def cmd_experimental_on(args):
     if not yml.exists():
         sys.exit(f"YAML file not found: {yml}")
 
-    update_state(experimental_yml=str(yml))
+    result = _control("experimental", path=str(yml))
+    if result is None:
+        update_state(experimental_yml=str(yml))
     print(f"Experimental YAML enabled: {yml}")
+    _print_executed(result)
 
 
 def cmd_experimental_off(_args):
-    update_state(experimental_yml=None)
+    result = _control("experimental", path=None)
+    if result is None:
+        update_state(experimental_yml=None)
     print("Experimental YAML disabled")
+    _print_executed(result)
+
+
+# =============================================================================
+# Tracing
+# =============================================================================
+
+def cmd_trace(args):
+    result = _control("trace", limit=args.last)
+    if result is None:
+        sys.exit("No daemon running")
+
+    traces = result["traces"]
+    if not traces:
+        print("No traces recorded")
+        return
+
+    for trace in traces:
+        print(f"trace {trace['trace_id']} ({trace['root']}): {trace['duration_ms']:.3f} ms")
+        for span in trace["spans"]:
+            line = f"  +{span['offset_ms']:9.3f} ms  {span['name']}"
+            if span["duration_ms"]:
+                line += f" ({span['duration_ms']:.3f} ms)"
+            print(line)
 
 
 # =============================================================================
@@ -82,6 +203,13 @@ def cmd_experimental_off(_args):
 # =============================================================================
 
 def cmd_profile_add(args):
+    from camilladsp_autoswitch.infrastructure.filesystem.paths import get_config_dir
+    from camilladsp_autoswitch.registry.errors import ProfileRegistryError
+    from camilladsp_autoswitch.registry.profiles import ProfileRegistry
+    from camilladsp_autoswitch.validators.camilladsp_validator import (
+        CamillaDSPBinaryValidator,
+    )
+
     registry = ProfileRegistry(
         get_config_dir(),
         validator=CamillaDSPBinaryValidator(),
@@ -107,11 +235,107 @@ def cmd_profile_add(args):
         print(f"Profile '{args.name}' registered")
 
 
+def cmd_profile_import(args):
+    from camilladsp_autoswitch.infrastructure.filesystem.paths import get_config_dir
+    from camilladsp_autoswitch.registry.errors import ProfileRegistryError
+    from camilladsp_autoswitch.registry.profiles import ProfileRegistry
+    from camilladsp_autoswitch.validators.camilladsp_validator import (
+        CamillaDSPBinaryValidator,
+    )
+
+    directory = Path(args.directory).expanduser()
+    if not directory.is_dir():
+        sys.exit(f"Directory not found: {directory}")
+
+    registry = ProfileRegistry(
+        get_config_dir(),
+        validator=CamillaDSPBinaryValidator(),
+    )
+
+    try:
+        report = registry.import_directory(
+            directory,
+            force=args.force,
+            max_workers=args.jobs,
+        )
+    except ProfileRegistryError as exc:
+        sys.exit(str(exc))
+
+    print(report.format())
+
+    if report.failed:
+        sys.exit(1)
+
+
+def cmd_profiles_list(args):
+    from camilladsp_autoswitch.infrastructure.filesystem.paths import get_config_dir
+    from camilladsp_autoswitch.registry.profiles import ProfileRegistry
+
+    registry = ProfileRegistry(get_config_dir())
+    # Reads the manifest only; --rescan re-checks every profile file
+    entries = registry.rebuild() if args.rescan else registry.list()
+
+    if not entries:
+        print("No profiles registered")
+        return
+
+    width = max(len(entry.label) for entry in entries)
+    for entry in entries:
+        flag = "validated" if entry.validated else "unchecked"
+        print(
+            f"{entry.label:{width}}  {entry.size:>9} B  "
+            f"{entry.sha256[:12]}  {flag}"
+        )
+
+    stats = registry.storage_stats()
+    print(
+        f"\n{stats.entries} profile(s), {stats.logical_bytes} B"
+    )
+
+
+def cmd_profiles_check(args):
+    from camilladsp_autoswitch.infrastructure.filesystem.paths import get_config_dir
+    from camilladsp_autoswitch.registry.manifest import parse_profile_filename
+    from camilladsp_autoswitch.registry.profiles import ProfileRegistry
+    from camilladsp_autoswitch.validators.bulk import (
+        discover_profiles,
+        format_timing_table,
+        validate_all,
+    )
+    from camilladsp_autoswitch.validators.camilladsp_validator import (
+        CamillaDSPBinaryValidator,
+    )
+
+    # Same validator as profile-add / profile-import: the manifest's
+    # `validated` flag always means "accepted by camilladsp --check"
+    registry = ProfileRegistry(get_config_dir())
+    # The hashes recorded must be those of the files validated now
+    registry.rebuild()
+    entries = validate_all(
+        discover_profiles(registry.profiles_dir),
+        validate_fn=CamillaDSPBinaryValidator().validate,
+        max_workers=args.jobs,
+    )
+
+    print(format_timing_table(entries))
+
+    for entry in entries:
+        key = parse_profile_filename(entry.path.name)
+        if key is not None:
+            registry.mark_validated(*key, valid=entry.result.valid)
+
+    if any(not entry.result.valid for entry in entries):
+        sys.exit(1)
+
+
 # =============================================================================
 # Mapping
 # =============================================================================
 
 def cmd_mapping_init(args):
+    from camilladsp_autoswitch.application.services.mapping_service import MediaMappingService
+    from camilladsp_autoswitch.domain.mapping import MappingError
+
     service = MediaMappingService()
     try:
         service.init(force=args.force)
@@ -121,6 +345,9 @@ def cmd_mapping_init(args):
 
 
 def cmd_mapping_show(_args):
+    from camilladsp_autoswitch.application.services.mapping_service import MediaMappingService
+    from camilladsp_autoswitch.domain.mapping import MappingError
+
     service = MediaMappingService()
     try:
         print(service.show())
@@ -129,6 +356,9 @@ def cmd_mapping_show(_args):
 
 
 def cmd_mapping_validate(_args):
+    from camilladsp_autoswitch.application.services.mapping_service import MediaMappingService
+    from camilladsp_autoswitch.domain.mapping import MappingError
+
     service = MediaMappingService()
     try:
         service.validate()
@@ -138,6 +368,9 @@ def cmd_mapping_validate(_args):
 
 
 def cmd_mapping_test(args):
+    from camilladsp_autoswitch.application.services.mapping_service import MediaMappingService
+    from camilladsp_autoswitch.domain.mapping import MappingError
+
     service = MediaMappingService()
     try:
         result = service.test(media_active=args.state == "on")
@@ -160,8 +393,17 @@ def build_parser() -> argparse.ArgumentParser:
 
     # status
     p = sub.add_parser("status", help="Show current runtime state")
+    p.add_argument(
+        "--fast",
+        action="store_true",
+        help="Read the daemon's shared-memory status segment (for polling)",
+    )
     p.set_defaults(func=cmd_status)
 
+    # stats
+    p = sub.add_parser("stats", help="Show daemon counters (requests, switches, caches)")
+    p.set_defaults(func=cmd_stats)
+
     # mode
     p = sub.add_parser("auto", help="Enable automatic mode")
     p.set_defaults(func=cmd_auto)
@@ -190,6 +432,17 @@ def build_parser() -> argparse.ArgumentParser:
     p_off = exp.add_parser("off", help="Disable experimental YAML")
     p_off.set_defaults(func=cmd_experimental_off)
 
+    # trace
+    p = sub.add_parser("trace", help="Show timings of recent switches")
+    p.add_argument(
+        "--last",
+        type=int,
+        default=5,
+        metavar="N",
+        help="Number of most recent traces (default: 5)",
+    )
+    p.set_defaults(func=cmd_trace)
+
     # profile add
     p = sub.add_parser("profile-add", help="Register a CamillaDSP YAML profile")
     p.add_argument("name")
@@ -198,6 +451,42 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--force", action="store_true")
     p.set_defaults(func=cmd_profile_add)
 
+    # profile import
+    p = sub.add_parser(
+        "profile-import",
+        help="Register every name[.variant].yml in a directory",
+    )
+    p.add_argument("directory")
+    p.add_argument("--force", action="store_true")
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Maximum parallel validations (default: CPU count)",
+    )
+    p.set_defaults(func=cmd_profile_import)
+
+    # profiles
+    p = sub.add_parser("profiles", help="Inspect registered profiles")
+    prof = p.add_subparsers(dest="profiles_cmd", required=True)
+
+    p_list = prof.add_parser("list", help="List registered profiles")
+    p_list.add_argument(
+        "--rescan",
+        action="store_true",
+        help="Re-check every profile file instead of trusting the manifest",
+    )
+    p_list.set_defaults(func=cmd_profiles_list)
+
+    p_check = prof.add_parser("check", help="Validate all registered profiles")
+    p_check.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Maximum parallel workers (default: CPU count)",
+    )
+    p_check.set_defaults(func=cmd_profiles_check)
+
     # mapping
     p = sub.add_parser("mapping", help="Manage media mapping")
     m = p.add_subparsers(dest="mapping_cmd", required=True)
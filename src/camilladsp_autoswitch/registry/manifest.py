@@ -0,0 +1,201 @@
+"""
+Profile index and manifest.
+
+The registry keeps an in-memory index of (name, variant) → ProfileEntry.
+The index is persisted as a JSON manifest NEXT TO the profiles
+directory (writing it inside would change the very mtime it tracks),
+and is only rebuilt when the profiles directory mtime changes.
+
+Each entry also records its file's own fingerprint (inode, size,
+mtime_ns), as the ValidationCache does: an in-place edit leaves the
+directory mtime alone, so an explicit rebuild (scan with the previous
+index) re-checks entries one stat() each and rehashes (and
+un-validates) the ones that changed.
+"""
+
+from dataclasses import asdict, dataclass
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from camilladsp_autoswitch.infrastructure.filesystem.fingerprint import (
+    Fingerprint,
+    hash_file,
+)
+
+MANIFEST_NAME = "profiles.manifest.json"
+MANIFEST_VERSION = 2
+
+PROFILE_SUFFIX = ".yml"
+
+
+ProfileKey = Tuple[str, Optional[str]]
+
+
+@dataclass(frozen=True)
+class ProfileEntry:
+    """
+    Indexed metadata for one registered profile.
+    """
+    name: str
+    variant: Optional[str]
+    file: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    validated: bool = False
+    inode: int = 0
+
+    @property
+    def key(self) -> ProfileKey:
+        return (self.name, self.variant)
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}.{self.variant}" if self.variant else self.name
+
+    @property
+    def fingerprint(self) -> Fingerprint:
+        return (self.inode, self.size, self.mtime_ns)
+
+
+@dataclass
+class Manifest:
+    dir_mtime_ns: Optional[int]
+    entries: Dict[ProfileKey, ProfileEntry]
+
+
+# ----------------------------------------------------------------------
+# Naming
+# ----------------------------------------------------------------------
+
+def profile_filename(name: str, variant: Optional[str]) -> str:
+    return f"{name}.{variant}{PROFILE_SUFFIX}" if variant else f"{name}{PROFILE_SUFFIX}"
+
+
+def parse_profile_filename(filename: str) -> Optional[ProfileKey]:
+    """
+    'cinema.night.yml' → ('cinema', 'night'); 'music.yml' → ('music', None).
+
+    Returns None for files that are not profiles.
+    """
+    if filename.startswith(".") or not filename.endswith(PROFILE_SUFFIX):
+        return None
+
+    stem = filename[: -len(PROFILE_SUFFIX)]
+    name, _, variant = stem.partition(".")
+    if not name:
+        return None
+    return (name, variant or None)
+
+
+# ----------------------------------------------------------------------
+# Directory scan
+# ----------------------------------------------------------------------
+
+def dir_mtime_ns(directory: Path) -> Optional[int]:
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+def scan(
+    profiles_dir: Path,
+    previous: Optional[Dict[ProfileKey, ProfileEntry]] = None,
+) -> Dict[ProfileKey, ProfileEntry]:
+    """
+    Walk profiles_dir and build a fresh index.
+
+    Files whose fingerprint matches the previous index keep their
+    hash and validated flag instead of being re-read.
+    """
+    previous = previous or {}
+    entries: Dict[ProfileKey, ProfileEntry] = {}
+
+    try:
+        dir_entries = list(os.scandir(profiles_dir))
+    except OSError:
+        return entries
+
+    for dir_entry in dir_entries:
+        key = parse_profile_filename(dir_entry.name)
+        if key is None or not dir_entry.is_file():
+            continue
+
+        st = dir_entry.stat()
+        old = previous.get(key)
+
+        if (
+            old is not None
+            and old.file == dir_entry.name
+            and old.fingerprint == (st.st_ino, st.st_size, st.st_mtime_ns)
+        ):
+            entries[key] = old
+            continue
+
+        entries[key] = _entry(key, Path(dir_entry.path), st, old)
+
+    return entries
+
+
+def _entry(
+    key: ProfileKey,
+    path: Path,
+    st: os.stat_result,
+    old: Optional[ProfileEntry],
+) -> ProfileEntry:
+    digest = hash_file(path)
+    return ProfileEntry(
+        name=key[0],
+        variant=key[1],
+        file=path.name,
+        size=st.st_size,
+        mtime_ns=st.st_mtime_ns,
+        sha256=digest,
+        validated=bool(old and old.validated and old.sha256 == digest),
+        inode=st.st_ino,
+    )
+
+
+# ----------------------------------------------------------------------
+# Persistence
+# ----------------------------------------------------------------------
+
+def load_manifest(path: Path) -> Optional[Manifest]:
+    """
+    Read a manifest. Returns None when missing, corrupted or outdated.
+    """
+    try:
+        data = json.loads(Path(path).read_text())
+        if data.get("version") != MANIFEST_VERSION:
+            return None
+        entries = {}
+        for raw in data["profiles"]:
+            entry = ProfileEntry(**raw)
+            entries[entry.key] = entry
+        return Manifest(dir_mtime_ns=data.get("dir_mtime_ns"), entries=entries)
+    except Exception:
+        return None
+
+
+def write_manifest(path: Path, dir_mtime: Optional[int], entries: Iterable[ProfileEntry]) -> None:
+    """
+    Atomically write a manifest.
+
+    May raise OSError (e.g. read-only config directory).
+    """
+    path = Path(path)
+    data = {
+        "version": MANIFEST_VERSION,
+        "dir_mtime_ns": dir_mtime,
+        "profiles": [
+            asdict(entry)
+            for entry in sorted(entries, key=lambda e: (e.name, e.variant or ""))
+        ],
+    }
+
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2))
+    os.replace(tmp, path)
@@ -1,11 +1,46 @@
+from dataclasses import dataclass, field, replace
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from camilladsp_autoswitch.registry.errors import (
     InvalidYamlError,
     ProfileAlreadyExistsError,
     ProfileNotFoundError,
 )
+from camilladsp_autoswitch.registry.manifest import (
+    MANIFEST_NAME,
+    ProfileEntry,
+    ProfileKey,
+    dir_mtime_ns,
+    load_manifest,
+    parse_profile_filename,
+    profile_filename,
+    scan,
+    write_manifest,
+)
+from camilladsp_autoswitch.registry.store import ProfileStore, StoreStats
+
+
+@dataclass
+class ImportReport:
+    """
+    Outcome of a bulk import: what was committed, what was rejected.
+    """
+    imported: List[ProfileEntry] = field(default_factory=list)
+    failed: List[Tuple[Path, str]] = field(default_factory=list)
+
+    def format(self) -> str:
+        lines = []
+        for entry in self.imported:
+            lines.append(f"✔ {entry.label}")
+        for path, reason in self.failed:
+            lines.append(f"✖ {path.name}")
+            lines.extend(f"    {line}" for line in reason.splitlines())
+        lines.append(
+            f"{len(self.imported)} imported, {len(self.failed)} failed"
+        )
+        return "\n".join(lines)
 
 
 class ProfileRegistry:
@@ -14,14 +49,32 @@ class ProfileRegistry:
 
     Responsibilities:
     - Validate YAML via injected validator
-    - Store YAMLs in a controlled directory
+    - Store YAMLs in a controlled directory, one private file per
+      profile (identical content is reflinked where the filesystem
+      supports it, see registry.store)
     - Resolve YAMLs by (profile, variant)
+    - Keep an index of registered profiles, persisted as a manifest
+      and rebuilt only when the profiles directory mtime changes
+      (entry metadata is re-checked per file by rebuild() only)
     """
 
-    def __init__(self, config_dir: Path, validator):
+    def __init__(self, config_dir: Path, validator=None):
         self._config_dir = Path(config_dir)
         self._profiles_dir = self._config_dir / "profiles"
+        self._manifest_path = self._config_dir / MANIFEST_NAME
         self._validator = validator
+        self._store = ProfileStore(self._profiles_dir)
+
+        self._index: Optional[Dict[ProfileKey, ProfileEntry]] = None
+        self._index_mtime: Optional[int] = None
+
+    @property
+    def profiles_dir(self) -> Path:
+        return self._profiles_dir
+
+    @property
+    def manifest_path(self) -> Path:
+        return self._manifest_path
 
     # ------------------------------------------------------------------
     # Public API
@@ -40,6 +93,9 @@ class ProfileRegistry:
         if not source_path.exists():
             raise InvalidYamlError(f"YAML file not found: {source_path}")
 
+        if self._validator is None:
+            raise InvalidYamlError("No validator configured for this registry")
+
         # Delegate validation (external responsibility)
         self._validator.validate(source_path)
 
@@ -52,24 +108,215 @@ class ProfileRegistry:
                 f"Profile already exists: {target.name}"
             )
 
-        target.write_text(source_path.read_text())
+        index = self._load_index()
+
+        digest = self._store.write(source_path, target, self._clones(index))
+
+        st = target.stat()
+        index[(name, variant)] = ProfileEntry(
+            name=name,
+            variant=variant,
+            file=target.name,
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            sha256=digest,
+            validated=True,
+            inode=st.st_ino,
+        )
+        self._index_mtime = dir_mtime_ns(self._profiles_dir)
+        self._save_manifest()
+
+    def import_directory(
+        self,
+        directory: Path,
+        *,
+        force: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> ImportReport:
+        """
+        Register every `name[.variant].yml` found in directory.
+
+        - Files are validated concurrently (see validators.bulk)
+        - Failures are reported per file and never abort the others
+        - Valid profiles are committed together: all files are staged
+          first, then published, then the manifest is written once
+        """
+        if self._validator is None:
+            raise InvalidYamlError("No validator configured for this registry")
+
+        # Deferred: pulls in concurrent.futures and the YAML stack,
+        # which lookups (cdspctl profile) do not need.
+        from camilladsp_autoswitch.validators.bulk import validate_all
+
+        candidates: Dict[Path, ProfileKey] = {}
+        for path in sorted(Path(directory).glob("*.yml")):
+            key = parse_profile_filename(path.name)
+            if key is not None and path.is_file():
+                candidates[path] = key
+
+        report = ImportReport()
+        index = self._load_index()
+
+        results = validate_all(
+            list(candidates),
+            validate_fn=self._validator.validate,
+            max_workers=max_workers,
+        )
+
+        accepted: List[Tuple[Path, ProfileKey]] = []
+        for result in results:
+            key = candidates[result.path]
+            if not result.result.valid:
+                report.failed.append((result.path, result.result.reason or "invalid"))
+            elif key in index and not force:
+                report.failed.append(
+                    (result.path, f"Profile already exists: {profile_filename(*key)}")
+                )
+            else:
+                accepted.append((result.path, key))
+
+        if not accepted:
+            return report
+
+        self._profiles_dir.mkdir(parents=True, exist_ok=True)
+
+        # Stage (identical files in the batch are cloned from each other)
+        clones = self._clones(index)
+        staged: List[Tuple[Path, Path, ProfileKey, str]] = []
+        try:
+            for source, key in accepted:
+                target = self._profile_path(*key)
+                tmp, digest = self._store.stage(source, target, clones)
+                clones.setdefault(digest, tmp)
+                staged.append((tmp, target, key, digest))
+        except BaseException:
+            for tmp, *_ in staged:
+                tmp.unlink(missing_ok=True)
+            raise
+
+        # Publish
+        for tmp, target, key, digest in staged:
+            os.replace(tmp, target)
+            st = target.stat()
+            entry = ProfileEntry(
+                name=key[0],
+                variant=key[1],
+                file=target.name,
+                size=st.st_size,
+                mtime_ns=st.st_mtime_ns,
+                sha256=digest,
+                validated=True,
+                inode=st.st_ino,
+            )
+            index[key] = entry
+            report.imported.append(entry)
+
+        self._index_mtime = dir_mtime_ns(self._profiles_dir)
+        self._save_manifest()
+        return report
 
     def resolve(self, name: str, variant: Optional[str] = None) -> Path:
-        target = self._profile_path(name, variant)
+        entry = self._load_index().get((name, variant))
 
-        if not target.exists():
+        if entry is None:
             raise ProfileNotFoundError(
-                f"Profile not found: {target.name}"
+                f"Profile not found: {profile_filename(name, variant)}"
             )
 
-        return target
+        return self._profiles_dir / entry.file
+
+    def list(self) -> List[ProfileEntry]:
+        """
+        All registered profiles, sorted by (name, variant).
+
+        Read from the index (the manifest): profile files are not
+        touched, so an in-place edit only shows up after rebuild().
+        """
+        return _sorted(self._load_index().values())
+
+    def rebuild(self) -> List[ProfileEntry]:
+        """
+        Re-check every profile file and return the updated list.
+
+        One stat() per file; files whose fingerprint changed are
+        rehashed, and stay validated only if the content is identical.
+        """
+        self._index = scan(self._profiles_dir, self._load_index())
+        self._index_mtime = dir_mtime_ns(self._profiles_dir)
+        self._save_manifest()
+        return _sorted(self._index.values())
+
+    def names(self) -> List[str]:
+        """Distinct base profile names."""
+        return sorted({entry.name for entry in self._load_index().values()})
+
+    def storage_stats(self) -> StoreStats:
+        """Number and total logical size of the profiles, from the index."""
+        entries = self._load_index().values()
+        return StoreStats(
+            entries=len(entries),
+            logical_bytes=sum(entry.size for entry in entries),
+        )
+
+    def mark_validated(self, name: str, variant: Optional[str], valid: bool = True) -> None:
+        index = self._load_index()
+        entry = index.get((name, variant))
+        if entry is not None and entry.validated != valid:
+            index[(name, variant)] = replace(entry, validated=valid)
+            self._save_manifest()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _clones(self, index: Dict[ProfileKey, ProfileEntry]) -> Dict[str, Path]:
+        """digest → registered profile file, to clone identical content from."""
+        return {
+            entry.sha256: self._profiles_dir / entry.file
+            for entry in index.values()
+        }
+
     def _profile_path(self, name: str, variant: Optional[str]) -> Path:
-        filename = name
-        if variant:
-            filename = f"{name}.{variant}"
-        return self._profiles_dir / f"{filename}.yml"
+        return self._profiles_dir / profile_filename(name, variant)
+
+    def _load_index(self) -> Dict[ProfileKey, ProfileEntry]:
+        """
+        Return the index, rebuilding it only if the directory changed.
+
+        Cost when nothing moved: one stat() of the profiles directory.
+        """
+        current = dir_mtime_ns(self._profiles_dir)
+
+        if self._index is not None and current == self._index_mtime:
+            return self._index
+
+        previous = self._index
+        if previous is None:
+            manifest = load_manifest(self._manifest_path)
+            if manifest is not None:
+                if manifest.dir_mtime_ns == current:
+                    self._index = manifest.entries
+                    self._index_mtime = current
+                    return self._index
+                previous = manifest.entries
+
+        self._index = scan(self._profiles_dir, previous)
+        self._index_mtime = current
+        self._save_manifest()
+        return self._index
+
+    def _save_manifest(self) -> None:
+        try:
+            write_manifest(
+                self._manifest_path,
+                self._index_mtime,
+                (self._index or {}).values(),
+            )
+        except OSError:
+            # Read-only config dir (e.g. unprivileged CLI user):
+            # the in-memory index is still correct.
+            pass
+
+
+def _sorted(entries) -> List[ProfileEntry]:
+    return sorted(entries, key=lambda entry: (entry.name, entry.variant or ""))
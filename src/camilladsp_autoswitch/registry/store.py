@@ -0,0 +1,179 @@
+"""
+Profile file store.
+
+Layout:
+
+    profiles/
+      music.yml                ← private regular file
+      cinema.night.yml         ← private regular file
+
+Every profile is its own inode, so editing one in place (editor,
+`>>`) never changes another. This is not a content-addressed store:
+identical content is only deduplicated on filesystems with reflinks
+(btrfs, XFS), where the new profile is a FICLONE of an existing one
+(extents shared copy-on-write, a write to one file un-shares only that
+file). Elsewhere (ext4, tmpfs) every profile is a full copy, made with
+os.copy_file_range or a streaming copy, in constant memory.
+Every file becomes visible through an atomic rename.
+"""
+
+from dataclasses import dataclass
+import errno
+import fcntl
+import os
+from pathlib import Path
+import secrets
+import shutil
+from typing import Mapping, Optional, Tuple
+
+from camilladsp_autoswitch.infrastructure.filesystem.fingerprint import hash_file
+
+
+PROFILE_MODE = 0o644
+
+# _IOW(0x94, 9, int) from <linux/fs.h>
+FICLONE = 0x40049409
+
+_COPY_CHUNK = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class StoreStats:
+    """
+    Size of the profile store (logical: reflinked extents count once
+    per profile).
+    """
+    entries: int
+    logical_bytes: int
+
+
+# ----------------------------------------------------------------------
+# Zero-copy file copy
+# ----------------------------------------------------------------------
+
+def copy_file(src: Path, dst: Path) -> None:
+    """
+    Copy src to a NEW file dst in constant memory.
+
+    Tries, in order: reflink, copy_file_range, userspace streaming copy.
+    """
+    with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+        if _try_reflink(fsrc.fileno(), fdst.fileno()):
+            return
+        if _try_copy_file_range(fsrc.fileno(), fdst.fileno()):
+            return
+
+        fsrc.seek(0)
+        fdst.seek(0)
+        fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst, _COPY_CHUNK)
+
+
+def _try_reflink(src_fd: int, dst_fd: int) -> bool:
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+    except OSError:
+        return False
+    return True
+
+
+def _try_copy_file_range(src_fd: int, dst_fd: int) -> bool:
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        return False
+
+    try:
+        while copy_range(src_fd, dst_fd, _COPY_CHUNK):
+            pass
+    except OSError as exc:
+        if exc.errno in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+            return False
+        raise
+    return True
+
+
+# ----------------------------------------------------------------------
+# Profile store
+# ----------------------------------------------------------------------
+
+class ProfileStore:
+    """
+    Writes profile files, each with its own inode.
+    """
+
+    def __init__(self, profiles_dir: Path):
+        self._profiles_dir = Path(profiles_dir)
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+
+    def write(
+        self,
+        source: Path,
+        target: Path,
+        clones: Optional[Mapping[str, Path]] = None,
+    ) -> str:
+        """
+        Atomically replace target with a private copy of source.
+
+        Returns the digest of what was written.
+        """
+        tmp, digest = self.stage(source, target, clones)
+        try:
+            os.replace(tmp, target)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return digest
+
+    def stage(
+        self,
+        source: Path,
+        target: Path,
+        clones: Optional[Mapping[str, Path]] = None,
+    ) -> Tuple[Path, str]:
+        """
+        Write a hidden copy of source next to target, without publishing it.
+
+        clones: digest → existing file believed to hold that content.
+        When source's digest is found, the file is cloned from it (a
+        reflink shares extents); the clone is only kept if its digest
+        still matches, otherwise source is copied.
+
+        The caller publishes the copy with os.replace(tmp, target), or
+        unlinks it. Returns (tmp, digest).
+        """
+        target = Path(target)
+        tmp = self._tmp_path(target.parent, target.name)
+
+        try:
+            digest = hash_file(source)
+            clone_from = (clones or {}).get(digest)
+            if clone_from is not None:
+                copy_file(clone_from, tmp)
+                if hash_file(tmp) != digest:
+                    tmp.unlink()
+                    clone_from = None
+            if clone_from is None:
+                copy_file(source, tmp)
+                # The source may have changed since it was hashed:
+                # report what was actually copied.
+                digest = hash_file(tmp)
+
+            with open(tmp, "rb") as f:
+                os.fsync(f.fileno())
+            os.chmod(tmp, PROFILE_MODE)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+        return tmp, digest
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _tmp_path(directory: Path, name: str) -> Path:
+        return directory / f".{name}.{os.getpid()}.{secrets.token_hex(4)}.tmp"
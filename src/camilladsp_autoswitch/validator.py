@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-import yaml
+from camilladsp_autoswitch import yaml_loader
 
 
 @dataclass
@@ -38,12 +38,11 @@ def validate(path: Path) -> ValidationResult:
                 reason=f"YAML file not found: {path}",
             )
 
-        with path.open("r") as f:
-            yaml.safe_load(f)
+        yaml_loader.load_file(path)
 
         return ValidationResult(valid=True)
 
-    except yaml.YAMLError as e:
+    except yaml_loader.YAMLError as e:
         return ValidationResult(
             valid=False,
             reason=f"YAML syntax error: {e}",
@@ -0,0 +1,173 @@
+"""
+Bulk validation of profile YAMLs.
+
+Validates every profile in parallel (process pool, capped at the
+number of CPU cores) and feeds the verdicts into a ValidationCache,
+so the first real switch finds a ready answer.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Callable, Iterable, List, Optional
+
+from camilladsp_autoswitch.infrastructure.filesystem.fingerprint import (
+    file_fingerprint,
+)
+from camilladsp_autoswitch.registry.manifest import parse_profile_filename
+from camilladsp_autoswitch.validator import ValidationResult, validate
+from camilladsp_autoswitch.validators.cache import ValidationCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BulkValidationEntry:
+    """
+    Verdict and timing for a single file.
+    """
+    path: Path
+    result: ValidationResult
+    elapsed: float
+    fingerprint: Optional[tuple] = None
+
+
+# ----------------------------------------------------------------------
+# Discovery
+# ----------------------------------------------------------------------
+
+def discover_profiles(profiles_dir: Path) -> List[Path]:
+    """
+    Return every profile YAML directly under profiles_dir, sorted by name.
+
+    Same naming rule as the registry manifest (`name[.variant].yml`).
+    A missing directory yields an empty list.
+    """
+    profiles_dir = Path(profiles_dir)
+    try:
+        entries = list(os.scandir(profiles_dir))
+    except OSError:
+        return []
+
+    return sorted(
+        profiles_dir / entry.name
+        for entry in entries
+        if parse_profile_filename(entry.name) is not None
+        and entry.is_file()
+    )
+
+
+# ----------------------------------------------------------------------
+# Validation
+# ----------------------------------------------------------------------
+
+def _validate_one(validate_fn: Callable, path: Path) -> BulkValidationEntry:
+    """
+    Worker entry point (must stay module-level to be picklable).
+
+    Accepts both validator styles used in this package:
+    - returns a ValidationResult (validator.validate)
+    - returns None and raises on failure (registry validators)
+    """
+    fingerprint = file_fingerprint(path)
+    started = time.perf_counter()
+    try:
+        result = validate_fn(path)
+        if result is None:
+            result = ValidationResult(valid=True)
+    except Exception as exc:
+        result = ValidationResult(valid=False, reason=str(exc))
+    elapsed = time.perf_counter() - started
+
+    return BulkValidationEntry(
+        path=path,
+        result=result,
+        elapsed=elapsed,
+        fingerprint=fingerprint,
+    )
+
+
+def _worker_count(jobs: int, max_workers: Optional[int]) -> int:
+    workers = min(jobs, os.cpu_count() or 1)
+    if max_workers is not None:
+        workers = min(workers, max_workers)
+    return max(workers, 1)
+
+
+def validate_all(
+    paths: Iterable[Path],
+    *,
+    validate_fn: Callable = validate,
+    cache: Optional[ValidationCache] = None,
+    max_workers: Optional[int] = None,
+) -> List[BulkValidationEntry]:
+    """
+    Validate all paths, in parallel when more than one core is available.
+
+    - Parallelism never exceeds os.cpu_count()
+    - Falls back to in-process validation if the pool cannot be used
+    - Results are stored in `cache` when given
+    - Returned entries keep the input order
+    """
+    paths = [Path(p) for p in paths]
+    workers = _worker_count(len(paths), max_workers)
+
+    entries: Optional[List[BulkValidationEntry]] = None
+
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                entries = list(
+                    pool.map(_validate_one, [validate_fn] * len(paths), paths)
+                )
+        except Exception as exc:
+            logger.warning(
+                "Parallel validation unavailable (%s), validating serially",
+                exc,
+            )
+
+    if entries is None:
+        entries = [_validate_one(validate_fn, path) for path in paths]
+
+    if cache is not None:
+        for entry in entries:
+            if entry.fingerprint is not None:
+                cache.put(entry.path, entry.result, entry.fingerprint)
+
+    return entries
+
+
+# ----------------------------------------------------------------------
+# Reporting
+# ----------------------------------------------------------------------
+
+def format_timing_table(entries: List[BulkValidationEntry]) -> str:
+    """
+    Render a per-file timing table.
+    """
+    if not entries:
+        return "No profiles found"
+
+    width = max(len(entry.path.name) for entry in entries)
+    width = max(width, len("PROFILE"))
+
+    lines = [f"{'PROFILE':{width}}  {'RESULT':7}  {'TIME (ms)':>9}"]
+    for entry in entries:
+        verdict = "OK" if entry.result.valid else "INVALID"
+        lines.append(
+            f"{entry.path.name:{width}}  {verdict:7}  "
+            f"{entry.elapsed * 1000:9.1f}"
+        )
+        if not entry.result.valid and entry.result.reason:
+            lines.append(f"  ↳ {entry.result.reason.splitlines()[0]}")
+
+    total = sum(entry.elapsed for entry in entries)
+    invalid = sum(1 for entry in entries if not entry.result.valid)
+    lines.append(
+        f"{len(entries)} profile(s), {invalid} invalid, "
+        f"{total * 1000:.1f} ms validation time"
+    )
+    return "\n".join(lines)
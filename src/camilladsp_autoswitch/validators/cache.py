@@ -0,0 +1,101 @@
+"""
+Validation cache.
+
+Keeps validation verdicts in memory so the switch path never pays for
+validating a file that has already been checked.
+
+Entries are keyed by path and guarded by a file fingerprint
+(inode, size, mtime_ns): an edited or replaced file is never served
+a stale verdict.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+from camilladsp_autoswitch.infrastructure.filesystem.fingerprint import (
+    Fingerprint,
+    file_fingerprint,
+)
+from camilladsp_autoswitch.validator import ValidationResult
+
+
+class ValidationCache:
+    """
+    Process-local cache of ValidationResult objects.
+
+    Rules:
+    - Missing files are never cached
+    - A verdict is only reused while the fingerprint is unchanged
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Fingerprint, ValidationResult]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get(self, path) -> Optional[ValidationResult]:
+        entry = self._entries.get(str(path))
+        if entry is not None and entry[0] == file_fingerprint(path):
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        return None
+
+    def __contains__(self, path) -> bool:
+        entry = self._entries.get(str(path))
+        return entry is not None and entry[0] == file_fingerprint(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+
+    def put(
+        self,
+        path,
+        result: ValidationResult,
+        fingerprint: Optional[Fingerprint] = None,
+    ) -> None:
+        """
+        Store a verdict.
+
+        Pass the fingerprint taken BEFORE validation when available,
+        so a file modified during validation is not cached as valid.
+        """
+        if fingerprint is None:
+            fingerprint = file_fingerprint(path)
+        if fingerprint is None:
+            return
+        self._entries[str(path)] = (fingerprint, result)
+
+    def invalidate(self, path=None) -> None:
+        """Drop one entry, or every entry when path is None."""
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(str(path), None)
+
+    def wrap(self, validate_fn: Callable) -> Callable:
+        """
+        Return a validate function that consults the cache first.
+        """
+
+        def cached_validate(path):
+            result = self.get(path)
+            if result is not None:
+                return result
+
+            fingerprint = file_fingerprint(path)
+            result = validate_fn(path)
+            if fingerprint is not None:
+                self.put(path, result, fingerprint)
+            return result
+
+        cached_validate.cache = self
+        return cached_validate
@@ -2,6 +2,7 @@ import subprocess
 from pathlib import Path
 
 from camilladsp_autoswitch.registry.errors import InvalidYamlError
+from camilladsp_autoswitch.validators.structure import check_file
 
 
 class CamillaDSPBinaryValidator:
@@ -13,12 +14,14 @@ class CamillaDSPBinaryValidator:
 
     Design goals:
     - Use the same validation logic as production
-    - No YAML parsing or schema reimplementation
     - Fail fast with clear error messages
+    - Cheap in-process structural pre-check first, so the binary
+      is only spawned for configs that pass it (precheck=False disables)
     """
 
-    def __init__(self, binary: str = "camilladsp"):
+    def __init__(self, binary: str = "camilladsp", precheck: bool = True):
         self._binary = binary
+        self._precheck = precheck
 
     def validate(self, path: Path) -> None:
         path = Path(path)
@@ -26,6 +29,14 @@ class CamillaDSPBinaryValidator:
         if not path.exists():
             raise InvalidYamlError(f"YAML file not found: {path}")
 
+        if self._precheck:
+            issues = check_file(path)
+            if issues:
+                raise InvalidYamlError(
+                    "Configuration failed structural checks:\n"
+                    + "\n".join(f"- {issue}" for issue in issues)
+                )
+
         try:
             result = subprocess.run(
                 [self._binary, "--check", str(path)],
@@ -0,0 +1,220 @@
+"""
+In-process structural check of CamillaDSP configs.
+
+A cheap pre-check run before spawning `camilladsp --check`.
+It only catches obvious structural problems:
+
+- missing or malformed `devices`
+- unknown device / filter / processor / pipeline step `type`
+- pipeline steps referencing undefined filters, mixers or processors
+- mixers referencing channels outside their declared range
+
+It is NOT a full schema: anything that passes here is still checked
+by the CamillaDSP binary.
+"""
+
+from pathlib import Path
+from typing import Any, List
+
+from camilladsp_autoswitch import yaml_loader
+
+
+CAPTURE_TYPES = frozenset({
+    "Alsa", "Bluez", "CoreAudio", "File", "Jack", "Pulse", "RawFile",
+    "SignalGenerator", "Stdin", "WavFile", "Wasapi",
+})
+
+PLAYBACK_TYPES = frozenset({
+    "Alsa", "CoreAudio", "File", "Jack", "Pulse", "Stdout", "Wasapi",
+})
+
+FILTER_TYPES = frozenset({
+    "Biquad", "BiquadCombo", "Conv", "Delay", "DiffEq", "Dither",
+    "Gain", "Limiter", "Loudness", "Volume",
+})
+
+PROCESSOR_TYPES = frozenset({"Compressor", "NoiseGate"})
+
+STEP_TYPES = frozenset({"Filter", "Mixer", "Processor"})
+
+
+def check_structure(config: Any) -> List[str]:
+    """
+    Return a list of structural problems (empty when none were found).
+
+    Never raises.
+    """
+    if not isinstance(config, dict):
+        return ["Configuration must be a mapping"]
+
+    issues: List[str] = []
+
+    _check_devices(config.get("devices"), issues)
+
+    filters = _section(config, "filters", issues)
+    mixers = _section(config, "mixers", issues)
+    processors = _section(config, "processors", issues)
+
+    for name, spec in filters.items():
+        _check_typed(f"filter '{name}'", spec, FILTER_TYPES, issues)
+
+    for name, spec in processors.items():
+        _check_typed(f"processor '{name}'", spec, PROCESSOR_TYPES, issues)
+
+    for name, spec in mixers.items():
+        _check_mixer(name, spec, issues)
+
+    _check_pipeline(config.get("pipeline"), filters, mixers, processors, issues)
+
+    return issues
+
+
+def check_file(path: Path) -> List[str]:
+    """
+    Parse a YAML file and return its structural problems.
+    """
+    try:
+        config = yaml_loader.load_file(path)
+    except yaml_loader.YAMLError as exc:
+        return [f"YAML syntax error: {exc}"]
+    except OSError as exc:
+        return [f"Cannot read {path}: {exc}"]
+
+    return check_structure(config)
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+def _section(config: dict, key: str, issues: List[str]) -> dict:
+    value = config.get(key)
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        issues.append(f"'{key}' must be a mapping")
+        return {}
+    return value
+
+
+def _check_devices(devices: Any, issues: List[str]) -> None:
+    if devices is None:
+        issues.append("Missing 'devices' section")
+        return
+    if not isinstance(devices, dict):
+        issues.append("'devices' must be a mapping")
+        return
+
+    for key in ("samplerate", "chunksize"):
+        value = devices.get(key)
+        if not _is_positive_int(value):
+            issues.append(f"'devices.{key}' must be a positive integer")
+
+    for key, known in (("capture", CAPTURE_TYPES), ("playback", PLAYBACK_TYPES)):
+        if key not in devices:
+            issues.append(f"Missing 'devices.{key}'")
+            continue
+        _check_typed(f"devices.{key}", devices[key], known, issues)
+
+
+def _check_typed(label: str, spec: Any, known: frozenset, issues: List[str]) -> None:
+    if not isinstance(spec, dict):
+        issues.append(f"{label} must be a mapping")
+        return
+
+    kind = spec.get("type")
+    if kind is None:
+        issues.append(f"{label} has no 'type'")
+    elif kind not in known:
+        issues.append(f"{label} has unknown type '{kind}'")
+
+
+def _check_mixer(name: str, spec: Any, issues: List[str]) -> None:
+    label = f"mixer '{name}'"
+    if not isinstance(spec, dict):
+        issues.append(f"{label} must be a mapping")
+        return
+
+    channels = spec.get("channels")
+    if not isinstance(channels, dict):
+        issues.append(f"{label} has no 'channels' mapping")
+        return
+
+    n_in = channels.get("in")
+    n_out = channels.get("out")
+    if not (_is_positive_int(n_in) and _is_positive_int(n_out)):
+        issues.append(f"{label} 'channels.in/out' must be positive integers")
+        return
+
+    mapping = spec.get("mapping") or []
+    if not isinstance(mapping, list):
+        issues.append(f"{label} 'mapping' must be a list")
+        return
+
+    for entry in mapping:
+        if not isinstance(entry, dict):
+            issues.append(f"{label} has a malformed mapping entry")
+            continue
+        dest = entry.get("dest")
+        if not _in_range(dest, n_out):
+            issues.append(f"{label} dest channel {dest!r} out of range")
+        for source in entry.get("sources") or []:
+            channel = source.get("channel") if isinstance(source, dict) else None
+            if not _in_range(channel, n_in):
+                issues.append(
+                    f"{label} source channel {channel!r} out of range"
+                )
+
+
+def _check_pipeline(
+    pipeline: Any,
+    filters: dict,
+    mixers: dict,
+    processors: dict,
+    issues: List[str],
+) -> None:
+    if pipeline is None:
+        return
+    if not isinstance(pipeline, list):
+        issues.append("'pipeline' must be a list")
+        return
+
+    for index, step in enumerate(pipeline):
+        label = f"pipeline step {index}"
+        if not isinstance(step, dict):
+            issues.append(f"{label} must be a mapping")
+            continue
+
+        kind = step.get("type")
+        if kind not in STEP_TYPES:
+            issues.append(f"{label} has unknown type '{kind}'")
+            continue
+
+        if kind == "Filter":
+            names = step.get("names")
+            if not isinstance(names, list) or not names:
+                issues.append(f"{label} (Filter) needs a non-empty 'names' list")
+                continue
+            for name in names:
+                if name not in filters:
+                    issues.append(f"{label} references unknown filter '{name}'")
+        elif kind == "Mixer":
+            name = step.get("name")
+            if name not in mixers:
+                issues.append(f"{label} references unknown mixer '{name}'")
+        else:
+            name = step.get("name")
+            if name not in processors:
+                issues.append(f"{label} references unknown processor '{name}'")
+
+
+def _is_positive_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def _in_range(channel: Any, count: int) -> bool:
+    return (
+        isinstance(channel, int)
+        and not isinstance(channel, bool)
+        and 0 <= channel < count
+    )
@@ -0,0 +1,110 @@
+"""
+YAML loading layer.
+
+Every YAML read in camilladsp-autoswitch goes through this module.
+
+- Uses the libyaml-backed CSafeLoader when PyYAML was built with it
+- Falls back to the pure-Python SafeLoader otherwise
+- Parse-once cache: a file is only re-parsed when its fingerprint
+  (inode, size, mtime_ns) changes
+
+Cached documents are SHARED between callers and must be treated
+as read-only.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+import threading
+from typing import Any, Optional
+
+import yaml
+
+from camilladsp_autoswitch.infrastructure.filesystem.fingerprint import (
+    file_fingerprint,
+)
+
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+HAS_LIBYAML = SafeLoader is not yaml.SafeLoader
+
+YAMLError = yaml.YAMLError
+
+
+def safe_load(stream) -> Any:
+    """
+    Drop-in replacement for yaml.safe_load using the fastest safe loader.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+# ============================================================================
+# Parse-once cache
+# ============================================================================
+
+class YamlDocumentCache:
+    """
+    Bounded LRU cache of parsed YAML documents, keyed by path.
+
+    An entry is only served while the file fingerprint is unchanged.
+    Parse errors are not cached: they propagate to the caller.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path) -> Any:
+        key = str(path)
+        fingerprint = file_fingerprint(path)
+
+        if fingerprint is not None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == fingerprint:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+
+        self.misses += 1
+
+        with open(path, "rb") as f:
+            data = safe_load(f)
+
+        if fingerprint is not None:
+            with self._lock:
+                self._entries[key] = (fingerprint, data)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+
+        return data
+
+    def invalidate(self, path=None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(path), None)
+
+
+_document_cache = YamlDocumentCache()
+
+
+def load_file(path: Path, *, cache: Optional[YamlDocumentCache] = None) -> Any:
+    """
+    Parse a YAML file, reusing a previous parse if the file is unchanged.
+
+    Raises:
+        OSError: file cannot be read
+        yaml.YAMLError: file is not valid YAML
+    """
+    return (cache or _document_cache).load(path)
+
+
+def document_cache() -> YamlDocumentCache:
+    """Return the process-wide document cache."""
+    return _document_cache
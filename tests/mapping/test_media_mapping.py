@@ -118,3 +118,30 @@ def test_select_profile_when_media_off(tmp_path):
 
     assert selected.profile == "music"
     assert selected.variant == "normal"
+
+
+def test_dwell_most_specific_key_wins(tmp_path):
+    path = write_mapping(tmp_path, VALID_MAPPING + """
+dwell:
+  default: 2
+  cinema: 10
+  cinema.night: 30
+""")
+    mapping = MediaMapping.load(path)
+
+    assert mapping.dwell_for("cinema", "night") == 30
+    assert mapping.dwell_for("cinema", "day") == 10
+    assert mapping.dwell_for("music", "normal") == 2
+
+
+def test_dwell_defaults_to_zero(tmp_path):
+    mapping = MediaMapping.load(write_mapping(tmp_path, VALID_MAPPING))
+
+    assert mapping.dwell_for("cinema", "night") == 0
+
+
+def test_negative_dwell_rejected(tmp_path):
+    path = write_mapping(tmp_path, VALID_MAPPING + "dwell:\n  cinema: -1\n")
+
+    with pytest.raises(MappingError):
+        MediaMapping.load(path)
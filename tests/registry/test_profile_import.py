@@ -0,0 +1,90 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from camilladsp_autoswitch.registry.errors import InvalidYamlError
+from camilladsp_autoswitch.registry.profiles import ProfileRegistry
+
+
+class RejectBrokenValidator:
+    def validate(self, path: Path) -> None:
+        if "broken" in Path(path).read_text():
+            raise InvalidYamlError(f"Invalid YAML: {Path(path).name}")
+
+
+def make_import_dir(tmp_path: Path) -> Path:
+    source = tmp_path / "import"
+    source.mkdir()
+    (source / "room.yml").write_text("base")
+    (source / "room.night.yml").write_text("night")
+    (source / "room.day.yml").write_text("night")
+    (source / "room.bad.yml").write_text("broken")
+    (source / "README.txt").write_text("ignored")
+    return source
+
+
+def test_import_commits_valid_and_reports_failures(tmp_path):
+    config_dir = tmp_path / "config"
+    registry = ProfileRegistry(config_dir, validator=RejectBrokenValidator())
+
+    report = registry.import_directory(make_import_dir(tmp_path))
+
+    assert sorted(e.label for e in report.imported) == [
+        "room", "room.day", "room.night",
+    ]
+    assert [path.name for path, _ in report.failed] == ["room.bad.yml"]
+    assert "Invalid YAML" in report.failed[0][1]
+    assert registry.resolve("room", "night").read_text() == "night"
+    assert registry.storage_stats().entries == 3
+    assert "3 imported, 1 failed" in report.format()
+
+
+def test_import_writes_manifest_once(tmp_path):
+    registry = ProfileRegistry(tmp_path / "config", validator=RejectBrokenValidator())
+    registry.list()  # build the (empty) index first
+
+    with patch("camilladsp_autoswitch.registry.profiles.write_manifest") as write:
+        registry.import_directory(make_import_dir(tmp_path))
+
+    write.assert_called_once()
+
+
+def test_import_does_not_overwrite_without_force(tmp_path):
+    config_dir = tmp_path / "config"
+    registry = ProfileRegistry(config_dir, validator=RejectBrokenValidator())
+    source = make_import_dir(tmp_path)
+    registry.import_directory(source)
+
+    (source / "room.yml").write_text("changed")
+    report = registry.import_directory(source)
+
+    assert report.imported == []
+    assert registry.resolve("room").read_text() == "base"
+
+    report = registry.import_directory(source, force=True)
+
+    assert len(report.imported) == 3
+    assert registry.resolve("room").read_text() == "changed"
+
+
+def test_staging_failure_publishes_nothing(tmp_path):
+    config_dir = tmp_path / "config"
+    registry = ProfileRegistry(config_dir, validator=RejectBrokenValidator())
+    original_stage = registry._store.stage
+    calls = []
+
+    def failing_stage(source, target, clones=None):
+        calls.append(target)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        return original_stage(source, target, clones)
+
+    with patch.object(registry._store, "stage", side_effect=failing_stage):
+        with pytest.raises(OSError):
+            registry.import_directory(make_import_dir(tmp_path))
+
+    profiles_dir = config_dir / "profiles"
+    assert [n for n in os.listdir(profiles_dir) if not n.startswith(".")] == []
+    assert os.listdir(profiles_dir) == []
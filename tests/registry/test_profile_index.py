@@ -0,0 +1,185 @@
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from camilladsp_autoswitch.registry.manifest import (
+    MANIFEST_NAME,
+    parse_profile_filename,
+)
+from camilladsp_autoswitch.registry.profiles import ProfileRegistry
+
+
+class AlwaysValidValidator:
+    def validate(self, path: Path) -> None:
+        return None
+
+
+def make_registry(config_dir: Path) -> ProfileRegistry:
+    return ProfileRegistry(config_dir, validator=AlwaysValidValidator())
+
+
+def add(registry, tmp_path, name, variant=None, content="dummy"):
+    source = tmp_path / f"src-{name}-{variant}.yml"
+    source.write_text(content)
+    registry.add(name=name, variant=variant, source_path=source)
+
+
+def test_parse_profile_filename():
+    assert parse_profile_filename("music.yml") == ("music", None)
+    assert parse_profile_filename("cinema.night.yml") == ("cinema", "night")
+    assert parse_profile_filename(".hidden.yml") is None
+    assert parse_profile_filename("notes.txt") is None
+
+
+def test_list_and_names(tmp_path):
+    registry = make_registry(tmp_path / "config")
+    add(registry, tmp_path, "music")
+    add(registry, tmp_path, "cinema", "night")
+    add(registry, tmp_path, "cinema", "day")
+
+    labels = [entry.label for entry in registry.list()]
+
+    assert labels == ["cinema.day", "cinema.night", "music"]
+    assert registry.names() == ["cinema", "music"]
+    assert all(entry.validated for entry in registry.list())
+
+
+def test_manifest_is_written(tmp_path):
+    config_dir = tmp_path / "config"
+    registry = make_registry(config_dir)
+    add(registry, tmp_path, "music", content="hello")
+
+    data = json.loads((config_dir / MANIFEST_NAME).read_text())
+
+    (entry,) = data["profiles"]
+    assert entry["name"] == "music"
+    assert entry["size"] == 5
+    assert entry["validated"] is True
+
+
+def test_fresh_registry_reads_manifest_without_walking(tmp_path):
+    config_dir = tmp_path / "config"
+    add(make_registry(config_dir), tmp_path, "music")
+
+    with patch("os.scandir") as scandir:
+        entries = make_registry(config_dir).list()
+
+    scandir.assert_not_called()
+    assert [entry.label for entry in entries] == ["music"]
+
+
+def test_profiles_list_reads_manifest_only(tmp_path, monkeypatch, capsys):
+    from types import SimpleNamespace
+
+    from camilladsp_autoswitch.interface import cli
+
+    config_dir = tmp_path / "config"
+    add(make_registry(config_dir), tmp_path, "music", content="12345")
+    monkeypatch.setenv("CDSP_CONFIG_DIR", str(config_dir))
+
+    with patch("os.scandir") as scandir, \
+            patch("camilladsp_autoswitch.registry.manifest.hash_file") as hash_file:
+        cli.cmd_profiles_list(SimpleNamespace(rescan=False))
+
+    scandir.assert_not_called()
+    hash_file.assert_not_called()
+    assert "1 profile(s), 5 B" in capsys.readouterr().out
+
+
+def test_resolve_does_not_stat_profile_files(tmp_path):
+    config_dir = tmp_path / "config"
+    registry = make_registry(config_dir)
+    add(registry, tmp_path, "music")
+
+    with patch.object(Path, "exists") as exists:
+        resolved = registry.resolve("music")
+
+    exists.assert_not_called()
+    assert resolved == config_dir / "profiles" / "music.yml"
+
+
+def test_index_rebuilt_when_directory_changes(tmp_path):
+    config_dir = tmp_path / "config"
+    registry = make_registry(config_dir)
+    add(registry, tmp_path, "music")
+
+    profiles_dir = config_dir / "profiles"
+    (profiles_dir / "cinema.night.yml").write_text("copied by hand")
+    st = os.stat(profiles_dir)
+    os.utime(profiles_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    labels = [entry.label for entry in registry.list()]
+
+    assert labels == ["cinema.night", "music"]
+    assert registry.resolve("cinema", "night").name == "cinema.night.yml"
+    unchecked = {e.label: e.validated for e in registry.list()}
+    assert unchecked == {"cinema.night": False, "music": True}
+
+
+def test_corrupted_manifest_is_rebuilt(tmp_path):
+    config_dir = tmp_path / "config"
+    add(make_registry(config_dir), tmp_path, "music")
+    (config_dir / MANIFEST_NAME).write_text("{broken")
+
+    assert make_registry(config_dir).names() == ["music"]
+
+
+def test_in_place_edit_invalidates_entry(tmp_path):
+    config_dir = tmp_path / "config"
+    registry = make_registry(config_dir)
+    add(registry, tmp_path, "music", content="original")
+    profiles_dir = config_dir / "profiles"
+    dir_mtime = os.stat(profiles_dir).st_mtime_ns
+
+    # Rewrite in place: same inode, directory mtime untouched
+    path = profiles_dir / "music.yml"
+    os.chmod(path, 0o644)
+    with open(path, "r+") as f:
+        f.write("modified!")
+    assert os.stat(profiles_dir).st_mtime_ns == dir_mtime
+
+    registry = make_registry(config_dir)
+    (listed,) = registry.list()
+    assert listed.size == len("original")  # the manifest is trusted
+
+    (entry,) = registry.rebuild()
+
+    assert entry.size == len("modified!")
+    assert entry.validated is False
+    assert make_registry(config_dir).list() == [entry]
+
+
+def test_yaml_suffix_is_not_a_profile(tmp_path):
+    from camilladsp_autoswitch.validators.bulk import discover_profiles
+
+    (tmp_path / "music.yaml").write_text("devices: {}\n")
+    (tmp_path / "cinema.yml").write_text("devices: {}\n")
+
+    assert parse_profile_filename("music.yaml") is None
+    assert [path.name for path in discover_profiles(tmp_path)] == ["cinema.yml"]
+
+
+def test_profiles_check_uses_camilladsp_validator(tmp_path, monkeypatch, capsys):
+    from types import SimpleNamespace
+
+    import pytest
+
+    from camilladsp_autoswitch.interface import cli
+    from camilladsp_autoswitch.registry.errors import InvalidYamlError
+    from camilladsp_autoswitch.validators.camilladsp_validator import CamillaDSPBinaryValidator
+
+    config_dir = tmp_path / "config"
+    add(make_registry(config_dir), tmp_path, "music", content="devices: {}\n")
+    monkeypatch.setenv("CDSP_CONFIG_DIR", str(config_dir))
+
+    def reject(self, path):
+        raise InvalidYamlError("CamillaDSP rejected the configuration.")
+
+    monkeypatch.setattr(CamillaDSPBinaryValidator, "validate", reject)
+
+    with pytest.raises(SystemExit):
+        cli.cmd_profiles_check(SimpleNamespace(jobs=1))
+
+    (entry,) = make_registry(config_dir).list()
+    assert entry.validated is False
@@ -0,0 +1,96 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from camilladsp_autoswitch.registry import store
+from camilladsp_autoswitch.infrastructure.filesystem.fingerprint import hash_file
+from camilladsp_autoswitch.registry.profiles import ProfileRegistry
+from camilladsp_autoswitch.registry.store import ProfileStore, copy_file
+
+
+class AlwaysValidValidator:
+    def validate(self, path: Path) -> None:
+        return None
+
+
+def write_yaml(path: Path, content: str) -> Path:
+    path.write_text(content)
+    return path
+
+
+def test_identical_variants_get_private_files(tmp_path):
+    config_dir = tmp_path / "config"
+    source = write_yaml(tmp_path / "room.yml", "x" * 10_000)
+    registry = ProfileRegistry(config_dir, validator=AlwaysValidValidator())
+
+    for i in range(10):
+        registry.add(name="room", variant=f"v{i}", source_path=source)
+
+    stats = registry.storage_stats()
+
+    assert stats.entries == 10
+    assert stats.logical_bytes == 100_000
+
+    stored = config_dir / "profiles" / "room.v3.yml"
+    assert os.stat(stored).st_nlink == 1
+    assert hash_file(stored) == registry.list()[3].sha256
+
+
+def test_in_place_edit_changes_only_that_profile(tmp_path):
+    config_dir = tmp_path / "config"
+    source = write_yaml(tmp_path / "room.yml", "a: 1\n")
+    registry = ProfileRegistry(config_dir, validator=AlwaysValidValidator())
+    registry.add(name="room", variant="day", source_path=source)
+    registry.add(name="room", variant="night", source_path=source)
+
+    with open(registry.resolve("room", "day"), "a") as f:
+        f.write("b: 2\n")
+
+    assert registry.resolve("room", "night").read_text() == "a: 1\n"
+
+
+def test_clone_with_stale_content_falls_back_to_source(tmp_path):
+    source = write_yaml(tmp_path / "a.yml", "a: 1\n")
+    stale = write_yaml(tmp_path / "stale.yml", "edited since\n")
+    profiles_dir = tmp_path / "profiles"
+    profiles_dir.mkdir()
+
+    digest = ProfileStore(profiles_dir).write(
+        source, profiles_dir / "a.yml", {hash_file(source): stale}
+    )
+
+    assert (profiles_dir / "a.yml").read_text() == "a: 1\n"
+    assert digest == hash_file(source)
+
+
+def test_no_temp_files_left_behind(tmp_path):
+    source = write_yaml(tmp_path / "a.yml", "a: 1\n")
+    profiles_dir = tmp_path / "profiles"
+    profiles_dir.mkdir()
+
+    ProfileStore(profiles_dir).write(source, profiles_dir / "a.yml")
+
+    assert [name for name in os.listdir(profiles_dir) if name.endswith(".tmp")] == []
+
+
+def test_copy_file_streams_large_files(tmp_path):
+    src = tmp_path / "big.yml"
+    with open(src, "wb") as f:
+        for i in range(64):
+            f.write(bytes([i]) * 65536)
+    dst = tmp_path / "copy.yml"
+
+    copy_file(src, dst)
+
+    assert hash_file(dst) == hash_file(src)
+
+
+def test_copy_file_falls_back_to_streaming(tmp_path):
+    src = write_yaml(tmp_path / "a.yml", "a: 1\n" * 1000)
+    dst = tmp_path / "b.yml"
+
+    with patch.object(store, "_try_reflink", return_value=False), \
+            patch.object(store, "_try_copy_file_range", return_value=False):
+        copy_file(src, dst)
+
+    assert dst.read_text() == src.read_text()
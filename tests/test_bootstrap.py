@@ -19,3 +19,83 @@ def test_bootstrap_full_pipeline_triggers_apply():
     bus.publish(ProcessStarted(name="kodi"))
 
     apply.assert_called_once_with("/tmp/cinema.yml")
+
+
+def test_bootstrap_resolves_registered_profiles(tmp_path, monkeypatch):
+    from camilladsp_autoswitch import bootstrap as bootstrap_module
+    from camilladsp_autoswitch.infrastructure.runtime_state import CDSPState
+    from camilladsp_autoswitch.intent import SwitchIntent
+
+    state = CDSPState()
+    monkeypatch.setattr(bootstrap_module, "load_state", lambda: state)
+
+    apply = MagicMock()
+    validate = MagicMock()
+    validate.return_value.valid = True
+
+    bus = bootstrap(
+        validate_fn=validate,
+        apply_fn=apply,
+        config_dir=tmp_path,
+        enable_event_store=False,
+    )
+
+    bus.publish(SwitchIntent(profile="cinema", variant="night", reason="test"))
+    apply.assert_called_with(tmp_path / "profiles" / "cinema.night.yml")
+
+    state.experimental_yml = str(tmp_path / "try.yml")
+    bus.publish(SwitchIntent(profile="cinema", variant="night", reason="test"))
+    apply.assert_called_with(tmp_path / "try.yml")
+
+
+def test_bootstrap_prestages_opposite_side(tmp_path):
+    import time
+
+    from camilladsp_autoswitch.domain.mapping import MediaMapping, ProfileSelection
+
+    (tmp_path / "music.yml").write_text("devices: {}\n")
+    validate = MagicMock()
+    validate.return_value.valid = True
+
+    bus = bootstrap(
+        resolve_yaml=lambda intent: tmp_path / f"{intent.profile}.yml",
+        validate_fn=validate,
+        apply_fn=MagicMock(),
+        mapping=MediaMapping(on=ProfileSelection("cinema"), off=ProfileSelection("music")),
+        enable_event_store=False,
+        prestage=True,
+    )
+    try:
+        bus.publish(ProcessStarted(name="kodi"))
+
+        deadline = time.monotonic() + 5
+        while bus.prestager.staged is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert bus.prestager.staged == tmp_path / "music.yml"
+        validate.assert_any_call(tmp_path / "music.yml")
+    finally:
+        bus.prestager.close()
+
+
+def test_bootstrap_applies_idle_profile_when_no_media_process_runs(monkeypatch):
+    from camilladsp_autoswitch import bootstrap as bootstrap_module
+    from camilladsp_autoswitch.infrastructure.runtime_state import CDSPState
+
+    monkeypatch.setattr(bootstrap_module, "load_state", lambda: CDSPState())
+
+    apply = MagicMock()
+    validate = MagicMock()
+    validate.return_value.valid = True
+
+    bus = bootstrap(
+        resolve_yaml=lambda intent: f"/tmp/{intent.profile}.yml",
+        validate_fn=validate,
+        apply_fn=apply,
+        watch_processes=True,
+        media_processes=["no-such-media-player"],
+        enable_event_store=False,
+    )
+    try:
+        apply.assert_called_once_with("/tmp/music.yml")
+    finally:
+        bus.process_watcher.stop()
@@ -0,0 +1,96 @@
+from unittest.mock import MagicMock
+
+from camilladsp_autoswitch.bootstrap import bootstrap
+from camilladsp_autoswitch.validator import validate
+from camilladsp_autoswitch.validators.bulk import (
+    discover_profiles,
+    format_timing_table,
+    validate_all,
+)
+from camilladsp_autoswitch.validators.cache import ValidationCache
+
+
+def write_profiles(profiles_dir):
+    profiles_dir.mkdir(parents=True)
+    (profiles_dir / "music.yml").write_text("devices:\n  samplerate: 48000\n")
+    (profiles_dir / "cinema.night.yml").write_text("devices: {}\n")
+    (profiles_dir / "broken.yml").write_text("this: [ is: not: valid")
+    (profiles_dir / "notes.txt").write_text("ignored")
+    return profiles_dir
+
+
+def test_discover_profiles_only_returns_yaml(tmp_path):
+    profiles_dir = write_profiles(tmp_path / "profiles")
+
+    names = [p.name for p in discover_profiles(profiles_dir)]
+
+    assert names == ["broken.yml", "cinema.night.yml", "music.yml"]
+
+
+def test_discover_missing_directory_is_empty(tmp_path):
+    assert discover_profiles(tmp_path / "missing") == []
+
+
+def test_validate_all_fills_cache(tmp_path):
+    profiles_dir = write_profiles(tmp_path / "profiles")
+    cache = ValidationCache()
+
+    entries = validate_all(
+        discover_profiles(profiles_dir),
+        cache=cache,
+        max_workers=2,
+    )
+
+    verdicts = {entry.path.name: entry.result.valid for entry in entries}
+    assert verdicts == {
+        "broken.yml": False,
+        "cinema.night.yml": True,
+        "music.yml": True,
+    }
+    assert len(cache) == 3
+    assert cache.get(profiles_dir / "music.yml").valid is True
+
+
+def test_cache_invalidated_when_file_changes(tmp_path):
+    profiles_dir = write_profiles(tmp_path / "profiles")
+    cache = ValidationCache()
+    validate_all([profiles_dir / "music.yml"], cache=cache)
+
+    (profiles_dir / "music.yml").write_text("this: [ is: not: valid, longer")
+
+    assert cache.get(profiles_dir / "music.yml") is None
+
+
+def test_cached_validate_skips_second_validation(tmp_path):
+    path = tmp_path / "music.yml"
+    path.write_text("devices: {}\n")
+
+    inner = MagicMock(side_effect=validate)
+    cached = ValidationCache().wrap(inner)
+
+    assert cached(path).valid is True
+    assert cached(path).valid is True
+    inner.assert_called_once_with(path)
+
+
+def test_timing_table_lists_every_file(tmp_path):
+    profiles_dir = write_profiles(tmp_path / "profiles")
+
+    table = format_timing_table(validate_all(discover_profiles(profiles_dir)))
+
+    assert "music.yml" in table
+    assert "INVALID" in table
+    assert "3 profile(s), 1 invalid" in table
+
+
+def test_bootstrap_warms_validation_cache(tmp_path):
+    profiles_dir = write_profiles(tmp_path / "profiles")
+
+    bus = bootstrap(
+        apply_fn=MagicMock(),
+        warm_cache=True,
+        config_dir=tmp_path,
+    )
+
+    assert (profiles_dir / "music.yml") in bus.validation_cache
+    assert len(bus.warmup_report) == 3
@@ -0,0 +1,82 @@
+"""
+Imports of the cdspctl runtime commands.
+
+cdspctl is called from Kodi keymaps: heavy dependencies must only be
+imported by the commands that use them (see interface/cli.py).
+
+Checked on the set of modules imported, not on wall-clock time (which
+depends on the machine and its load).
+"""
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+import camilladsp_autoswitch
+
+SRC_DIR = Path(camilladsp_autoswitch.__file__).resolve().parent.parent
+
+FORBIDDEN = (
+    "yaml",
+    "concurrent.futures",
+    "multiprocessing",
+    "subprocess",
+    "camilladsp_autoswitch.application",
+    "camilladsp_autoswitch.domain.mapping",
+    "camilladsp_autoswitch.registry",
+    "camilladsp_autoswitch.validators",
+    "camilladsp_autoswitch.yaml_loader",
+)
+
+
+def run_importtime(tmp_path, argv):
+    env = dict(
+        os.environ,
+        PYTHONPATH=str(SRC_DIR),
+        CDSP_STATE_DIR=str(tmp_path),
+        CDSP_CONTROL_SOCKET=str(tmp_path / "no-daemon.sock"),
+        CDSP_STATUS_SEGMENT=str(tmp_path / "no-daemon.status"),
+    )
+    code = (
+        "import sys; sys.argv = ['cdspctl'] + sys.argv[1:]\n"
+        "from camilladsp_autoswitch.interface import cli\n"
+        "try:\n"
+        "    cli.main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *argv],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imports = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            imports.add(name.strip())
+    return imports
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["status"], ["status", "--fast"], ["auto"]],
+    ids=" ".join,
+)
+def test_runtime_commands_skip_heavy_imports(tmp_path, argv):
+    imports = run_importtime(tmp_path, argv)
+
+    assert "camilladsp_autoswitch.interface.cli" in imports
+    loaded = [
+        name for name in imports
+        if any(name == mod or name.startswith(mod + ".") for mod in FORBIDDEN)
+    ]
+    assert loaded == []
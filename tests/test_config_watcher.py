@@ -0,0 +1,134 @@
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from camilladsp_autoswitch.infrastructure.watchers.config_watcher import ConfigWatcher
+from camilladsp_autoswitch.infrastructure.watchers.inotify import inotify_available
+from camilladsp_autoswitch.validator import validate
+from camilladsp_autoswitch.validators.cache import ValidationCache
+
+pytestmark = pytest.mark.skipif(
+    not inotify_available(), reason="inotify not available"
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_watcher(config_dir, validate_fn=validate, clock=None):
+    (config_dir / "profiles").mkdir(parents=True, exist_ok=True)
+    cache = ValidationCache()
+    watcher = ConfigWatcher(
+        config_dir,
+        validate_fn=validate_fn,
+        cache=cache,
+        debounce=0.2,
+        clock=clock or FakeClock(),
+    )
+    return watcher, cache
+
+
+def test_written_profile_is_revalidated_after_debounce(tmp_path):
+    clock = FakeClock()
+    watcher, cache = make_watcher(tmp_path, clock=clock)
+    path = tmp_path / "profiles" / "music.yml"
+
+    path.write_text("devices: {}\n")
+    watcher.on_readable()
+
+    watcher.on_timeout()
+    assert path not in cache  # still inside the debounce window
+
+    clock.now += 0.3
+    watcher.on_timeout()
+    assert cache.get(path).valid is True
+    assert watcher.next_timeout() is None
+
+    watcher.stop()
+
+
+def test_write_burst_validates_once(tmp_path):
+    clock = FakeClock()
+    validate_fn = MagicMock(side_effect=validate)
+    watcher, cache = make_watcher(tmp_path, validate_fn=validate_fn, clock=clock)
+    path = tmp_path / "music.yml"
+
+    for i in range(5):
+        path.write_text(f"v: {i}\n")
+        watcher.on_readable()
+        clock.now += 0.05
+
+    clock.now += 0.3
+    watcher.on_timeout()
+
+    validate_fn.assert_called_once_with(path)
+    watcher.stop()
+
+
+def test_moved_into_place_is_revalidated(tmp_path):
+    clock = FakeClock()
+    watcher, cache = make_watcher(tmp_path, clock=clock)
+    tmp_file = tmp_path / ".music.yml.swp"
+    target = tmp_path / "profiles" / "music.yml"
+
+    tmp_file.write_text("this: [ is: not: valid")
+    os.replace(tmp_file, target)
+    watcher.on_readable()
+    clock.now += 0.3
+    watcher.on_timeout()
+
+    assert cache.get(target).valid is False
+    watcher.stop()
+
+
+def test_deleted_profile_is_evicted(tmp_path):
+    watcher, cache = make_watcher(tmp_path)
+    path = tmp_path / "profiles" / "music.yml"
+    path.write_text("devices: {}\n")
+    cache.put(path, validate(path))
+
+    path.unlink()
+    watcher.on_readable()
+
+    assert len(cache) == 0
+    watcher.stop()
+
+
+def test_non_yaml_files_are_ignored(tmp_path):
+    watcher, _ = make_watcher(tmp_path)
+
+    (tmp_path / "notes.txt").write_text("x")
+    watcher.on_readable()
+
+    assert watcher.next_timeout() is None
+    watcher.stop()
+
+
+def test_background_thread_updates_cache(tmp_path):
+    (tmp_path / "profiles").mkdir()
+    cache = ValidationCache()
+    watcher = ConfigWatcher(
+        tmp_path,
+        validate_fn=validate,
+        cache=cache,
+        debounce=0.01,
+    )
+    watcher.start()
+    path = tmp_path / "profiles" / "cinema.yml"
+
+    try:
+        path.write_text("devices: {}\n")
+        deadline = time.monotonic() + 2
+        while path not in cache and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+
+    assert cache.get(path).valid is True
@@ -0,0 +1,184 @@
+import importlib
+import os
+import socket
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from camilladsp_autoswitch.application.handlers.intent_executor_handler import (
+    IntentExecutorHandler,
+)
+from camilladsp_autoswitch.application.handlers.runtime_state_handler import (
+    RuntimeStateHandler,
+)
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.infrastructure.control.client import (
+    ControlClient,
+    try_request,
+)
+from camilladsp_autoswitch.infrastructure.control.protocol import (
+    ControlError,
+    ControlUnavailable,
+)
+from camilladsp_autoswitch.infrastructure.control.server import ControlServer
+from camilladsp_autoswitch.infrastructure.watchers.state_watcher import StateTracker
+from camilladsp_autoswitch.interface import cli
+
+
+@pytest.fixture
+def runtime_state(tmp_path):
+    os.environ["CDSP_STATE_DIR"] = str(tmp_path)
+    from camilladsp_autoswitch import runtime_state
+    importlib.reload(runtime_state)
+    return runtime_state
+
+
+@pytest.fixture
+def daemon(tmp_path, runtime_state, monkeypatch):
+    socket_path = tmp_path / "control.sock"
+    monkeypatch.setenv("CDSP_CONTROL_SOCKET", str(socket_path))
+
+    bus = EventBus()
+    apply = MagicMock()
+
+    RuntimeStateHandler(bus)
+    IntentExecutorHandler(
+        bus,
+        resolve_yaml=lambda intent: Path(f"/profiles/{intent.profile}.yml"),
+        validate=lambda path: SimpleNamespace(valid=True, reason=None),
+        apply=apply,
+    )
+
+    server = ControlServer(bus, tracker=StateTracker(bus), path=socket_path)
+    server.start()
+    try:
+        yield SimpleNamespace(server=server, apply=apply, path=socket_path)
+    finally:
+        server.stop()
+
+
+def test_status_round_trip(daemon):
+    result = ControlClient(daemon.path).request("status")
+
+    assert result["state"]["mode"] == "auto"
+    assert result["daemon"]["pid"] == os.getpid()
+    assert result["daemon"]["last_switch"] is None
+
+
+def test_mutation_is_acknowledged_with_switch_outcome(daemon, runtime_state):
+    client = ControlClient(daemon.path)
+
+    client.request("mode", mode="manual")
+    result = client.request("profile", name="cinema")
+
+    assert result["state"]["profile"] == "cinema"
+    [executed] = result["executed"]
+    assert executed["profile"] == "cinema"
+    assert executed["variant"] == "normal"
+    assert executed["yaml"] == "/profiles/cinema.yml"
+    assert executed["outcome"] == "applied"
+    assert executed["latency"] >= 0
+    assert runtime_state.load_state().profile == "cinema"
+    daemon.apply.assert_called_with(Path("/profiles/cinema.yml"))
+
+
+def test_repeated_request_reports_no_new_switch(daemon):
+    client = ControlClient(daemon.path)
+    client.request("mode", mode="manual")
+
+    result = client.request("mode", mode="manual")
+
+    assert result["executed"] == []
+
+
+def test_bad_requests_are_rejected(daemon):
+    client = ControlClient(daemon.path)
+
+    with pytest.raises(ControlError, match="Invalid mode"):
+        client.request("mode", mode="turbo")
+
+    with pytest.raises(ControlError, match="Unknown command"):
+        client.request("reboot")
+
+    with pytest.raises(ControlError):
+        client.request("profile", bogus="x")
+
+
+def test_stale_socket_is_replaced(tmp_path, runtime_state):
+    path = tmp_path / "stale.sock"
+    first = ControlServer(EventBus(), tracker=MagicMock(), path=path)
+    first._sock.close()  # simulate a crashed daemon, socket file left behind
+
+    second = ControlServer(EventBus(), tracker=MagicMock(), path=path)
+    try:
+        assert path.exists()
+    finally:
+        second.close()
+
+    assert not path.exists()
+
+
+def test_client_without_daemon(tmp_path, monkeypatch):
+    monkeypatch.setenv("CDSP_CONTROL_SOCKET", str(tmp_path / "none.sock"))
+
+    with pytest.raises(ControlUnavailable):
+        ControlClient().request("status")
+
+    assert try_request("status") is None
+
+
+def test_cli_falls_back_to_state_file(tmp_path, runtime_state, monkeypatch, capsys):
+    monkeypatch.setenv("CDSP_CONTROL_SOCKET", str(tmp_path / "none.sock"))
+
+    cli.cmd_manual(None)
+
+    assert runtime_state.load_state().mode == "manual"
+    assert capsys.readouterr().out == "Mode set to MANUAL\n"
+
+
+def test_cli_uses_daemon_when_running(daemon, runtime_state, capsys):
+    cli.cmd_manual(None)
+
+    assert runtime_state.load_state().mode == "manual"
+    out = capsys.readouterr().out
+    assert out.startswith("Mode set to MANUAL\n")
+    assert "Switch applied: /profiles/music.yml" in out
+
+
+def test_cli_stats_goes_through_the_socket(daemon, capsys):
+    daemon.server.register_stats(lambda: {"intents_executed": 3})
+
+    cli.cmd_stats(None)
+
+    out = capsys.readouterr().out
+    assert "requests" in out
+    assert "intents_executed" in out and ": 3\n" in out
+
+
+def test_cli_stats_without_daemon(tmp_path, monkeypatch):
+    monkeypatch.setenv("CDSP_CONTROL_SOCKET", str(tmp_path / "none.sock"))
+
+    with pytest.raises(SystemExit, match="No daemon running"):
+        cli.cmd_stats(None)
+
+
+def test_slow_client_cannot_stall_the_server(tmp_path, runtime_state):
+    path = tmp_path / "slow.sock"
+    server = ControlServer(EventBus(), tracker=MagicMock(), path=path)
+    slow = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        slow.connect(str(path))
+        slow.sendall(b'{"cmd": "sta')  # never finishes the line
+
+        started = time.monotonic()
+        server.on_readable()
+
+        assert time.monotonic() - started < 0.5
+        slow.settimeout(1.0)
+        assert slow.recv(4096) == b""  # dropped without a reply
+    finally:
+        slow.close()
+        server.close()
@@ -0,0 +1,147 @@
+import os
+from pathlib import Path
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+import camilladsp_autoswitch
+
+SRC_DIR = Path(camilladsp_autoswitch.__file__).resolve().parent.parent
+
+pytestmark = pytest.mark.skipif(
+    not Path("/proc/self/stat").exists(), reason="needs Linux /proc"
+)
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def next_notification(sock, prefix):
+    """Next sd_notify datagram starting with prefix (STATUS= lines skipped)."""
+    while True:
+        message = sock.recv(4096)
+        if message.startswith(prefix):
+            return message
+
+
+def cpu_ticks(pid):
+    stat = Path(f"/proc/{pid}/stat").read_text()
+    fields = stat[stat.rfind(")") + 2:].split()
+    return int(fields[11]) + int(fields[12])  # utime + stime
+
+
+@pytest.fixture
+def notify_socket(tmp_path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sock.bind(str(tmp_path / "notify.sock"))
+    sock.settimeout(5)
+    yield sock
+    sock.close()
+
+
+@pytest.fixture
+def daemon(tmp_path, notify_socket):
+    (tmp_path / "config").mkdir()
+    env = dict(
+        os.environ,
+        PYTHONPATH=str(SRC_DIR),
+        CDSP_CONFIG_DIR=str(tmp_path / "config"),
+        CDSP_STATE_DIR=str(tmp_path / "state"),
+        CDSP_STATUS_SEGMENT=str(tmp_path / "status"),
+        NOTIFY_SOCKET=str(tmp_path / "notify.sock"),
+        WATCHDOG_USEC="400000",
+    )
+    env.pop("CDSP_CONTROL_SOCKET", None)
+
+    log = open(tmp_path / "daemon.log", "w+")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "camilladsp_autoswitch.autoswitch",
+         "--media-process", "cdsp-fake-kodi"],
+        env=env,
+        stderr=log,
+    )
+    proc.log = tmp_path / "daemon.log"
+    proc.socket = tmp_path / "state" / "control.sock"
+
+    assert wait_for(proc.socket.exists), proc.log.read_text()
+    try:
+        yield proc
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        log.close()
+
+
+def test_daemon_is_single_threaded_and_idle(daemon):
+    assert len(os.listdir(f"/proc/{daemon.pid}/task")) == 1
+
+    before = cpu_ticks(daemon.pid)
+    time.sleep(1.0)
+    assert cpu_ticks(daemon.pid) - before <= 1
+
+
+def test_daemon_sees_media_process(daemon, tmp_path):
+    fake = tmp_path / "cdsp-fake-kodi"
+    fake.symlink_to("/bin/sleep")
+
+    media = subprocess.Popen([str(fake), "30"])
+    try:
+        assert wait_for(lambda: "Process started: cdsp-fake-kodi" in daemon.log.read_text())
+    finally:
+        media.kill()
+        media.wait()
+
+    assert wait_for(lambda: "Process stopped: cdsp-fake-kodi" in daemon.log.read_text(), 1.0)
+
+
+def test_daemon_signals(daemon, tmp_path):
+    daemon.send_signal(signal.SIGHUP)
+    assert wait_for(lambda: "Reload" in daemon.log.read_text())
+    assert daemon.poll() is None
+
+    daemon.send_signal(signal.SIGTERM)
+    assert daemon.wait(timeout=5) == 0
+    assert not daemon.socket.exists()
+    assert not (tmp_path / "status").exists()
+
+
+def test_daemon_notifies_systemd(daemon, notify_socket):
+    from camilladsp_autoswitch.infrastructure.control.client import ControlClient
+
+    assert notify_socket.recv(4096).startswith(b"READY=1\n")
+    assert next_notification(notify_socket, b"WATCHDOG=") == b"WATCHDOG=1"
+    assert next_notification(notify_socket, b"WATCHDOG=") == b"WATCHDOG=1"
+
+    stats = ControlClient(daemon.socket).request("stats")
+    assert stats["watchdog_pings"] >= 2
+    assert stats["loop_lag_seconds"] < 0.1
+
+
+def test_daemon_profiles_on_signals(daemon, tmp_path):
+    state_dir = tmp_path / "state"
+
+    # Standard signals do not queue: wait for each one to be handled
+    daemon.send_signal(signal.SIGUSR1)
+    assert wait_for(lambda: "CPU profiling started" in daemon.log.read_text())
+    daemon.send_signal(signal.SIGUSR1)
+    assert wait_for(lambda: list(state_dir.glob("cpu-*.prof")))
+
+    daemon.send_signal(signal.SIGUSR2)
+    assert wait_for(lambda: "baseline taken" in daemon.log.read_text())
+    daemon.send_signal(signal.SIGUSR2)
+    assert wait_for(lambda: list(state_dir.glob("memory-*.txt")))
+
+    daemon.send_signal(signal.SIGQUIT)
+    assert wait_for(lambda: "most recent call first" in daemon.log.read_text())
+    assert daemon.poll() is None
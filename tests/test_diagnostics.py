@@ -0,0 +1,50 @@
+import pstats
+import tracemalloc
+
+import pytest
+
+from camilladsp_autoswitch.infrastructure.diagnostics.profiling import (
+    CpuProfiler,
+    MemorySnapshots,
+)
+
+
+def test_cpu_profiler_toggles_and_writes_stats(tmp_path):
+    profiler = CpuProfiler(tmp_path)
+
+    assert profiler.toggle() is None
+    assert profiler.active
+    sum(i * i for i in range(1000))
+    path = profiler.toggle()
+
+    assert not profiler.active
+    assert path.parent == tmp_path and path.suffix == ".prof"
+    assert pstats.Stats(str(path)).total_calls > 0
+
+
+@pytest.fixture
+def snapshots(tmp_path):
+    if tracemalloc.is_tracing():
+        pytest.skip("tracemalloc already enabled")
+    snapshots = MemorySnapshots(tmp_path)
+    yield snapshots
+    snapshots.stop()
+
+
+def test_memory_snapshots_diff_against_previous(snapshots, tmp_path):
+    assert snapshots.take() is None
+    assert tracemalloc.is_tracing()
+
+    leak = [bytearray(1024) for _ in range(256)]
+    path = snapshots.take()
+
+    report = path.read_text()
+    assert path.parent == tmp_path
+    # Largest growth first, allocation site first
+    assert "test_diagnostics.py" in report.split("\n\n", 1)[1].splitlines()[1]
+    del leak
+
+
+def test_memory_tracing_is_off_until_asked(tmp_path):
+    MemorySnapshots(tmp_path)
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,171 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from camilladsp_autoswitch.application.handlers.intent_executor_handler import IntentExecutorHandler
+from camilladsp_autoswitch.domain.events import IntentExecuted
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.infrastructure.execution.dwell import DwellLimiter
+from camilladsp_autoswitch.intent import SwitchIntent
+
+
+class FakeTimers:
+    """call_later stand-in driven by a fake clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.armed = []
+
+    def clock(self):
+        return self.now
+
+    def call_later(self, delay, callback):
+        timer = SimpleNamespace(when=self.now + delay, callback=callback, cancel=MagicMock())
+        self.armed.append(timer)
+        return timer
+
+    def advance(self, seconds):
+        self.now += seconds
+        due = [timer for timer in self.armed if timer.when <= self.now]
+        self.armed = [timer for timer in self.armed if timer.when > self.now]
+        for timer in due:
+            timer.callback()
+
+
+def make_limiter(dwell=10.0):
+    timers = FakeTimers()
+    submitted = []
+    limiter = DwellLimiter(
+        submitted.append,
+        dwell_for=lambda profile, variant: dwell,
+        call_later=timers.call_later,
+        clock=timers.clock,
+    )
+    return limiter, timers, submitted
+
+
+def test_passes_through_outside_dwell_window():
+    limiter, timers, submitted = make_limiter()
+
+    limiter.submit("a")
+
+    assert submitted == ["a"]
+    assert timers.armed == []
+
+
+def test_intents_inside_window_are_coalesced_and_released_by_timer():
+    limiter, timers, submitted = make_limiter()
+    limiter.submit("a")
+    limiter.applied("cinema")
+
+    timers.advance(1)
+    for intent in ("b", "c", "d"):
+        limiter.submit(intent)
+
+    assert submitted == ["a"]
+    assert len(timers.armed) == 1
+    assert timers.armed[0].when == 10
+
+    timers.advance(9)
+
+    assert submitted == ["a", "d"]
+    assert limiter.stats() == {"intents_deferred": 3, "intents_coalesced": 2}
+
+
+def test_zero_dwell_does_not_hold():
+    limiter, timers, submitted = make_limiter(dwell=0)
+    limiter.submit("a")
+    limiter.applied("music")
+
+    limiter.submit("b")
+
+    assert submitted == ["a", "b"]
+
+
+def test_extended_window_rearms_timer():
+    limiter, timers, submitted = make_limiter()
+    limiter.applied("cinema")
+    limiter.submit("a")
+
+    timers.advance(5)
+    limiter.applied("cinema")  # an apply happened meanwhile (e.g. flush)
+    timers.advance(5)
+
+    assert submitted == []
+    timers.advance(5)
+    assert submitted == ["a"]
+
+
+def test_cancel_drops_held_intent():
+    limiter, timers, submitted = make_limiter()
+    limiter.applied("cinema")
+    limiter.submit("a")
+    timer = timers.armed[0]
+
+    limiter.cancel()
+
+    timer.cancel.assert_called_once()
+    assert limiter.held is None
+
+
+def test_thread_timer_fallback_releases_intent():
+    released = threading.Event()
+    limiter = DwellLimiter(
+        lambda intent: released.set(),
+        dwell_for=lambda profile, variant: 0.05,
+    )
+    limiter.applied("cinema")
+
+    limiter.submit("a")
+
+    assert released.wait(5)
+
+
+def test_handler_reloads_once_per_dwell_window():
+    bus = EventBus()
+    timers = FakeTimers()
+    applier = MagicMock()
+    outcomes = []
+    bus.subscribe(IntentExecuted, outcomes.append)
+
+    handler = IntentExecutorHandler(
+        bus,
+        resolve_yaml=lambda intent: f"/profiles/{intent.profile}.yml",
+        validate=lambda path: SimpleNamespace(valid=True, reason=None),
+        apply=applier,
+        dwell_for=lambda profile, variant: {"cinema": 30}.get(profile, 0),
+        call_later=timers.call_later,
+    )
+    handler.limiter._clock = timers.clock
+
+    # Reload storm: media flapping right after cinema was applied
+    for profile in ("cinema", "music", "cinema", "music"):
+        bus.publish(SwitchIntent(profile=profile, variant=None, reason="media"))
+
+    applier.assert_called_once_with("/profiles/cinema.yml")
+
+    timers.advance(30)
+
+    assert [call.args[0] for call in applier.call_args_list] == [
+        "/profiles/cinema.yml",
+        "/profiles/music.yml",
+    ]
+    assert [event.outcome for event in outcomes] == ["applied", "applied"]
+
+
+def test_forced_intents_bypass_the_window_and_supersede_held_ones():
+    limiter, timers, submitted = make_limiter()
+    limiter.submit("a")
+    limiter.applied("cinema")
+
+    automatic = SwitchIntent(profile="music", variant=None, reason="media_inactive")
+    forced = SwitchIntent(profile="headphones", variant=None, reason="manual_profile")
+    limiter.submit(automatic)
+    limiter.submit(forced)
+
+    assert submitted == ["a", forced]
+    assert limiter.held is None
+
+    # The armed timer no longer releases the superseded intent
+    timers.advance(10)
+    assert submitted == ["a", forced]
@@ -0,0 +1,54 @@
+import copy
+from dataclasses import FrozenInstanceError, asdict, dataclass, replace
+import pickle
+
+import pytest
+
+from camilladsp_autoswitch.domain.events import (
+    IntentExecuted,
+    MediaActivityChanged,
+    PolicyDecision,
+    intern_event,
+)
+from camilladsp_autoswitch.domain.slots import slotted
+from camilladsp_autoswitch.domain.tracing import Trace
+from camilladsp_autoswitch.intent import SwitchIntent
+
+
+@pytest.mark.parametrize("event", [
+    MediaActivityChanged(active=True),
+    PolicyDecision(profile="music", variant=None, reason="media_inactive"),
+    SwitchIntent(profile="music", variant="night", reason="test"),
+    IntentExecuted(profile="music", variant=None, yaml="/m.yml", outcome="applied", latency=0.01),
+])
+def test_events_are_slotted_and_frozen(event):
+    assert not hasattr(event, "__dict__")
+
+    with pytest.raises(FrozenInstanceError):
+        event.profile = "other"
+
+    assert pickle.loads(pickle.dumps(event)) == event
+    assert copy.deepcopy(event) == event
+    assert asdict(replace(event)) == asdict(event)
+
+
+def test_intern_event_shares_untraced_instances():
+    first = intern_event(PolicyDecision, "music", None, "media_inactive")
+
+    assert intern_event(PolicyDecision, "music", None, "media_inactive") is first
+    assert intern_event(PolicyDecision, "cinema", None, "media_active") is not first
+
+    trace = Trace(trace_id=1, started=0.0, at=0.0)
+    traced = intern_event(PolicyDecision, "music", None, "media_inactive", trace=trace)
+    assert traced is not first and traced.trace is trace
+
+
+def test_slotted_keeps_defaults():
+    @slotted
+    @dataclass(frozen=True)
+    class Sample:
+        name: str
+        count: int = 3
+
+    assert Sample("a").count == 3
+    assert Sample.__slots__ == ("name", "count")
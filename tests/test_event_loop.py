@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+
+from camilladsp_autoswitch.infrastructure.watchers.base import EventSource
+from camilladsp_autoswitch.infrastructure.watchers.loop import EventLoop
+
+
+class PipeSource(EventSource):
+    def __init__(self):
+        self.r, self.w = os.pipe()
+        self.received = []
+        self.closed = False
+
+    def fileno(self):
+        return self.r
+
+    def on_readable(self):
+        self.received.append(os.read(self.r, 100))
+
+    def close(self):
+        self.closed = True
+        os.close(self.r)
+        os.close(self.w)
+
+
+class DeadlineSource(EventSource):
+    """No fd activity; only timeouts."""
+
+    def __init__(self, loop, delay):
+        self._r, self._w = os.pipe()
+        self._loop = loop
+        self._due = time.monotonic() + delay
+        self.fired = 0
+
+    def fileno(self):
+        return self._r
+
+    def on_readable(self):
+        pass
+
+    def next_timeout(self):
+        if self._due is None:
+            return None
+        return self._due - time.monotonic()
+
+    def on_timeout(self):
+        self.fired += 1
+        self._due = None
+        self._loop.stop()
+
+    def close(self):
+        os.close(self._r)
+        os.close(self._w)
+
+
+def test_dispatches_readable_sources_and_timers_in_order():
+    loop = EventLoop()
+    source = PipeSource()
+    loop.add(source)
+    calls = []
+
+    loop.call_later(0.02, lambda: calls.append("late"))
+    loop.call_later(0.0, lambda: os.write(source.w, b"ping"))
+    loop.call_later(0.01, lambda: calls.append("early"))
+    cancelled = loop.call_later(0.015, lambda: calls.append("cancelled"))
+    cancelled.cancel()
+    loop.call_later(0.03, loop.stop)
+
+    loop.run()
+    loop.close()
+
+    assert source.received == [b"ping"]
+    assert calls == ["early", "late"]
+    assert source.closed
+
+
+def test_source_timeouts_are_honoured():
+    loop = EventLoop()
+    source = DeadlineSource(loop, 0.01)
+    loop.add(source)
+
+    loop.run()
+    loop.close()
+
+    assert source.fired == 1
+
+
+def test_stop_and_callbacks_from_other_threads():
+    loop = EventLoop()
+    ran = []
+
+    def worker():
+        loop.call_soon_threadsafe(lambda: ran.append(threading.current_thread()))
+        loop.call_soon_threadsafe(loop.stop)
+
+    threading.Timer(0.01, worker).start()
+    loop.run()  # blocks with no timeout until woken
+    loop.close()
+
+    assert ran == [threading.main_thread()]
+
+
+def test_failing_callback_does_not_stop_the_loop(caplog):
+    loop = EventLoop()
+    calls = []
+
+    loop.call_later(0, lambda: 1 / 0)
+    loop.call_later(0.01, lambda: calls.append("after"))
+    loop.call_later(0.02, loop.stop)
+
+    loop.run()
+    loop.close()
+
+    assert calls == ["after"]
+    assert "ZeroDivisionError" in caplog.text
@@ -0,0 +1,173 @@
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from camilladsp_autoswitch.domain.events import IntentExecuted
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.infrastructure.execution.health import HealthMonitor
+from camilladsp_autoswitch.infrastructure.execution.intent_executor import IntentExecutor
+
+HEALTHY = SimpleNamespace(ok=True, reason=None)
+
+
+class FakeTimers:
+    """call_later stand-in driven by a fake clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.armed = []
+
+    def clock(self):
+        return self.now
+
+    def call_later(self, delay, callback):
+        timer = SimpleNamespace(when=self.now + delay, callback=callback, cancel=MagicMock())
+        self.armed.append(timer)
+        return timer
+
+    def advance(self, seconds):
+        self.now += seconds
+        due = [timer for timer in self.armed if timer.when <= self.now]
+        self.armed = [timer for timer in self.armed if timer.when > self.now]
+        for timer in due:
+            timer.callback()
+
+
+@pytest.fixture
+def profiles(tmp_path):
+    for name in ("music", "cinema"):
+        (tmp_path / f"{name}.yml").write_text(f"title: {name}\n")
+    return tmp_path
+
+
+def make_monitor(check):
+    bus = EventBus()
+    timers = FakeTimers()
+    restore = MagicMock()
+    executor = IntentExecutor(
+        validate_fn=MagicMock(return_value=SimpleNamespace(valid=True, reason=None)),
+        apply_fn=MagicMock(),
+        restore_fn=restore,
+        confirm_later=True,
+    )
+    monitor = HealthMonitor(
+        bus,
+        executor,
+        check_fn=check,
+        timeout=1.0,
+        poll=0.1,
+        call_later=timers.call_later,
+        clock=timers.clock,
+    )
+    published = []
+    bus.subscribe(IntentExecuted, published.append)
+    return bus, executor, monitor, timers, restore, published
+
+
+def apply(bus, executor, path):
+    execution = executor.execute(object(), path)
+    bus.publish(IntentExecuted(
+        profile=path.stem,
+        variant=None,
+        yaml=str(path),
+        outcome=execution.outcome,
+    ))
+
+
+def test_probe_never_runs_inside_the_publish(profiles):
+    check = MagicMock(return_value=HEALTHY)
+    bus, executor, monitor, timers, _, _ = make_monitor(check)
+
+    apply(bus, executor, profiles / "music.yml")
+
+    check.assert_not_called()
+    assert monitor.checking == profiles / "music.yml"
+
+
+def test_polls_until_healthy_then_confirms(profiles):
+    starting = SimpleNamespace(ok=False, reason="state STARTING")
+    check = MagicMock(side_effect=[starting, starting, HEALTHY])
+    bus, executor, monitor, timers, _, _ = make_monitor(check)
+
+    apply(bus, executor, profiles / "music.yml")
+    assert executor.last_good is None  # not confirmed yet
+
+    timers.advance(0)
+    timers.advance(0.1)
+    timers.advance(0.1)
+
+    assert check.call_count == 3
+    assert executor.last_good == profiles / "music.yml"
+    assert monitor.checking is None
+    assert monitor.stats() == {"health_checks_passed": 1, "health_checks_failed": 0}
+
+
+def test_timeout_rolls_back_and_publishes(profiles):
+    check = MagicMock(return_value=HEALTHY)
+    bus, executor, monitor, timers, restore, published = make_monitor(check)
+    apply(bus, executor, profiles / "music.yml")
+    timers.advance(0)
+
+    check.return_value = SimpleNamespace(ok=False, reason="state INACTIVE")
+    apply(bus, executor, profiles / "cinema.yml")
+    for _ in range(12):
+        timers.advance(0.1)
+
+    restore.assert_called_once_with(profiles / "music.yml", "title: music\n")
+    assert executor.last_yaml == profiles / "music.yml"
+
+    rollback = published[-1]
+    assert rollback.outcome == "rolled_back"
+    assert rollback.profile == "cinema"
+    assert "state INACTIVE" in rollback.reason
+    assert [stage[0] for stage in rollback.stages] == ["check", "rollback"]
+    assert monitor.stats()["health_checks_failed"] == 1
+
+
+def test_newer_apply_supersedes_running_check(profiles):
+    check = MagicMock(return_value=SimpleNamespace(ok=False, reason="state STARTING"))
+    bus, executor, monitor, timers, restore, published = make_monitor(check)
+
+    apply(bus, executor, profiles / "music.yml")
+    timers.advance(0)
+    check.return_value = HEALTHY
+    apply(bus, executor, profiles / "cinema.yml")
+    for _ in range(12):
+        timers.advance(0.1)
+
+    restore.assert_not_called()
+    assert [event.outcome for event in published] == ["applied", "applied"]
+    assert executor.last_good == profiles / "cinema.yml"
+
+
+def test_thread_timer_tick_does_not_clobber_a_newer_check(profiles):
+    bus = EventBus()
+    executor = IntentExecutor(
+        validate_fn=MagicMock(return_value=SimpleNamespace(valid=True, reason=None)),
+        apply_fn=MagicMock(),
+        restore_fn=MagicMock(),
+        confirm_later=True,
+    )
+    probing, release = threading.Event(), threading.Event()
+
+    def check(yaml):
+        if yaml.stem == "music":
+            probing.set()
+            release.wait(5)
+            return HEALTHY
+        return SimpleNamespace(ok=False, reason="state STARTING")
+
+    monitor = HealthMonitor(bus, executor, check_fn=check, timeout=5.0, poll=0.01)
+
+    apply(bus, executor, profiles / "music.yml")
+    assert probing.wait(5)  # music probe running on a timer thread
+    apply(bus, executor, profiles / "cinema.yml")
+    release.set()
+    time.sleep(0.1)
+
+    assert monitor.checking == profiles / "cinema.yml"
+    assert executor.last_good is None  # stale music verdict dropped
+    monitor.cancel()
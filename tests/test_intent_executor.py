@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -90,3 +91,86 @@ def test_executor_reapplies_when_yaml_changes(tmp_path):
     executor.execute(intent, yaml_b)
 
     assert applier.call_count == 2
+
+
+def test_executor_dedups_before_validating(tmp_path):
+    """
+    A repeated intent is rejected by the dedup check, without validation.
+    """
+    yaml_path = tmp_path / "music.yml"
+
+    validator = MagicMock()
+    validator.return_value.valid = True
+
+    executor = IntentExecutor(
+        resolve_fn=MagicMock(return_value=yaml_path),
+        validate_fn=validator,
+        apply_fn=MagicMock(),
+    )
+
+    intent = SwitchIntent(profile="music", variant=None, reason="test")
+
+    first = executor.execute(intent)
+    second = executor.execute(intent)
+
+    assert first.outcome == "applied"
+    assert [stage[0] for stage in first.stages] == ["resolve", "validate", "apply"]
+    assert second.outcome == "unchanged"
+    assert [stage[0] for stage in second.stages] == ["resolve"]
+    validator.assert_called_once_with(yaml_path)
+
+
+def test_executor_invalid_yaml_keeps_applied_one(tmp_path):
+    """
+    An invalid YAML must not replace the applied one.
+    """
+    good = tmp_path / "music.yml"
+    broken = tmp_path / "broken.yml"
+
+    def validate(path):
+        return MagicMock(valid=path == good, reason=None if path == good else "broken")
+
+    applier = MagicMock()
+    executor = IntentExecutor(validate_fn=validate, apply_fn=applier)
+    intent = SwitchIntent(profile="music", variant=None, reason="test")
+
+    executor.execute(intent, good)
+    result = executor.execute(intent, broken)
+
+    assert (result.outcome, result.reason) == ("invalid", "broken")
+    assert executor.last_yaml == good
+    assert executor.execute(intent, good).outcome == "unchanged"
+    applier.assert_called_once_with(good)
+
+
+def test_executor_reapplies_profile_edited_in_place(tmp_path):
+    """
+    Same path, new content (edit + SIGHUP): applied again.
+    Same path, same content (touch): still deduplicated.
+    """
+    yaml_path = tmp_path / "music.yml"
+    yaml_path.write_text("devices: {}\n")
+
+    validator = MagicMock()
+    validator.return_value.valid = True
+
+    applier = MagicMock()
+
+    executor = IntentExecutor(
+        validate_fn=validator,
+        apply_fn=applier,
+    )
+
+    intent = SwitchIntent(profile="music", variant=None, reason="test")
+
+    executor.execute(intent, yaml_path)
+
+    stat = yaml_path.stat()
+    os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert executor.execute(intent, yaml_path).outcome == "unchanged"
+
+    yaml_path.write_text("devices: {samplerate: 48000}\n")
+    assert executor.execute(intent, yaml_path).outcome == "applied"
+    assert executor.execute(intent, yaml_path).outcome == "unchanged"
+
+    assert applier.call_count == 2
@@ -0,0 +1,116 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from camilladsp_autoswitch.application.handlers.intent_executor_handler import IntentExecutorHandler
+from camilladsp_autoswitch.domain.events import IntentExecuted
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.infrastructure.execution.scheduler import IntentScheduler
+from camilladsp_autoswitch.intent import SwitchIntent
+
+
+def test_executes_immediately_without_defer():
+    executed = []
+    scheduler = IntentScheduler(executed.append)
+
+    scheduler.submit("music")
+
+    assert executed == ["music"]
+    assert scheduler.superseded == 0
+
+
+def test_intents_during_execution_collapse_to_latest():
+    executed = []
+    scheduler = None
+
+    def execute(intent):
+        executed.append(intent)
+        if intent == "a":
+            # Arrive while "a" is in flight
+            for newer in ("b", "c", "d"):
+                scheduler.submit(newer)
+
+    scheduler = IntentScheduler(execute)
+    scheduler.submit("a")
+
+    assert executed == ["a", "d"]
+    assert scheduler.stats() == {
+        "intents_submitted": 4,
+        "intents_executed": 2,
+        "intents_superseded": 2,
+    }
+
+
+def test_deferred_drain_runs_only_the_newest():
+    deferred = []
+    executed = []
+    scheduler = IntentScheduler(executed.append, defer=deferred.append)
+
+    for intent in ("a", "b", "c"):
+        scheduler.submit(intent)
+
+    assert executed == [] and len(deferred) == 1
+    deferred[0]()
+
+    assert executed == ["c"]
+    assert scheduler.superseded == 2
+
+
+def test_flush_runs_pending_before_deferred_drain():
+    deferred = []
+    executed = []
+    scheduler = IntentScheduler(executed.append, defer=deferred.append)
+
+    scheduler.submit("a")
+    scheduler.flush()
+    deferred[0]()
+
+    assert executed == ["a"]
+
+
+def test_concurrent_submits_wait_for_in_flight_apply():
+    in_flight = threading.Event()
+    release = threading.Event()
+    executed = []
+
+    def execute(intent):
+        executed.append(intent)
+        if intent == "a":
+            in_flight.set()
+            release.wait(5)
+
+    scheduler = IntentScheduler(execute)
+    worker = threading.Thread(target=scheduler.submit, args=("a",))
+    worker.start()
+    assert in_flight.wait(5)
+
+    for intent in ("b", "c", "d"):
+        scheduler.submit(intent)  # returns at once: "a" is in flight
+    release.set()
+    worker.join(5)
+
+    assert executed == ["a", "d"]
+
+
+def test_handler_applies_only_final_target():
+    bus = EventBus()
+    deferred = []
+    applier = MagicMock()
+    outcomes = []
+    bus.subscribe(IntentExecuted, outcomes.append)
+
+    IntentExecutorHandler(
+        bus,
+        resolve_yaml=lambda intent: f"/profiles/{intent.profile}.yml",
+        validate=lambda path: SimpleNamespace(valid=True, reason=None),
+        apply=applier,
+        defer=deferred.append,
+    )
+
+    for profile in ("cinema", "music", "cinema"):
+        bus.publish(SwitchIntent(profile=profile, variant=None, reason="toggle"))
+    for drain in deferred:
+        drain()
+
+    applier.assert_called_once_with("/profiles/cinema.yml")
+    assert [event.profile for event in outcomes] == ["cinema"]
@@ -0,0 +1,116 @@
+from unittest.mock import MagicMock
+
+from camilladsp_autoswitch.application.handlers.intent_executor_handler import IntentExecutorHandler
+from camilladsp_autoswitch.domain.events import IntentExecuted
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.infrastructure.execution.intent_executor import IntentExecutor
+from camilladsp_autoswitch.infrastructure.execution.last_applied import LastApplied
+from camilladsp_autoswitch.intent import SwitchIntent
+
+
+def _yaml(tmp_path, text="devices: {}\n"):
+    path = tmp_path / "music.yml"
+    path.write_text(text)
+    return path
+
+
+def _handler(bus, yaml, last_applied):
+    validator = MagicMock()
+    validator.return_value.valid = True
+    applier = MagicMock()
+
+    IntentExecutorHandler(
+        bus,
+        resolve_yaml=MagicMock(return_value=yaml),
+        validate=validator,
+        apply=applier,
+        last_applied=last_applied,
+    )
+    return applier
+
+
+def test_record_survives_reload(tmp_path):
+    yaml = _yaml(tmp_path)
+    LastApplied(tmp_path / "applied.json").remember(yaml)
+
+    reloaded = LastApplied(tmp_path / "applied.json")
+
+    assert reloaded.record.path == str(yaml)
+    assert reloaded.matches(yaml)
+
+
+def test_restart_skips_reapplying_running_config(tmp_path):
+    yaml = _yaml(tmp_path)
+    record = tmp_path / "applied.json"
+
+    # First run applies and remembers
+    bus = EventBus()
+    applier = _handler(bus, yaml, LastApplied(record))
+    bus.publish(SwitchIntent(profile="music", variant=None, reason="test"))
+    applier.assert_called_once_with(yaml)
+
+    # "Restart": new handler, same record
+    bus = EventBus()
+    outcomes = []
+    bus.subscribe(IntentExecuted, outcomes.append)
+    applier = _handler(bus, yaml, LastApplied(record))
+    bus.publish(SwitchIntent(profile="music", variant=None, reason="test"))
+
+    applier.assert_not_called()
+    assert (outcomes[0].outcome, outcomes[0].reason) == ("unchanged", "already_applied")
+
+
+def test_changed_content_is_applied_again(tmp_path):
+    yaml = _yaml(tmp_path)
+    last_applied = LastApplied(tmp_path / "applied.json")
+    last_applied.remember(yaml)
+
+    yaml.write_text("devices: {samplerate: 96000}\n")
+
+    bus = EventBus()
+    applier = _handler(bus, yaml, LastApplied(tmp_path / "applied.json"))
+    bus.publish(SwitchIntent(profile="music", variant=None, reason="test"))
+
+    applier.assert_called_once_with(yaml)
+
+
+def test_verify_forgets_record_camilladsp_does_not_confirm(tmp_path):
+    yaml = _yaml(tmp_path)
+    record = tmp_path / "applied.json"
+    LastApplied(record).remember(yaml)
+
+    assert LastApplied(record).verify(str(yaml)) is True
+
+    assert LastApplied(record).verify("/elsewhere/cinema.yml") is False
+    assert not record.exists()
+
+    LastApplied(record).remember(yaml)
+    assert LastApplied(record).verify(None) is False
+    assert LastApplied(record).record is None
+
+
+def test_unreadable_record_is_ignored(tmp_path):
+    record = tmp_path / "applied.json"
+    record.write_text("{not json")
+
+    assert LastApplied(record).record is None
+    assert not LastApplied(record).matches(_yaml(tmp_path))
+
+
+def test_intent_executor_skips_first_apply_after_restart(tmp_path):
+    yaml = _yaml(tmp_path)
+    last_applied = LastApplied(tmp_path / "applied.json")
+    last_applied.remember(yaml)
+
+    validate_fn = MagicMock()
+    apply_fn = MagicMock()
+    executor = IntentExecutor(
+        validate_fn=validate_fn,
+        apply_fn=apply_fn,
+        last_applied=last_applied,
+    )
+
+    executor.execute(object(), yaml)
+
+    apply_fn.assert_not_called()
+    validate_fn.assert_not_called()
@@ -41,3 +41,27 @@ def test_ignores_unrelated_process():
     bus.publish(ProcessStarted(name="bash"))
 
     assert received == []
+
+
+def test_announce_publishes_idle_state_once():
+    bus = EventBus()
+    received = []
+    bus.subscribe(MediaActivityChanged, received.append)
+    detector = MediaActivityDetector(bus, media_processes=["kodi"])
+
+    detector.announce()
+    detector.announce()
+
+    assert [event.active for event in received] == [False]
+
+
+def test_announce_after_start_publishes_nothing_more():
+    bus = EventBus()
+    received = []
+    bus.subscribe(MediaActivityChanged, received.append)
+    detector = MediaActivityDetector(bus, media_processes=["kodi"])
+
+    bus.publish(ProcessStarted(name="kodi"))
+    detector.announce()
+
+    assert [event.active for event in received] == [True]
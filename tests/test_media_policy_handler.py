@@ -46,3 +46,32 @@ def test_media_inactive_publishes_music_decision():
     assert len(received) == 1
     assert received[0].profile == "music"
     assert received[0].reason == "media_inactive"
+
+
+def test_manual_mode_holds_forced_profile_across_media_toggles():
+    from camilladsp_autoswitch.application.handlers.intent_handler import IntentHandler
+    from camilladsp_autoswitch.application.handlers.runtime_state_handler import RuntimeStateHandler
+    from camilladsp_autoswitch.domain.events import ModeChanged, ProfileForced
+    from camilladsp_autoswitch.intent import SwitchIntent
+
+    bus = EventBus()
+    intents = []
+    bus.subscribe(SwitchIntent, intents.append)
+
+    MediaPolicyHandler(bus, mapping=FakeMapping())
+    RuntimeStateHandler(bus)
+    IntentHandler(bus)
+
+    bus.publish(ModeChanged(mode="manual", previous="auto"))
+    bus.publish(ProfileForced(profile="headphones", variant=None))
+    intents.clear()
+
+    bus.publish(MediaActivityChanged(active=True))
+    bus.publish(MediaActivityChanged(active=False))
+
+    assert intents == []
+
+    # Back to auto: the last media state applies again
+    bus.publish(ModeChanged(mode="auto", previous="manual"))
+
+    assert [intent.profile for intent in intents] == ["music"]
@@ -0,0 +1,148 @@
+import socket
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from camilladsp_autoswitch.domain.events import IntentExecuted, MediaActivityChanged
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.infrastructure.eventing.event_store import EventStore
+from camilladsp_autoswitch.infrastructure.metrics.openmetrics import (
+    CONTENT_TYPE,
+    Counter,
+    Histogram,
+    render,
+)
+from camilladsp_autoswitch.infrastructure.metrics.pipeline import PipelineMetrics
+from camilladsp_autoswitch.infrastructure.metrics.server import MetricsServer
+
+
+def _lines(metrics) -> list:
+    return metrics.render().decode().splitlines()
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency_seconds", "Latency.", buckets=(0.01, 0.1))
+    for value in (0.005, 0.01, 0.05, 3.0):
+        histogram.observe(value)
+
+    text = render([histogram]).decode()
+
+    assert 'latency_seconds_bucket{le="0.01"} 2' in text
+    assert 'latency_seconds_bucket{le="0.1"} 3' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+    assert "latency_seconds_count 4" in text
+    assert text.endswith("# EOF\n")
+
+
+def test_counter_labels_are_escaped():
+    counter = Counter("switches", "Switches.", labels=("profile",))
+    counter.inc('say "hi"\\')
+    counter.inc('say "hi"\\')
+
+    assert 'switches_total{profile="say \\"hi\\"\\\\"} 2' in render([counter]).decode()
+
+
+def test_pipeline_counts_events_and_switches():
+    bus = EventBus()
+    metrics = PipelineMetrics(bus)
+
+    bus.publish(MediaActivityChanged(active=True))
+    bus.publish(IntentExecuted(profile="cinema", variant="night", yaml="/c.yml",
+                               outcome="applied", latency=0.02))
+    bus.publish(IntentExecuted(profile="cinema", variant="night", yaml="/c.yml",
+                               outcome="unchanged"))
+
+    lines = _lines(metrics)
+
+    assert 'cdsp_autoswitch_events_total{type="MediaActivityChanged"} 1' in lines
+    assert 'cdsp_autoswitch_events_total{type="IntentExecuted"} 2' in lines
+    assert 'cdsp_autoswitch_switches_total{profile="cinema",variant="night",outcome="applied"} 1' in lines
+    assert "cdsp_autoswitch_apply_seconds_count 1" in lines
+
+
+def test_pipeline_exports_pulled_sources():
+    bus = EventBus()
+    metrics = PipelineMetrics(bus)
+
+    store = EventStore()
+    store.append(object())
+    metrics.watch_event_store(store)
+    metrics.watch_caches({"validation": SimpleNamespace(hits=3, misses=1)})
+    metrics.watch_process_watcher(SimpleNamespace(scans=4, scan_seconds=0.5))
+
+    validate = metrics.timed(MagicMock(return_value="ok"))
+    assert validate("/p.yml") == "ok"
+
+    lines = _lines(metrics)
+
+    assert "cdsp_autoswitch_event_store_events 1" in lines
+    assert 'cdsp_autoswitch_cache_requests_total{cache="validation",result="hit"} 3' in lines
+    assert 'cdsp_autoswitch_cache_hit_ratio{cache="validation"} 0.75' in lines
+    assert "cdsp_autoswitch_process_scans_total 4" in lines
+    assert "cdsp_autoswitch_validation_seconds_count 1" in lines
+
+
+@pytest.fixture
+def server():
+    server = MetricsServer(lambda: b"# EOF\n", port=0)
+    server.start()
+    yield server
+    server.stop()
+
+
+def _get(server, path: str) -> bytes:
+    with socket.create_connection(server.address, timeout=2) as conn:
+        conn.sendall(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        response = b""
+        while chunk := conn.recv(4096):
+            response += chunk
+    return response
+
+
+def test_server_serves_metrics(server):
+    response = _get(server, "/metrics")
+
+    head, body = response.split(b"\r\n\r\n", 1)
+    assert head.startswith(b"HTTP/1.0 200 OK")
+    assert f"Content-Type: {CONTENT_TYPE}".encode() in head
+    assert body == b"# EOF\n"
+    assert server.scrapes == 1
+
+
+def test_server_rejects_other_paths(server):
+    assert _get(server, "/other").startswith(b"HTTP/1.0 404")
+
+
+def test_warm_up_stays_parallel_with_metrics(tmp_path, monkeypatch, caplog):
+    from concurrent.futures import ProcessPoolExecutor
+
+    from camilladsp_autoswitch.bootstrap import bootstrap
+    from camilladsp_autoswitch.validators import bulk
+
+    class SpyPool(ProcessPoolExecutor):
+        maps = 0
+
+        def map(self, *args, **kwargs):
+            SpyPool.maps += 1
+            return super().map(*args, **kwargs)
+
+    monkeypatch.setattr(bulk, "ProcessPoolExecutor", SpyPool)
+    monkeypatch.setattr(bulk, "_worker_count", lambda jobs, max_workers: 2)
+
+    profiles = tmp_path / "profiles"
+    profiles.mkdir()
+    for name in ("music", "cinema"):
+        (profiles / f"{name}.yml").write_text("devices: {}\n")
+
+    bus = bootstrap(
+        warm_cache=True,
+        metrics_port=0,
+        config_dir=tmp_path,
+        enable_event_store=False,
+    )
+    bus.metrics_server.stop()
+
+    assert SpyPool.maps == 1
+    assert "Parallel validation unavailable" not in caplog.text
+    assert "cdsp_autoswitch_validation_seconds_count 2" in _lines(bus.metrics)
@@ -0,0 +1,124 @@
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from camilladsp_autoswitch.domain.events import IntentExecuted
+from camilladsp_autoswitch.domain.mapping import MediaMapping, ProfileSelection
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.infrastructure.execution.prestage import (
+    Prestager,
+    filter_files,
+    preread,
+)
+
+MAPPING = MediaMapping(
+    on=ProfileSelection("cinema", "night"),
+    off=ProfileSelection("music", "normal"),
+)
+
+CONFIG = """
+devices: {samplerate: 48000, chunksize: 1024}
+filters:
+  room:
+    type: Conv
+    parameters: {type: Raw, filename: room.raw}
+  eq:
+    type: Biquad
+    parameters: {type: Peaking, freq: 100, q: 1, gain: -3}
+"""
+
+
+def make_prestager(tmp_path, validate=None):
+    for name in ("cinema.night", "music.normal"):
+        (tmp_path / f"{name}.yml").write_text(CONFIG)
+    (tmp_path / "room.raw").write_bytes(b"\0" * 4096)
+
+    bus = EventBus()
+    validate = validate or MagicMock(return_value=SimpleNamespace(valid=True, reason=None))
+    prestager = Prestager(
+        bus,
+        mapping=lambda: MAPPING,
+        resolve_fn=lambda intent: tmp_path / f"{intent.profile}.{intent.variant}.yml",
+        validate_fn=validate,
+        run=lambda job: job(),
+    )
+    return bus, prestager, validate
+
+
+def executed(profile, variant, outcome="applied"):
+    return IntentExecuted(
+        profile=profile,
+        variant=variant,
+        yaml=f"/profiles/{profile}.yml",
+        outcome=outcome,
+    )
+
+
+def test_stages_opposite_side_after_switch(tmp_path):
+    bus, prestager, validate = make_prestager(tmp_path)
+
+    bus.publish(executed("music", "normal"))
+
+    validate.assert_called_once_with(tmp_path / "cinema.night.yml")
+    assert prestager.staged == tmp_path / "cinema.night.yml"
+    assert prestager.stats() == {"prestaged": 1, "prestage_failures": 0}
+
+
+def test_same_target_is_staged_once(tmp_path):
+    bus, prestager, validate = make_prestager(tmp_path)
+
+    bus.publish(executed("music", "normal"))
+    bus.publish(executed("music", "normal", outcome="unchanged"))
+
+    assert validate.call_count == 1
+
+
+def test_forced_profile_is_not_guessed(tmp_path):
+    bus, prestager, validate = make_prestager(tmp_path)
+
+    bus.publish(executed("headphones", None))
+
+    validate.assert_not_called()
+    assert prestager.staged is None
+
+
+def test_invalid_target_is_not_staged(tmp_path):
+    bus, prestager, _ = make_prestager(
+        tmp_path,
+        validate=lambda path: SimpleNamespace(valid=False, reason="broken"),
+    )
+
+    bus.publish(executed("cinema", "night"))
+
+    assert prestager.staged is None
+    assert prestager.prestage_failures == 1
+
+
+def test_failures_never_reach_the_bus(tmp_path):
+    bus, prestager, _ = make_prestager(
+        tmp_path,
+        validate=MagicMock(side_effect=RuntimeError("boom")),
+    )
+
+    bus.publish(executed("cinema", "night"))
+
+    assert prestager.prestage_failures == 1
+
+
+def test_filter_files_resolves_relative_names(tmp_path):
+    config = {
+        "filters": {
+            "a": {"type": "Conv", "parameters": {"filename": "a.raw"}},
+            "b": {"type": "Conv", "parameters": {"filename": "/abs/b.wav"}},
+            "c": {"type": "Gain", "parameters": {"gain": 0}},
+        }
+    }
+
+    assert filter_files(config, tmp_path) == [tmp_path / "a.raw", Path("/abs/b.wav")]
+
+
+def test_preread_reports_file_size(tmp_path):
+    path = tmp_path / "room.raw"
+    path.write_bytes(b"\0" * 1000)
+
+    assert preread(path) == 1000
@@ -0,0 +1,106 @@
+import os
+import subprocess
+import time
+
+import pytest
+
+from camilladsp_autoswitch.domain.events import ProcessStarted, ProcessStopped
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.infrastructure.detectors.process_watcher import ProcessWatcher
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def fake_process(proc_dir, pid, comm):
+    entry = proc_dir / str(pid)
+    entry.mkdir()
+    (entry / "comm").write_text(comm + "\n")
+
+
+def make_watcher(tmp_path, names, clock=None):
+    bus = EventBus()
+    events = []
+    bus.subscribe(object, events.append)
+    watcher = ProcessWatcher(
+        bus, names, proc_dir=tmp_path, clock=clock or FakeClock(), scan_interval=2.0
+    )
+    return watcher, events
+
+
+def test_scan_reports_starts_and_stops(tmp_path):
+    fake_process(tmp_path, 10, "bash")
+    watcher, events = make_watcher(tmp_path, ["kodi"])
+
+    watcher.scan()
+    assert events == []
+
+    # pid 999999 does not exist: no pidfd, exits are found by scanning
+    fake_process(tmp_path, 999999, "kodi")
+    watcher.scan()
+    watcher.scan()
+    assert events == [ProcessStarted(name="kodi")]
+    assert watcher.running == {"kodi"}
+
+    (tmp_path / "999999" / "comm").unlink()
+    watcher.scan()
+    assert events == [ProcessStarted(name="kodi"), ProcessStopped(name="kodi")]
+
+    watcher.close()
+
+
+def test_long_names_match_truncated_comm(tmp_path):
+    fake_process(tmp_path, 999999, "kodi-standalone"[:15])
+    watcher, events = make_watcher(tmp_path, ["kodi-standalone-x"])
+
+    watcher.scan()
+
+    assert events == [ProcessStarted(name="kodi-standalone-x")]
+    watcher.close()
+
+
+def test_scan_schedule(tmp_path):
+    clock = FakeClock()
+    watcher, _ = make_watcher(tmp_path, ["kodi"], clock)
+
+    assert watcher.next_timeout() == 0  # initial scan is due
+    watcher.on_timeout()
+    assert watcher.next_timeout() == 2.0
+
+    clock.now += 1.5
+    assert watcher.next_timeout() == pytest.approx(0.5)
+    watcher.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd not available")
+def test_exit_is_event_driven_with_pidfd(tmp_path):
+    child = subprocess.Popen(["sleep", "30"])
+    try:
+        fake_process(tmp_path, child.pid, "sleep")
+        watcher, events = make_watcher(tmp_path, ["sleep"])
+
+        watcher.scan()
+        assert events == [ProcessStarted(name="sleep")]
+        # Everything is held by a pidfd: no periodic scan needed
+        assert watcher.next_timeout() is None
+
+        child.kill()
+        child.wait()
+        (tmp_path / str(child.pid) / "comm").unlink()
+
+        deadline = time.monotonic() + 5
+        while not events[1:] and time.monotonic() < deadline:
+            import select
+            if select.select([watcher], [], [], 0.1)[0]:
+                watcher.on_readable()
+
+        assert events == [ProcessStarted(name="sleep"), ProcessStopped(name="sleep")]
+        watcher.close()
+    finally:
+        child.kill()
+        child.wait()
@@ -0,0 +1,170 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from camilladsp_autoswitch.infrastructure.camilladsp import apply as camilla
+from camilladsp_autoswitch.infrastructure.execution.intent_executor import IntentExecutor
+
+HEALTHY = SimpleNamespace(ok=True, reason=None)
+
+
+@pytest.fixture
+def profiles(tmp_path):
+    for name in ("music", "cinema"):
+        (tmp_path / f"{name}.yml").write_text(f"title: {name}\n")
+    return tmp_path
+
+
+def make_executor(check, apply=None):
+    validator = MagicMock(return_value=SimpleNamespace(valid=True, reason=None))
+    restore = MagicMock()
+    executor = IntentExecutor(
+        validate_fn=validator,
+        apply_fn=apply or MagicMock(),
+        check_fn=check,
+        restore_fn=restore,
+    )
+    return executor, restore
+
+
+def test_failed_health_check_restores_last_known_good(profiles):
+    check = MagicMock(side_effect=[HEALTHY, SimpleNamespace(ok=False, reason="state INACTIVE")])
+    executor, restore = make_executor(check)
+    executor.execute(object(), profiles / "music.yml")
+
+    # Edited after it was applied: the in-memory copy is what ran
+    (profiles / "music.yml").write_text("title: edited\n")
+    execution = executor.execute(object(), profiles / "cinema.yml")
+
+    assert execution.outcome == "rolled_back"
+    assert "state INACTIVE" in execution.reason
+    restore.assert_called_once_with(profiles / "music.yml", "title: music\n")
+    assert executor.last_yaml == profiles / "music.yml"
+    assert [stage[0] for stage in execution.stages] == ["validate", "apply", "check", "rollback"]
+
+
+def test_apply_error_rolls_back_without_probe(profiles):
+    check = MagicMock(return_value=HEALTHY)
+    apply = MagicMock(side_effect=[None, camilla.ApplyError("connection refused")])
+    executor, restore = make_executor(check, apply)
+    executor.execute(object(), profiles / "music.yml")
+
+    execution = executor.execute(object(), profiles / "cinema.yml")
+
+    assert execution.outcome == "rolled_back"
+    assert check.call_count == 1
+    restore.assert_called_once()
+
+
+def test_failure_without_known_good_forces_reapply(profiles):
+    executor, restore = make_executor(MagicMock(return_value=SimpleNamespace(ok=False, reason="x")))
+
+    first = executor.execute(object(), profiles / "cinema.yml")
+    second = executor.execute(object(), profiles / "cinema.yml")
+
+    assert first.outcome == second.outcome == "failed"
+    restore.assert_not_called()
+    assert executor.last_yaml is None
+
+
+def test_failed_rollback_is_reported(profiles):
+    check = MagicMock(side_effect=[HEALTHY, SimpleNamespace(ok=False, reason="x")])
+    executor, restore = make_executor(check)
+    restore.side_effect = camilla.ApplyError("down")
+    executor.execute(object(), profiles / "music.yml")
+
+    execution = executor.execute(object(), profiles / "cinema.yml")
+
+    assert execution.outcome == "failed"
+    assert "rollback failed: down" in execution.reason
+
+
+# ----------------------------------------------------------------------
+# Health probe
+# ----------------------------------------------------------------------
+
+class FakeCamilla:
+    state = "RUNNING"
+    config_name = "/profiles/cinema.yml"
+    load = 20.0
+    open = 0
+
+    def __init__(self, host, port):
+        pass
+
+    def connect(self):
+        FakeCamilla.open += 1
+
+    def disconnect(self):
+        FakeCamilla.open -= 1
+
+    def get_state(self):
+        return SimpleNamespace(name=self.state)
+
+    def get_config_name(self):
+        return self.config_name
+
+    def set_config_name(self, name):
+        pass
+
+    def get_processing_load(self):
+        return self.load
+
+
+@pytest.fixture
+def fake_camilla(monkeypatch):
+    monkeypatch.setattr(camilla, "CamillaDSP", FakeCamilla)
+    monkeypatch.setattr(FakeCamilla, "open", 0)
+    return FakeCamilla
+
+
+@pytest.mark.parametrize("state", ["RUNNING", "PAUSED", "STALLED"])
+def test_probe_accepts_processing_states(fake_camilla, monkeypatch, state):
+    monkeypatch.setattr(fake_camilla, "state", state)
+
+    assert camilla.check_health("/profiles/cinema.yml").ok
+
+
+@pytest.mark.parametrize("state", ["STARTING", "INACTIVE"])
+def test_probe_rejects_other_states(fake_camilla, monkeypatch, state):
+    monkeypatch.setattr(fake_camilla, "state", state)
+
+    result = camilla.check_health("/profiles/cinema.yml")
+
+    assert not result.ok
+    assert result.reason == f"state {state}"
+
+
+@pytest.mark.parametrize("state", ["PAUSED", "STALLED"])
+def test_probe_rejects_wrong_config(fake_camilla, monkeypatch, state):
+    monkeypatch.setattr(fake_camilla, "state", state)
+
+    result = camilla.check_health("/profiles/music.yml")
+
+    assert not result.ok
+    assert result.reason == "running /profiles/cinema.yml"
+
+
+@pytest.mark.parametrize("state", ["PAUSED", "STALLED"])
+def test_probe_rejects_overload(fake_camilla, monkeypatch, state):
+    monkeypatch.setattr(fake_camilla, "state", state)
+    monkeypatch.setattr(fake_camilla, "load", 99.0)
+
+    result = camilla.check_health("/profiles/cinema.yml", max_load=90)
+
+    assert result.reason == "processing load 99%"
+
+
+def test_every_operation_closes_its_connection(fake_camilla, monkeypatch):
+    def refuse(self, raw):
+        raise OSError("refused")
+
+    monkeypatch.setattr(fake_camilla, "set_config_raw", refuse, raising=False)
+
+    camilla.check_health("/profiles/cinema.yml")
+    camilla.current_config_name()
+    with pytest.raises(camilla.ApplyError):
+        camilla.restore_config("/profiles/cinema.yml", "title: cinema\n")
+
+    assert fake_camilla.open == 0
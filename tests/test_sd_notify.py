@@ -0,0 +1,172 @@
+import os
+import socket
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from camilladsp_autoswitch.infrastructure.systemd.notify import SystemdNotifier
+from camilladsp_autoswitch.infrastructure.systemd.watchdog import LoopWatchdog
+from camilladsp_autoswitch.infrastructure.watchers.loop import EventLoop
+
+
+class FakeSystemd:
+    """
+    Stand-in for systemd's notify socket: records (time, message).
+    """
+
+    def __init__(self, address):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(address)
+        self.sock.settimeout(0.05)
+        self.messages = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._receive, daemon=True)
+        self._thread.start()
+
+    def _receive(self):
+        while not self._stop.is_set():
+            try:
+                data = self.sock.recv(4096)
+            except socket.timeout:
+                continue
+            self.messages.append((time.monotonic(), data.decode()))
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        self.sock.close()
+
+    def pings(self):
+        return [t for t, message in self.messages if message == "WATCHDOG=1"]
+
+    def would_restart(self, watchdog_sec, started, ended):
+        """True if some interval without ping exceeded WatchdogSec."""
+        marks = [started, *self.pings(), ended]
+        return any(b - a > watchdog_sec for a, b in zip(marks, marks[1:]))
+
+
+@pytest.fixture
+def systemd(tmp_path):
+    path = str(tmp_path / "notify.sock")
+    fake = FakeSystemd(path)
+    yield fake, path
+    fake.close()
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not predicate():
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_messages_reach_notify_socket(systemd):
+    fake, path = systemd
+    notifier = SystemdNotifier({"NOTIFY_SOCKET": path})
+
+    assert notifier.ready(status="Running\n(3 sources)")
+    assert notifier.status("cinema: applied")
+    assert notifier.stopping()
+    notifier.close()
+
+    assert wait_for(lambda: len(fake.messages) == 3)
+    assert [m for _, m in fake.messages] == [
+        "READY=1\nSTATUS=Running (3 sources)",
+        "STATUS=cinema: applied",
+        "STOPPING=1",
+    ]
+
+
+def test_abstract_socket_address():
+    name = f"cdsp-test-{os.getpid()}"
+    fake = FakeSystemd("\0" + name)
+    try:
+        assert SystemdNotifier({"NOTIFY_SOCKET": "@" + name}).ready()
+        assert wait_for(lambda: fake.messages)
+    finally:
+        fake.close()
+
+
+def test_without_systemd_everything_is_a_noop():
+    notifier = SystemdNotifier({})
+
+    assert not notifier.enabled
+    assert notifier.watchdog_interval is None
+    assert not notifier.ready()
+
+
+def test_watchdog_interval_from_environment(tmp_path):
+    env = {"NOTIFY_SOCKET": str(tmp_path / "x"), "WATCHDOG_USEC": "30000000"}
+    assert SystemdNotifier(env).watchdog_interval == 30.0
+
+    env["WATCHDOG_PID"] = str(os.getpid() + 1)  # meant for another process
+    assert SystemdNotifier(env).watchdog_interval is None
+
+
+def test_no_heartbeat_without_watchdog(tmp_path):
+    loop = MagicMock()
+    notifier = SystemdNotifier({"NOTIFY_SOCKET": str(tmp_path / "x")})
+    watchdog = LoopWatchdog(loop, notifier)
+    watchdog.start()
+
+    assert watchdog.period is None
+    loop.call_later.assert_not_called()
+    assert watchdog.stats()["watchdog_pings"] == 0
+
+    watchdog.stop()
+    notifier.close()
+
+
+def run_loop(path, watchdog_sec, schedule):
+    loop = EventLoop()
+    notifier = SystemdNotifier({
+        "NOTIFY_SOCKET": path,
+        "WATCHDOG_USEC": str(int(watchdog_sec * 1_000_000)),
+    })
+    watchdog = LoopWatchdog(loop, notifier)
+    watchdog.start()
+
+    schedule(loop)
+    started = time.monotonic()
+    loop.run()
+    ended = time.monotonic()
+
+    watchdog.stop()
+    loop.close()
+    notifier.close()
+    return watchdog, started, ended
+
+
+def test_healthy_loop_is_not_restarted(systemd):
+    fake, path = systemd
+
+    def schedule(loop):
+        for i in range(10):
+            loop.call_later(i * 0.05, lambda: None)  # normal short work
+        loop.call_later(0.8, loop.stop)
+
+    watchdog, started, ended = run_loop(path, 0.2, schedule)
+    time.sleep(0.1)
+
+    assert watchdog.pings >= 10
+    assert watchdog.skipped == 0
+    assert watchdog.lag_max < 0.05
+    assert not fake.would_restart(0.2, started, ended)
+
+
+def test_wedged_loop_is_restarted(systemd):
+    fake, path = systemd
+
+    def schedule(loop):
+        loop.call_later(0.1, lambda: time.sleep(0.5))  # stuck handler
+        loop.call_later(0.8, loop.stop)
+
+    watchdog, started, ended = run_loop(path, 0.2, schedule)
+    time.sleep(0.1)
+
+    assert fake.would_restart(0.2, started, ended)
+    assert watchdog.lag_max >= 0.4
+    assert watchdog.skipped >= 1
+    assert watchdog.stats()["loop_lag_max_seconds"] == watchdog.lag_max
@@ -0,0 +1,61 @@
+import importlib
+import json
+import os
+from unittest.mock import patch
+
+
+def reload_runtime_state(tmp_path):
+    os.environ["CDSP_STATE_DIR"] = str(tmp_path)
+    from camilladsp_autoswitch import runtime_state
+    importlib.reload(runtime_state)
+    return runtime_state
+
+
+def test_unchanged_state_is_not_reparsed(tmp_path):
+    runtime_state = reload_runtime_state(tmp_path)
+    runtime_state.update_state(mode="manual")
+
+    with patch.object(runtime_state.json, "loads") as loads:
+        state = runtime_state.load_state()
+
+    loads.assert_not_called()
+    assert state.mode == "manual"
+
+
+def test_external_change_is_detected(tmp_path):
+    runtime_state = reload_runtime_state(tmp_path)
+    runtime_state.update_state(profile="music")
+
+    # Another process publishes a new state file
+    other = tmp_path / "other.json"
+    other.write_text(json.dumps({"profile": "cinema", "variant": "night"}))
+    os.replace(other, tmp_path / "state.json")
+
+    state = runtime_state.load_state()
+
+    assert state.profile == "cinema"
+    assert state.variant == "night"
+
+
+def test_cached_state_cannot_be_mutated_by_callers(tmp_path):
+    runtime_state = reload_runtime_state(tmp_path)
+    runtime_state.update_state(mode="manual")
+
+    runtime_state.load_state().mode = "auto"
+
+    assert runtime_state.load_state().mode == "manual"
+
+
+def test_state_version_tracks_changes(tmp_path):
+    runtime_state = reload_runtime_state(tmp_path)
+
+    assert runtime_state.state_version() is None
+
+    runtime_state.update_state(mode="manual")
+    first = runtime_state.state_version()
+
+    assert runtime_state.state_version() == first
+
+    runtime_state.update_state(mode="auto")
+
+    assert runtime_state.state_version() != first
@@ -0,0 +1,97 @@
+import importlib
+import json
+import multiprocessing
+import os
+
+import pytest
+
+WRITERS = 4
+INCREMENTS = 25
+
+
+def reload_runtime_state(tmp_path):
+    os.environ["CDSP_STATE_DIR"] = str(tmp_path)
+    from camilladsp_autoswitch import runtime_state
+    importlib.reload(runtime_state)
+    return runtime_state
+
+
+def _increment(runtime_state, times):
+    for _ in range(times):
+        with runtime_state.state_transaction() as state:
+            state.status = str(int(state.status) + 1)
+
+
+def _read_until(state_file, stop, errors):
+    while not stop.is_set():
+        try:
+            raw = state_file.read_text()
+        except FileNotFoundError:
+            continue
+        try:
+            json.loads(raw)
+        except ValueError:
+            errors.put(raw)
+
+
+def test_transaction_writes_all_fields_at_once(tmp_path):
+    runtime_state = reload_runtime_state(tmp_path)
+
+    with runtime_state.state_transaction() as state:
+        state.mode = "manual"
+        state.profile = "cinema"
+        state.variant = "night"
+
+    saved = json.loads((tmp_path / "state.json").read_text())
+    assert (saved["mode"], saved["profile"], saved["variant"]) == (
+        "manual", "cinema", "night",
+    )
+
+
+def test_failed_transaction_writes_nothing(tmp_path):
+    runtime_state = reload_runtime_state(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        with runtime_state.state_transaction() as state:
+            state.mode = "manual"
+            raise RuntimeError("abort")
+
+    assert not (tmp_path / "state.json").exists()
+
+
+def test_no_temporary_files_left(tmp_path):
+    runtime_state = reload_runtime_state(tmp_path)
+
+    runtime_state.update_state(mode="manual")
+
+    assert sorted(os.listdir(tmp_path)) == ["state.json", "state.lock"]
+
+
+def test_parallel_writers_lose_no_updates(tmp_path):
+    runtime_state = reload_runtime_state(tmp_path)
+    runtime_state.update_state(status="0")
+
+    ctx = multiprocessing.get_context("fork")
+    stop = ctx.Event()
+    errors = ctx.Queue()
+
+    reader = ctx.Process(
+        target=_read_until,
+        args=(runtime_state.STATE_FILE, stop, errors),
+    )
+    writers = [
+        ctx.Process(target=_increment, args=(runtime_state, INCREMENTS))
+        for _ in range(WRITERS)
+    ]
+
+    reader.start()
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+    stop.set()
+    reader.join()
+
+    assert all(writer.exitcode == 0 for writer in writers)
+    assert errors.empty(), "reader observed a partial state file"
+    assert runtime_state.load_state().status == str(WRITERS * INCREMENTS)
@@ -0,0 +1,123 @@
+import importlib
+import os
+import time
+
+import pytest
+
+from camilladsp_autoswitch.application.handlers.runtime_state_handler import (
+    RuntimeStateHandler,
+)
+from camilladsp_autoswitch.domain.events import (
+    Event,
+    ExperimentalYamlChanged,
+    MediaActivityChanged,
+    ModeChanged,
+    ProfileForced,
+)
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.infrastructure.runtime_state import CDSPState
+from camilladsp_autoswitch.infrastructure.watchers.inotify import inotify_available
+from camilladsp_autoswitch.infrastructure.watchers.state_watcher import (
+    StateWatcher,
+    diff_states,
+)
+from camilladsp_autoswitch.intent import SwitchIntent
+
+
+def reload_runtime_state(tmp_path):
+    os.environ["CDSP_STATE_DIR"] = str(tmp_path)
+    from camilladsp_autoswitch import runtime_state
+    importlib.reload(runtime_state)
+    return runtime_state
+
+
+def test_diff_states_emits_typed_events():
+    old = CDSPState()
+    new = CDSPState(mode="manual", profile="cinema", experimental_yml="/tmp/x.yml")
+
+    events = diff_states(old, new)
+
+    assert events == [
+        ModeChanged(mode="manual", previous="auto"),
+        ProfileForced(profile="cinema", variant="normal"),
+        ExperimentalYamlChanged(path="/tmp/x.yml"),
+    ]
+
+
+def test_diff_of_identical_states_is_empty():
+    assert diff_states(CDSPState(), CDSPState()) == []
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify not available")
+def test_cli_update_is_pushed_to_bus(tmp_path):
+    runtime_state = reload_runtime_state(tmp_path)
+    bus = EventBus()
+    received = []
+    bus.subscribe(Event, received.append)
+
+    watcher = StateWatcher(bus, state_dir=tmp_path)
+    watcher.start()
+    try:
+        runtime_state.update_state(mode="manual")
+        deadline = time.monotonic() + 2
+        while not received and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+
+    assert received == [ModeChanged(mode="manual", previous="auto")]
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify not available")
+def test_unrelated_files_are_ignored(tmp_path):
+    reload_runtime_state(tmp_path)
+    bus = EventBus()
+    received = []
+    bus.subscribe(Event, received.append)
+    watcher = StateWatcher(bus, state_dir=tmp_path)
+
+    (tmp_path / "other.json").write_text("{}")
+    watcher.on_readable()
+    watcher.close()
+
+    assert received == []
+
+
+def collect_intents(bus):
+    intents = []
+    bus.subscribe(SwitchIntent, intents.append)
+    return intents
+
+
+def test_forced_profile_switches_in_manual_mode():
+    bus = EventBus()
+    RuntimeStateHandler(bus, mode="manual", profile="music", variant=None)
+    intents = collect_intents(bus)
+
+    bus.publish(ProfileForced(profile="cinema", variant="night"))
+
+    assert intents == [
+        SwitchIntent(profile="cinema", variant="night", reason="manual_profile"),
+    ]
+
+
+def test_forced_profile_is_ignored_in_auto_mode():
+    bus = EventBus()
+    RuntimeStateHandler(bus, mode="auto")
+    intents = collect_intents(bus)
+
+    bus.publish(ProfileForced(profile="cinema", variant=None))
+
+    assert intents == []
+
+
+def test_back_to_auto_replays_last_media_activity():
+    bus = EventBus()
+    RuntimeStateHandler(bus, mode="manual")
+    bus.publish(MediaActivityChanged(active=True))
+    media = []
+    bus.subscribe(MediaActivityChanged, media.append)
+
+    bus.publish(ModeChanged(mode="auto", previous="manual"))
+
+    assert media == [MediaActivityChanged(active=True)]
@@ -0,0 +1,108 @@
+import struct
+from types import SimpleNamespace
+
+import pytest
+
+from camilladsp_autoswitch.domain.events import IntentExecuted, ModeChanged
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.infrastructure.control import status_segment
+from camilladsp_autoswitch.infrastructure.control.status_publisher import StatusPublisher
+from camilladsp_autoswitch.infrastructure.control.status_segment import (
+    StatusReader,
+    StatusSegment,
+    StatusSegmentError,
+    read_status,
+)
+from camilladsp_autoswitch.interface import cli
+
+
+@pytest.fixture
+def segment(tmp_path):
+    segment = StatusSegment(tmp_path / "status")
+    yield segment
+    segment.close()
+
+
+def test_reader_sees_writer_updates(segment):
+    reader = StatusReader(segment.path)
+    try:
+        segment.update(mode="auto", profile="music", variant=None)
+        first = reader.read()
+
+        segment.update(profile="cinema", variant="night", outcome="applied",
+                       yaml="/p/cinema.night.yml", latency=0.012, switched=True)
+        second = reader.read()
+    finally:
+        reader.close()
+
+    assert (first.mode, first.profile, first.variant) == ("auto", "music", None)
+    assert first.switch_count == 0
+    assert first.last_switch is None
+
+    assert (second.profile, second.variant) == ("cinema", "night")
+    assert second.switch_count == 1
+    assert second.last_apply_latency == pytest.approx(0.012)
+    assert second.last_yaml == "/p/cinema.night.yml"
+    assert second.last_switch is not None
+    assert second.sequence > first.sequence
+    assert second.sequence % 2 == 0
+
+
+def test_publisher_mirrors_bus_events(segment):
+    bus = EventBus()
+    StatusPublisher(bus, segment, mode="auto", profile="music", variant=None)
+
+    bus.publish(IntentExecuted(profile="cinema", variant=None, yaml="/p/cinema.yml",
+                               outcome="applied", latency=0.5))
+    bus.publish(IntentExecuted(profile="broken", variant=None, yaml="/p/broken.yml",
+                               outcome="invalid", reason="bad"))
+    bus.publish(ModeChanged(mode="manual", previous="auto"))
+
+    status = read_status(segment.path)
+
+    assert status.mode == "manual"
+    assert status.profile == "cinema"  # invalid switch did not change it
+    assert status.switch_count == 1
+    assert status.last_outcome == "invalid"
+
+
+def test_long_values_are_truncated_on_character_boundary(segment):
+    segment.update(profile="é" * 100, variant=None)
+
+    assert read_status(segment.path).profile == "é" * 32
+
+
+def test_stalled_writer_is_reported(segment, monkeypatch):
+    monkeypatch.setattr(status_segment, "MAX_READ_ATTEMPTS", 3)
+    struct.pack_into("<I", segment._map, status_segment._SEQ_OFFSET, 7)
+
+    with pytest.raises(StatusSegmentError, match="busy"):
+        read_status(segment.path)
+
+
+def test_missing_or_foreign_segment(tmp_path):
+    assert read_status(tmp_path / "missing") is None
+
+    foreign = tmp_path / "foreign"
+    foreign.write_bytes(b"\0" * status_segment.SEGMENT_SIZE)
+    assert read_status(foreign) is None
+
+
+def test_close_removes_segment(tmp_path):
+    segment = StatusSegment(tmp_path / "status")
+    segment.close()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cdspctl_status_fast(segment, monkeypatch, capsys):
+    monkeypatch.setenv("CDSP_STATUS_SEGMENT", str(segment.path))
+    segment.update(mode="auto", profile="cinema", variant="night", outcome="applied",
+                   yaml="/p/cinema.night.yml", latency=0.002, switched=True)
+
+    cli.cmd_status(SimpleNamespace(fast=True))
+
+    out = capsys.readouterr().out
+    assert "profile         : cinema" in out
+    assert "switches        : 1" in out
+    assert "apply latency   : 2.0 ms" in out
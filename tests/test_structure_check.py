@@ -0,0 +1,105 @@
+from unittest.mock import patch
+
+import pytest
+
+from camilladsp_autoswitch.registry.errors import InvalidYamlError
+from camilladsp_autoswitch.validators.camilladsp_validator import (
+    CamillaDSPBinaryValidator,
+)
+from camilladsp_autoswitch.validators.structure import check_structure
+
+
+def valid_config():
+    return {
+        "devices": {
+            "samplerate": 48000,
+            "chunksize": 1024,
+            "capture": {"type": "Alsa", "channels": 2, "device": "hw:Loopback,1"},
+            "playback": {"type": "Alsa", "channels": 2, "device": "hw:0"},
+        },
+        "filters": {
+            "bass": {"type": "Biquad", "parameters": {"type": "Lowshelf"}},
+        },
+        "mixers": {
+            "mono": {
+                "channels": {"in": 2, "out": 2},
+                "mapping": [
+                    {"dest": 0, "sources": [{"channel": 0}, {"channel": 1}]},
+                ],
+            },
+        },
+        "pipeline": [
+            {"type": "Mixer", "name": "mono"},
+            {"type": "Filter", "channel": 0, "names": ["bass"]},
+        ],
+    }
+
+
+def test_valid_config_has_no_issues():
+    assert check_structure(valid_config()) == []
+
+
+def test_missing_devices():
+    config = valid_config()
+    del config["devices"]
+
+    assert "Missing 'devices' section" in check_structure(config)
+
+
+def test_unknown_filter_type():
+    config = valid_config()
+    config["filters"]["bass"]["type"] = "Biquadd"
+
+    assert check_structure(config) == ["filter 'bass' has unknown type 'Biquadd'"]
+
+
+def test_pipeline_references_unknown_filter_and_mixer():
+    config = valid_config()
+    config["pipeline"] = [
+        {"type": "Mixer", "name": "stereo"},
+        {"type": "Filter", "channel": 0, "names": ["bass", "treble"]},
+    ]
+
+    issues = check_structure(config)
+
+    assert "pipeline step 0 references unknown mixer 'stereo'" in issues
+    assert "pipeline step 1 references unknown filter 'treble'" in issues
+
+
+def test_mixer_channel_out_of_range():
+    config = valid_config()
+    config["mixers"]["mono"]["mapping"][0]["dest"] = 2
+
+    assert check_structure(config) == ["mixer 'mono' dest channel 2 out of range"]
+
+
+def test_non_mapping_config():
+    assert check_structure(["devices"]) == ["Configuration must be a mapping"]
+
+
+@patch("subprocess.run")
+def test_binary_not_spawned_when_precheck_fails(mock_run, tmp_path):
+    path = tmp_path / "broken.yml"
+    path.write_text("pipeline: []\n")
+
+    with pytest.raises(InvalidYamlError, match="structural checks"):
+        CamillaDSPBinaryValidator().validate(path)
+
+    mock_run.assert_not_called()
+
+
+@patch("subprocess.run")
+def test_binary_spawned_when_precheck_passes(mock_run, tmp_path):
+    path = tmp_path / "good.yml"
+    path.write_text(
+        "devices:\n"
+        "  samplerate: 48000\n"
+        "  chunksize: 1024\n"
+        "  capture: {type: Stdin, channels: 2, format: S16LE}\n"
+        "  playback: {type: Stdout, channels: 2, format: S16LE}\n"
+    )
+    mock_run.return_value.returncode = 0
+
+    CamillaDSPBinaryValidator().validate(path)
+
+    mock_run.assert_called_once()
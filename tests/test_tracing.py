@@ -0,0 +1,169 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from camilladsp_autoswitch.application.handlers.intent_executor_handler import IntentExecutorHandler
+from camilladsp_autoswitch.application.handlers.intent_handler import IntentHandler
+from camilladsp_autoswitch.application.handlers.media_policy_handler import MediaPolicyHandler
+from camilladsp_autoswitch.application.handlers.runtime_state_handler import RuntimeStateHandler
+from camilladsp_autoswitch.domain.events import (
+    IntentExecuted,
+    MediaActivityChanged,
+    ModeChanged,
+    PolicyDecision,
+)
+from camilladsp_autoswitch.domain.mapping import MediaMapping, ProfileSelection
+from camilladsp_autoswitch.domain import tracing
+from camilladsp_autoswitch.domain.tracing import follow, new_trace
+from camilladsp_autoswitch.event_bus import EventBus
+from camilladsp_autoswitch.infrastructure.control.server import ControlServer
+from camilladsp_autoswitch.infrastructure.eventing.event_store import EventStore
+from camilladsp_autoswitch.infrastructure.eventing.event_store_subscriber import EventStoreSubscriber
+from camilladsp_autoswitch.infrastructure.eventing.trace_buffer import TraceBuffer
+from camilladsp_autoswitch.intent import SwitchIntent
+
+
+@pytest.fixture(autouse=True)
+def traced():
+    tracing.enable()
+    yield
+    tracing.enable(False)
+
+
+def _pipeline():
+    bus = EventBus()
+    traces = TraceBuffer(bus)
+    MediaPolicyHandler(
+        bus,
+        mapping=MediaMapping(
+            on=ProfileSelection(profile="cinema", variant=None),
+            off=ProfileSelection(profile="music", variant=None),
+        ),
+    )
+    IntentHandler(bus)
+    IntentExecutorHandler(
+        bus,
+        resolve_yaml=lambda intent: f"/profiles/{intent.profile}.yml",
+        validate=lambda path: SimpleNamespace(valid=True, reason=None),
+        apply=MagicMock(),
+    )
+    return bus, traces
+
+
+def test_trace_is_not_part_of_event_equality():
+    assert PolicyDecision("music", None, "x") == PolicyDecision("music", None, "x", trace=new_trace())
+    assert "trace" not in repr(PolicyDecision("music", None, "x"))
+
+
+def test_follow_keeps_trace_id_and_root_time():
+    root = new_trace()
+    child = follow(root)
+
+    assert child.trace_id == root.trace_id
+    assert child.started == root.started
+    assert child.at >= root.at
+
+
+def test_switch_is_traced_from_detector_to_apply():
+    bus, traces = _pipeline()
+    seen = []
+    bus.subscribe(object, seen.append)
+
+    root = MediaActivityChanged(active=True)
+    bus.publish(root)
+
+    assert {event.trace.trace_id for event in seen} == {root.trace.trace_id}
+
+    (trace,) = traces.traces()
+    names = [span["name"] for span in trace["spans"]]
+    assert trace["root"] == "MediaActivityChanged"
+    assert names == [
+        "MediaActivityChanged",
+        "PolicyDecision",
+        "SwitchIntent",
+        "resolve",
+        "validate",
+        "apply",
+        "IntentExecuted",
+    ]
+    offsets = [span["offset_ms"] for span in trace["spans"]]
+    assert offsets == sorted(offsets)
+
+
+def test_cli_state_change_starts_its_own_trace():
+    bus, traces = _pipeline()
+    RuntimeStateHandler(bus, mode="manual", profile="music")
+    intents = []
+    bus.subscribe(SwitchIntent, intents.append)
+
+    bus.publish(MediaActivityChanged(active=True))
+    command = ModeChanged(mode="manual", previous="auto")
+    bus.publish(command)
+
+    assert intents[-1].trace.trace_id == command.trace.trace_id
+    assert [trace["root"] for trace in traces.traces()] == ["MediaActivityChanged", "ModeChanged"]
+    assert len(traces.traces(limit=1)) == 1
+
+
+def test_buffer_is_bounded():
+    bus = EventBus()
+    traces = TraceBuffer(bus, max_spans=3)
+
+    for _ in range(10):
+        bus.publish(IntentExecuted(profile="music", variant=None, yaml="/m.yml",
+                                   outcome="unchanged", stages=(("resolve", 0.0, 0.0),)))
+
+    assert len(traces) == 3
+
+
+def test_control_server_dumps_traces(tmp_path):
+    bus, traces = _pipeline()
+    bus.publish(MediaActivityChanged(active=False))
+
+    server = ControlServer(bus, tracker=MagicMock(), path=tmp_path / "control.sock", traces=traces)
+    try:
+        response = server.dispatch({"cmd": "trace", "args": {"limit": 1}})
+    finally:
+        server.close()
+
+    assert response["ok"]
+    assert response["result"]["traces"][0]["root"] == "MediaActivityChanged"
+
+
+def test_untraced_events_are_interned():
+    tracing.enable(False)
+    bus = EventBus()
+    decisions = []
+    bus.subscribe(PolicyDecision, decisions.append)
+    MediaPolicyHandler(
+        bus,
+        mapping=MediaMapping(
+            on=ProfileSelection(profile="cinema", variant=None),
+            off=ProfileSelection(profile="music", variant=None),
+        ),
+    )
+
+    bus.publish(MediaActivityChanged(active=True))
+    bus.publish(MediaActivityChanged(active=True))
+
+    assert decisions[0] is decisions[1]
+    assert decisions[0].trace is None
+
+
+def test_event_store_retains_untraced_shared_events():
+    bus, traces = _pipeline()
+    store = EventStore()
+    EventStoreSubscriber(bus, store)
+
+    for _ in range(3):
+        bus.publish(MediaActivityChanged(active=True))
+        bus.publish(MediaActivityChanged(active=False))
+
+    decisions = [event for event in store.all() if isinstance(event, PolicyDecision)]
+    assert len(decisions) == 6
+    assert all(event.trace is None for event in store.all())
+    assert len({id(event) for event in decisions}) == 2
+
+    # The spans are still recorded
+    assert len(traces.traces()) == 6
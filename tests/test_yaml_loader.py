@@ -0,0 +1,68 @@
+import pytest
+import yaml
+
+from camilladsp_autoswitch import yaml_loader
+from camilladsp_autoswitch.yaml_loader import YamlDocumentCache
+
+
+def test_safe_load_uses_libyaml_when_available():
+    if hasattr(yaml, "CSafeLoader"):
+        assert yaml_loader.SafeLoader is yaml.CSafeLoader
+        assert yaml_loader.HAS_LIBYAML is True
+    else:
+        assert yaml_loader.SafeLoader is yaml.SafeLoader
+
+
+def test_safe_load_rejects_unsafe_tags():
+    with pytest.raises(yaml_loader.YAMLError):
+        yaml_loader.safe_load("!!python/object/apply:os.system ['true']")
+
+
+def test_file_is_parsed_once_while_unchanged(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text("devices:\n  samplerate: 48000\n")
+    cache = YamlDocumentCache()
+
+    first = cache.load(path)
+    second = cache.load(path)
+
+    assert first == {"devices": {"samplerate": 48000}}
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_file_is_reparsed(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text("a: 1\n")
+    cache = YamlDocumentCache()
+    cache.load(path)
+
+    path.write_text("a: 22\n")
+
+    assert cache.load(path) == {"a": 22}
+
+
+def test_parse_errors_are_not_cached(tmp_path):
+    path = tmp_path / "bad.yml"
+    path.write_text("this: [ is: not: valid")
+    cache = YamlDocumentCache()
+
+    for _ in range(2):
+        with pytest.raises(yaml_loader.YAMLError):
+            cache.load(path)
+
+    assert cache.misses == 2
+
+
+def test_cache_is_bounded(tmp_path):
+    cache = YamlDocumentCache(maxsize=2)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"p{i}.yml"
+        path.write_text(f"v: {i}\n")
+        paths.append(path)
+        cache.load(path)
+
+    cache.load(paths[0])
+
+    assert cache.misses == 4